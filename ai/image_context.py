@@ -0,0 +1,132 @@
+"""
+Image context - one decoded image shared by layout analysis, table detection and OCR
+"""
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image, ImageOps
+
+# EXIF tag holding the camera orientation
+EXIF_ORIENTATION = 0x0112
+
+
+class ImageContext:
+    """
+    An image file decoded once for a whole conversion
+    
+    The PIL image is what OCR reads (pixels as stored in the file). The
+    grayscale array is what the OpenCV stages work on; it is derived the
+    way cv2.imread + cvtColor(BGR2GRAY) would (EXIF orientation applied,
+    alpha dropped, same luma weights), but only once and only if a stage
+    asks for it.
+    """
+    
+    def __init__(self, image: Image.Image, path: Optional[str] = None):
+        """
+        Wrap a decoded image
+        
+        Args:
+            image: PIL image (pixels already loaded)
+            path: File the image was read from, if any (for names and logs)
+        """
+        self.image = image
+        self.path = path
+        self._gray: Optional[np.ndarray] = None
+    
+    def __repr__(self) -> str:
+        return f"ImageContext({self.name!r})"
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ImageContext':
+        """
+        Decode an image file
+        
+        Args:
+            path: Path to image file
+        
+        Returns:
+            ImageContext
+        """
+        image = Image.open(path)
+        image.load()
+        return cls(image, str(path))
+    
+    @classmethod
+    def from_array(cls, pixels: np.ndarray) -> 'ImageContext':
+        """
+        Wrap pixels produced by an OpenCV stage, without encoding them
+        
+        Args:
+            pixels: Grayscale (2-D) or BGR (3-channel) uint8 array
+        
+        Returns:
+            ImageContext
+        """
+        if pixels.ndim == 2:
+            context = cls(Image.fromarray(pixels))
+            gray = pixels.view()
+            gray.flags.writeable = False
+            context._gray = gray
+            return context
+        return cls(Image.fromarray(cv2.cvtColor(pixels, cv2.COLOR_BGR2RGB)))
+    
+    @classmethod
+    def of(cls, source: 'ImageSource') -> 'ImageContext':
+        """
+        Get the context of an image path, pixel array or context
+        
+        Args:
+            source: Image path, OpenCV pixel array, or an ImageContext (returned as is)
+        
+        Returns:
+            ImageContext
+        """
+        if isinstance(source, cls):
+            return source
+        if isinstance(source, np.ndarray):
+            return cls.from_array(source)
+        return cls.load(source)
+    
+    @property
+    def name(self) -> str:
+        """File name for logs"""
+        return self.path or '<in-memory image>'
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(width, height) of the PIL image"""
+        return self.image.size
+    
+    @property
+    def dpi(self):
+        """Resolution stored in the file, if any"""
+        return self.image.info.get('dpi')
+    
+    @property
+    def gray(self) -> np.ndarray:
+        """
+        Grayscale pixels for OpenCV (computed on first use, then shared)
+        
+        Callers must not modify the array in place.
+        """
+        if self._gray is None:
+            image = self.image
+            if image.getexif().get(EXIF_ORIENTATION, 1) != 1:
+                image = ImageOps.exif_transpose(image)
+            
+            if image.mode == 'L':
+                gray = np.asarray(image)
+            else:
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+            
+            gray.flags.writeable = False
+            self._gray = gray
+        return self._gray
+
+
+# Anything the image stages accept: a file path or an already decoded image
+ImageSource = Union[str, Path, np.ndarray, ImageContext]
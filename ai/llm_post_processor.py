@@ -8,10 +8,11 @@ Supports multiple free LLM providers:
 import os
 import re
 import json
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Iterable, Iterator
 from abc import ABC, abstractmethod
 
 from utils.logger import logger
+from utils.ocr_text import strip_ocr_noise
 
 
 class BaseLLMProvider(ABC):
@@ -309,39 +310,7 @@ Output ONLY the restructured Markdown, no explanations.""",
     
     def _pre_clean_ocr_text(self, text: str) -> str:
         """Pre-clean OCR text before sending to LLM to reduce token count"""
-        # Remove page markers
-        text = re.sub(r'===\s*Page\s*\d+\s*===', '', text)
-        
-        # Remove common header/footer patterns
-        noise_patterns = [
-            r'November\s+\d+,\s+\d+.*?(?=\n|$)',  # Date headers
-            r'Seite\s+\d+',  # German page numbers
-            r'H\s*L\s*R\s*\|?\s*[sS]',  # HLR markers
-            r'SSS+',  # SSS markers
-            r'^\s*24\s*$',  # Standalone "24"
-            r'\d{1,2}/\d{1,2}/\d{4}',  # Date patterns
-            r'Solving the 2d Poisson Equation using the FEM and a CG Method',  # Repeated title
-        ]
-        
-        for pattern in noise_patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE | re.IGNORECASE)
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\n{4,}', '\n\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        
-        # Remove lines that are mostly noise (short lines with random chars)
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            stripped = line.strip()
-            # Keep lines that have meaningful content
-            if len(stripped) > 3 or stripped == '':
-                # Skip lines that look like pure noise
-                if not re.match(r'^[\|\-=~\s]+$', stripped):
-                    cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+        return strip_ocr_noise(text)
     
     def process_math_document(self, text: str) -> Tuple[str, Dict]:
         """
@@ -382,6 +351,42 @@ Output ONLY the restructured Markdown, no explanations.""",
             'chunks': len(chunks)
         }
     
+    def process_math_pages(self, pages: Iterable[str], stats: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Process a mathematical/academic document page by page
+        
+        Streaming variant of process_math_document: pages are pre-cleaned as
+        they arrive and each chunk is sent to the LLM as soon as it is full,
+        so only one chunk of text is held in memory.
+        
+        Args:
+            pages: Raw OCR text of each page
+            stats: Optional dict that receives 'provider', 'processed' and 'chunks'
+            
+        Yields:
+            Processed chunks (the document is '\n\n'.join of them)
+        """
+        stats = stats if stats is not None else {}
+        stats.update({'provider': self.provider_name if self.active_provider else None,
+                      'processed': bool(self.active_provider), 'chunks': 0})
+        
+        if not self.active_provider:
+            logger.warning("No LLM provider available, returning original text")
+            yield from pages
+            return
+        
+        logger.info(f"Processing document with {self.provider_name}")
+        paragraphs = (
+            para
+            for page in pages
+            for para in self._pre_clean_ocr_text(page).split('\n\n')
+        )
+        for chunk in self._iter_chunks(paragraphs, max_chars=6000):
+            stats['chunks'] += 1
+            logger.info(f"Processing chunk {stats['chunks']}")
+            processed = self.active_provider.process(chunk, self.PROMPTS['math_latex'])
+            yield self._post_clean(processed)
+    
     def _post_clean(self, text: str) -> str:
         """Post-clean LLM output"""
         # Remove any remaining page markers the LLM might have kept
@@ -411,18 +416,19 @@ Output ONLY the restructured Markdown, no explanations.""",
         if len(text) <= max_chars:
             return [text]
         
-        chunks = []
+        # Split by double newlines (paragraphs)
+        return list(self._iter_chunks(text.split('\n\n'), max_chars))
+    
+    def _iter_chunks(self, paragraphs: Iterable[str], max_chars: int = 6000) -> Iterator[str]:
+        """Group paragraphs into chunks of at most max_chars (longer paragraphs stay whole)"""
         current_chunk = []
         current_length = 0
         
-        # Split by double newlines (paragraphs)
-        paragraphs = text.split('\n\n')
-        
         for para in paragraphs:
             para_length = len(para)
             
             if current_length + para_length > max_chars and current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
+                yield '\n\n'.join(current_chunk)
                 current_chunk = [para]
                 current_length = para_length
             else:
@@ -430,9 +436,7 @@ Output ONLY the restructured Markdown, no explanations.""",
                 current_length += para_length
         
         if current_chunk:
-            chunks.append('\n\n'.join(current_chunk))
-        
-        return chunks
+            yield '\n\n'.join(current_chunk)
 
 
 def setup_llm_provider(config: Dict = None) -> LLMPostProcessor:
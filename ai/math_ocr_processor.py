@@ -7,6 +7,7 @@ from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 from utils.logger import logger
+from utils.ocr_text import normalize_whitespace
 
 
 class MathOCRProcessor:
@@ -327,17 +328,7 @@ class MathOCRProcessor:
     
     def _clean_whitespace(self, text: str) -> str:
         """Clean up whitespace issues"""
-        # Multiple spaces to single
-        text = re.sub(r' {2,}', ' ', text)
-        
-        # Multiple newlines to double
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # Trim lines
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-        
-        return text
+        return normalize_whitespace(text)
     
     def _final_cleanup(self, text: str) -> str:
         """Final cleanup pass"""
@@ -453,13 +444,13 @@ class AdvancedMathOCR:
                 dpi: OCR resolution (default: 300)
                 lang: OCR language (default: 'eng')
                 enhance_math: Enable math enhancement (default: True)
+                workers: OCR worker processes (default: OCR_WORKERS)
                 
         Returns:
             Tuple of (markdown_content, metadata)
         """
         import fitz
-        import pytesseract
-        from PIL import Image
+        from ai.ocr_pool import OCRPool
         
         dpi = options.get('dpi', 300)
         lang = options.get('lang', 'eng')
@@ -470,29 +461,23 @@ class AdvancedMathOCR:
         doc = fitz.open(pdf_path)
         metadata = doc.metadata or {}
         title = metadata.get('title', '') or Path(pdf_path).stem.replace('_', ' ')
+        num_pages = len(doc)
+        doc.close()
         
         all_text = []
         
         # Calculate DPI multiplier (72 DPI is default for PDF)
         dpi_multiplier = dpi / 72
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            
-            # High-resolution rendering
-            matrix = fitz.Matrix(dpi_multiplier, dpi_multiplier)
-            pix = page.get_pixmap(matrix=matrix)
-            
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            
-            # OCR with optimized settings
-            custom_config = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
-            text = pytesseract.image_to_string(img, lang=lang, config=custom_config)
-            
-            all_text.append(f"## Page {page_num + 1}\n\n{text}")
-        
-        doc.close()
+        # High-resolution OCR with optimized settings, pages run in the worker pool
+        custom_config = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
+        with OCRPool(options.get('workers')) as pool:
+            for page_result in pool.ocr_pages(pdf_path, range(num_pages), zoom=dpi_multiplier,
+                                              lang=lang, config=custom_config):
+                if page_result['error']:
+                    raise RuntimeError(f"Page {page_result['page'] + 1}: OCR failed - {page_result['error']}")
+                
+                all_text.append(f"## Page {page_result['page'] + 1}\n\n{page_result['text']}")
         
         # Combine all pages
         raw_text = '\n\n---\n\n'.join(all_text)
@@ -511,7 +496,7 @@ class AdvancedMathOCR:
         
         return processed_text, {
             'title': title,
-            'pages': len(doc) if 'doc' in dir() else 0,
+            'pages': num_pages,
             'method': 'advanced_math_ocr',
             'dpi': dpi,
             'lang': lang,
@@ -0,0 +1,288 @@
+"""
+OCR backends - pluggable Tesseract engines
+
+Supports:
+- tesserocr: Tesseract C API bindings, engines stay loaded between calls (fast)
+- pytesseract: runs the tesseract executable once per image (always works)
+"""
+import os
+import shlex
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional, Tuple, List
+
+from ai.ocr_result import OCRResult
+from utils.logger import logger
+from config import OCR_BACKEND
+
+
+def parse_tesseract_config(config: str) -> Tuple[Optional[int], Optional[int], Tuple[Tuple[str, str], ...]]:
+    """
+    Parse a pytesseract style config string
+    
+    Args:
+        config: e.g. "--oem 3 --psm 6 -c preserve_interword_spaces=1"
+    
+    Returns:
+        Tuple of (psm, oem, variables)
+    """
+    psm = oem = None
+    variables = []
+    tokens = shlex.split(config or '')
+    
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        value = tokens[i + 1] if i + 1 < len(tokens) else None
+        if token == '--psm' and value is not None:
+            psm = int(value)
+            i += 1
+        elif token == '--oem' and value is not None:
+            oem = int(value)
+            i += 1
+        elif token == '--dpi' and value is not None:
+            variables.append(('user_defined_dpi', value))
+            i += 1
+        elif token == '-c' and value is not None and '=' in value:
+            key, _, val = value.partition('=')
+            variables.append((key, val))
+            i += 1
+        elif token.startswith('-c') and '=' in token:
+            key, _, val = token[2:].partition('=')
+            variables.append((key, val))
+        i += 1
+    
+    return psm, oem, tuple(sorted(variables))
+
+
+class BaseOCRBackend(ABC):
+    """Base class for OCR backends"""
+    
+    name = 'base'
+    
+    @abstractmethod
+    def is_available(self) -> bool:
+        """Check if the backend can run"""
+        pass
+    
+    @abstractmethod
+    def image_to_tsv(self, image, lang: str = 'eng', config: str = '') -> str:
+        """Run OCR and return Tesseract TSV output"""
+        pass
+    
+    def supports_language(self, lang: str) -> bool:
+        """Check if the language data for lang (e.g. 'tur+eng') is installed"""
+        return True
+    
+    def ocr(self, image, lang: str = 'eng', config: str = '') -> OCRResult:
+        """
+        Run OCR on an image
+        
+        Args:
+            image: PIL Image
+            lang: Tesseract language(s)
+            config: Tesseract command line style configuration
+        
+        Returns:
+            OCRResult with text, confidences and word boxes
+        """
+        config = config or ''
+        tsv = self.image_to_tsv(image, lang=lang, config=config)
+        return OCRResult.from_tsv(tsv, preserve_spaces='preserve_interword_spaces=1' in config)
+
+
+class PytesseractBackend(BaseOCRBackend):
+    """
+    pytesseract backend
+    
+    Every call starts a tesseract process, which writes the image to a temp
+    file and loads the language data again.
+    """
+    
+    name = 'pytesseract'
+    
+    def is_available(self) -> bool:
+        try:
+            import pytesseract
+            pytesseract.get_tesseract_version()
+            return True
+        except Exception:
+            return False
+    
+    def image_to_tsv(self, image, lang: str = 'eng', config: str = '') -> str:
+        import pytesseract
+        return pytesseract.image_to_data(image, lang=lang, config=config)
+
+
+class TesserocrBackend(BaseOCRBackend):
+    """
+    tesserocr backend (Tesseract C API)
+    
+    Keeps one initialized engine per language/PSM/OEM/variables combination,
+    so the language data is loaded once per process instead of once per image.
+    """
+    
+    name = 'tesserocr'
+    
+    def __init__(self, tessdata_path: Optional[str] = None):
+        """
+        Initialize backend
+        
+        Args:
+            tessdata_path: Directory containing *.traineddata files
+                           (default: auto-detect)
+        """
+        self.tessdata_path = tessdata_path
+        self._engines: Dict[Tuple, object] = {}
+        self._locks: Dict[Tuple, threading.Lock] = {}
+        self._engines_lock = threading.Lock()
+        self._languages: Optional[List[str]] = None
+    
+    def _find_tessdata(self) -> Optional[str]:
+        """Locate the tessdata directory"""
+        import tesserocr
+        
+        candidates = []
+        if self.tessdata_path:
+            candidates.append(self.tessdata_path)
+        if os.getenv('TESSDATA_PREFIX'):
+            candidates.append(os.getenv('TESSDATA_PREFIX'))
+        
+        # Next to a configured tesseract executable (Windows installs)
+        try:
+            import pytesseract
+            cmd = pytesseract.pytesseract.tesseract_cmd
+            if cmd and os.path.isabs(cmd):
+                candidates.append(str(Path(cmd).parent / 'tessdata'))
+        except ImportError:
+            pass
+        
+        # pip installed language packs and common system locations
+        candidates.extend([
+            os.path.join(sys.prefix, 'share', 'tessdata'),
+            '/usr/share/tesseract-ocr/5/tessdata',
+            '/usr/share/tesseract-ocr/4.00/tessdata',
+            '/usr/share/tessdata',
+            '/usr/local/share/tessdata',
+        ])
+        
+        for path in candidates:
+            if path and Path(path).is_dir() and any(Path(path).glob('*.traineddata')):
+                return str(Path(path)) + os.sep
+        
+        # Fall back to the library's compiled-in default
+        path, languages = tesserocr.get_languages()
+        return path if languages else None
+    
+    def is_available(self) -> bool:
+        try:
+            import tesserocr  # noqa: F401
+        except ImportError:
+            return False
+        
+        try:
+            if self.tessdata_path is None:
+                self.tessdata_path = self._find_tessdata()
+            return self.tessdata_path is not None
+        except Exception as e:
+            logger.debug(f"tesserocr not usable: {e}")
+            return False
+    
+    def supports_language(self, lang: str) -> bool:
+        if self._languages is None:
+            import tesserocr
+            self._languages = tesserocr.get_languages(self.tessdata_path)[1] if self.is_available() else []
+        return all(part in self._languages for part in lang.split('+') if part)
+    
+    def _get_engine(self, lang: str, config: str):
+        """Get (or create) a warm engine for a language/config combination"""
+        import tesserocr
+        
+        psm, oem, variables = parse_tesseract_config(config)
+        key = (lang, psm, oem, variables)
+        
+        with self._engines_lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                kwargs = {'path': self.tessdata_path, 'lang': lang}
+                if psm is not None:
+                    kwargs['psm'] = psm
+                if oem is not None:
+                    kwargs['oem'] = oem
+                engine = tesserocr.PyTessBaseAPI(**kwargs)
+                for name, value in variables:
+                    engine.SetVariable(name, value)
+                
+                logger.debug(f"Initialized tesserocr engine: lang={lang}, psm={psm}, oem={oem}")
+                self._engines[key] = engine
+                self._locks[key] = threading.Lock()
+        
+        return engine, self._locks[key]
+    
+    def image_to_tsv(self, image, lang: str = 'eng', config: str = '') -> str:
+        engine, lock = self._get_engine(lang, config)
+        
+        # An engine holds per-image state, so one image at a time
+        with lock:
+            engine.SetImage(image)
+            engine.Recognize()
+            return engine.GetTSVText(0)
+    
+    def close(self):
+        """Release all engines"""
+        with self._engines_lock:
+            for engine in self._engines.values():
+                try:
+                    engine.End()
+                except Exception:
+                    pass
+            self._engines.clear()
+            self._locks.clear()
+
+
+# Backend instances of the current process (engines must not be shared
+# across forked worker processes)
+_backends: Dict[str, BaseOCRBackend] = {}
+_backends_pid: Optional[int] = None
+
+BACKENDS = {
+    'tesserocr': TesserocrBackend,
+    'pytesseract': PytesseractBackend,
+}
+
+
+def get_ocr_backend(name: Optional[str] = None) -> BaseOCRBackend:
+    """
+    Get a (cached) OCR backend
+    
+    Args:
+        name: 'tesserocr', 'pytesseract' or 'auto' (default: OCR_BACKEND)
+              'auto' prefers tesserocr and falls back to pytesseract.
+    
+    Returns:
+        OCR backend instance
+    """
+    global _backends_pid
+    
+    if _backends_pid != os.getpid():
+        _backends.clear()
+        _backends_pid = os.getpid()
+    
+    name = (name or OCR_BACKEND or 'auto').lower()
+    if name in _backends:
+        return _backends[name]
+    
+    if name == 'auto':
+        tesserocr_backend = get_ocr_backend('tesserocr')
+        backend = tesserocr_backend if tesserocr_backend.is_available() else get_ocr_backend('pytesseract')
+        logger.debug(f"Auto-selected OCR backend: {backend.name}")
+    elif name in BACKENDS:
+        backend = BACKENDS[name]()
+    else:
+        logger.warning(f"Unknown OCR backend '{name}', using pytesseract")
+        backend = get_ocr_backend('pytesseract')
+    
+    _backends[name] = backend
+    return backend
@@ -0,0 +1,111 @@
+"""
+OCR result cache - skips Tesseract for images that were already recognized
+"""
+import json
+import os
+from typing import Optional
+
+from utils.disk_cache import DiskLRUCache
+from utils.logger import logger
+from config import OCR_CACHE_ENABLED, OCR_CACHE_DIR, OCR_CACHE_MAX_MB
+
+
+class OCRCache:
+    """
+    Content-addressed cache of Tesseract TSV output
+    
+    The key is the hash of the rasterized image bytes plus everything that
+    changes the OCR result (language, PSM/OEM, Tesseract variables, DPI and
+    the raw config string), so re-running a document with another output
+    format or with LLM post-processing reuses the earlier OCR.
+    """
+    
+    def __init__(self, directory: str = None, max_mb: int = None):
+        """
+        Initialize OCR cache
+        
+        Args:
+            directory: Cache directory (default: OCR_CACHE_DIR)
+            max_mb: Size cap in megabytes (default: OCR_CACHE_MAX_MB)
+        """
+        self.store = DiskLRUCache(
+            directory or OCR_CACHE_DIR,
+            (max_mb or OCR_CACHE_MAX_MB) * 1024 * 1024,
+            suffix='.tsv'
+        )
+    
+    @staticmethod
+    def make_key(image, lang: str, config: str = '', dpi: Optional[float] = None) -> str:
+        """
+        Build the cache key for an OCR call
+        
+        Args:
+            image: PIL Image
+            lang: Tesseract language(s)
+            config: Tesseract configuration
+            dpi: Rendering DPI, if known
+        
+        Returns:
+            Cache key
+        """
+        from ai.ocr_backends import parse_tesseract_config
+        
+        psm, oem, variables = parse_tesseract_config(config)
+        params = json.dumps({
+            'lang': lang,
+            'psm': psm,
+            'oem': oem,
+            'variables': variables,
+            'dpi': dpi,
+            'config': config or '',
+            'mode': image.mode,
+            'size': image.size
+        }, sort_keys=True)
+        
+        return DiskLRUCache.make_key(params, image.tobytes())
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get cached TSV output"""
+        data = self.store.get(key)
+        return data.decode('utf-8') if data is not None else None
+    
+    def set(self, key: str, tsv: str):
+        """Store TSV output"""
+        self.store.set(key, tsv.encode('utf-8'))
+    
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+    
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+    
+    def stats(self):
+        """Get cache statistics"""
+        return self.store.stats()
+
+
+# Cache instance of the current process
+_cache: Optional[OCRCache] = None
+_cache_pid: Optional[int] = None
+
+
+def get_ocr_cache() -> Optional[OCRCache]:
+    """
+    Get the shared OCR cache
+    
+    Returns:
+        OCRCache, or None if caching is disabled (OCR_CACHE_ENABLED)
+    """
+    global _cache, _cache_pid
+    
+    if not OCR_CACHE_ENABLED:
+        return None
+    
+    if _cache is None or _cache_pid != os.getpid():
+        _cache = OCRCache()
+        _cache_pid = os.getpid()
+        logger.debug(f"OCR cache: {_cache.store.directory}")
+    
+    return _cache
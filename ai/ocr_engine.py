@@ -5,9 +5,11 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 import os
 import pytesseract
-from PIL import Image
-from pdf2image import convert_from_path
+from ai.image_context import ImageContext, ImageSource
+from ai.ocr_result import run_ocr
+from ai.page_raster import iter_page_images
 from utils.logger import logger
+from utils.page_ranges import PageSpec, parse_page_ranges
 from config import OCR_LANGUAGE, DEFAULT_DPI, TESSERACT_CMD
 
 
@@ -71,7 +73,7 @@ class OCREngine:
     
     def extract_text_from_image(
         self,
-        image_path: str,
+        image: ImageSource,
         language: Optional[str] = None,
         psm: Optional[int] = None,
         preserve_layout: bool = False
@@ -80,7 +82,8 @@ class OCREngine:
         Extract text from image using OCR
         
         Args:
-            image_path: Path to image file
+            image: Path to image file, OpenCV pixel array (e.g. an enhanced
+                   table image) or an ImageContext already decoded by the caller
             language: Optional language override
             psm: Page Segmentation Mode (0-13, default: 3)
                  6 = Assume a single uniform block of text
@@ -94,10 +97,8 @@ class OCREngine:
         lang = language or self.language
         
         try:
-            logger.info(f"Extracting text from image: {image_path}")
-            
-            # Open image
-            image = Image.open(image_path)
+            context = ImageContext.of(image)
+            logger.info(f"Extracting text from image: {context.name}")
             
             # Build config string
             config = ''
@@ -106,32 +107,23 @@ class OCREngine:
             if preserve_layout:
                 config += ' -c preserve_interword_spaces=1'
             
-            # Perform OCR
-            if config:
-                text = pytesseract.image_to_string(image, lang=lang, config=config)
-            else:
-                text = pytesseract.image_to_string(image, lang=lang)
-            
-            # Get detailed data for confidence
-            data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
-            
-            # Calculate confidence
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+            # Perform OCR (text and confidence come from the same Tesseract run)
+            ocr = run_ocr(context.image, lang=lang, config=config.strip(), dpi=context.dpi)
+            text = ocr.text
             
             return {
                 'success': True,
                 'text': text,
-                'confidence': avg_confidence,
+                'confidence': ocr.confidence,
                 'word_count': len(text.split()),
                 'metadata': {
-                    'image_size': image.size,
+                    'image_size': context.size,
                     'language': lang
                 }
             }
             
         except Exception as e:
-            logger.error(f"OCR failed for image {image_path}: {e}")
+            logger.error(f"OCR failed for image {image}: {e}")
             return {
                 'success': False,
                 'error': str(e),
@@ -142,7 +134,8 @@ class OCREngine:
         self,
         pdf_path: str,
         language: Optional[str] = None,
-        dpi: int = DEFAULT_DPI
+        dpi: int = DEFAULT_DPI,
+        pages: PageSpec = None
     ) -> Dict[str, Any]:
         """
         Extract text from scanned PDF using OCR
@@ -151,6 +144,7 @@ class OCREngine:
             pdf_path: Path to PDF file
             language: Optional language override
             dpi: DPI for PDF to image conversion
+            pages: Only OCR these 1-based pages, e.g. "1-5,10" (default: all pages)
             
         Returns:
             Dictionary with text and metadata
@@ -160,23 +154,25 @@ class OCREngine:
         try:
             logger.info(f"Extracting text from PDF with OCR: {pdf_path}")
             
-            # Convert PDF pages to images
-            images = convert_from_path(pdf_path, dpi=dpi)
+            import fitz
+            
+            with fitz.open(pdf_path) as doc:
+                page_count = len(doc)
+            page_numbers = parse_page_ranges(pages, page_count)
             
             all_text = []
             page_results = []
             total_confidence = 0
             
-            for i, image in enumerate(images, 1):
-                logger.info(f"Processing page {i}/{len(images)}")
-                
-                # Perform OCR on page
-                text = pytesseract.image_to_string(image, lang=lang)
-                data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
+            # Pages are rendered one at a time (grayscale) as OCR consumes them
+            for raster in iter_page_images(pdf_path, page_numbers, dpi=dpi):
+                i = raster.page_num + 1
+                logger.info(f"Processing page {i}/{page_count}")
                 
-                # Calculate confidence for this page
-                confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-                page_confidence = sum(confidences) / len(confidences) if confidences else 0
+                # Perform OCR on page (single Tesseract run for text and confidence)
+                ocr = run_ocr(raster.image, lang=lang, dpi=dpi)
+                text = ocr.text
+                page_confidence = ocr.confidence
                 
                 all_text.append(f"--- Page {i} ---\n{text}")
                 page_results.append({
@@ -188,14 +184,15 @@ class OCREngine:
                 
                 total_confidence += page_confidence
             
-            avg_confidence = total_confidence / len(images) if images else 0
+            avg_confidence = total_confidence / len(page_numbers) if page_numbers else 0
             combined_text = '\n\n'.join(all_text)
             
             return {
                 'success': True,
                 'text': combined_text,
                 'confidence': avg_confidence,
-                'page_count': len(images),
+                'page_count': page_count,
+                'pages_processed': len(page_numbers),
                 'word_count': len(combined_text.split()),
                 'pages': page_results,
                 'metadata': {
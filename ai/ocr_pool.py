@@ -0,0 +1,202 @@
+"""
+OCR worker pool - runs page OCR for scanned PDFs concurrently across processes
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from utils.logger import logger
+from config import OCR_WORKERS
+
+
+# PDF documents opened by the current process, keyed by path. Every worker
+# handles many pages of the same file, so the document is parsed once per
+# process instead of once per page.
+_open_documents: Dict[str, Any] = {}
+
+
+def _init_worker(tesseract_cmd: Optional[str], thread_limit: int):
+    """
+    Initialize an OCR worker process
+    
+    Args:
+        tesseract_cmd: Tesseract executable configured in the parent process
+        thread_limit: OpenMP threads Tesseract may use inside this worker
+    """
+    # Tesseract parallelizes internally with OpenMP; N workers each using
+    # every core would oversubscribe the CPU
+    os.environ['OMP_THREAD_LIMIT'] = str(thread_limit)
+    
+    if tesseract_cmd:
+        import pytesseract
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def _get_document(pdf_path: str):
+    """Get the PyMuPDF document for a path, opening it on first use"""
+    import fitz  # PyMuPDF
+    
+    doc = _open_documents.get(pdf_path)
+    if doc is None:
+        _close_documents()
+        doc = fitz.open(pdf_path)
+        _open_documents[pdf_path] = doc
+    return doc
+
+
+def _close_documents():
+    """Close all documents opened by the current process"""
+    for doc in _open_documents.values():
+        try:
+            doc.close()
+        except Exception:
+            pass
+    _open_documents.clear()
+
+
+def ocr_pdf_page(pdf_path: str, page_num: int, zoom: float = 2,
+                 lang: str = 'eng', config: str = '') -> Dict[str, Any]:
+    """
+    Rasterize and OCR a single PDF page
+    
+    Runs inside worker processes, so it only takes picklable arguments and
+    never raises: failures are reported in the result.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_num: 0-based page index
+        zoom: Rendering zoom (1 = 72 DPI)
+        lang: Tesseract language(s)
+        config: Extra Tesseract configuration
+    
+    Returns:
+        Dictionary with 'page', 'text', 'confidence', 'cached' (OCR cache hit)
+        and 'error' (None on success)
+    """
+    try:
+        from ai.ocr_result import run_ocr
+        from ai.page_raster import render_document_page
+        
+        # Grayscale is all Tesseract needs; pages rendered before come from the raster cache
+        img = render_document_page(_get_document(pdf_path), page_num, zoom=zoom, grayscale=True)
+        
+        ocr = run_ocr(img, lang=lang, config=config, dpi=zoom * 72)
+        return {'page': page_num, 'text': ocr.text, 'confidence': ocr.confidence,
+                'cached': ocr.cached, 'error': None}
+    except Exception as e:
+        return {'page': page_num, 'text': '', 'confidence': 0, 'cached': False, 'error': str(e)}
+
+
+class OCRPool:
+    """
+    Process pool for page-level OCR
+    
+    Pages are submitted with a bounded in-flight window (so rendered pages
+    of a 200-page scan never pile up in memory) and results are yielded
+    back in page order. With a single worker everything runs in-process.
+    
+    Usage:
+        with OCRPool(workers=4) as pool:
+            for result in pool.ocr_pages(pdf_path, range(num_pages), lang='eng'):
+                ...
+    """
+    
+    def __init__(self, workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        """
+        Initialize OCR pool
+        
+        Args:
+            workers: Worker processes (0 = one per CPU core, default: OCR_WORKERS)
+            max_in_flight: Maximum pages submitted but not yet consumed
+                           (default: 2 per worker)
+        """
+        if workers is None:
+            workers = OCR_WORKERS
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self.cache_hits = 0
+        self.pages_done = 0
+        self._executor = None
+    
+    def __enter__(self) -> 'OCRPool':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _get_executor(self, num_pages: int) -> Optional[ProcessPoolExecutor]:
+        """Start worker processes on first use (never more than there are pages)"""
+        workers = min(self.workers, num_pages)
+        if self._executor is None and workers > 1:
+            import pytesseract
+            
+            thread_limit = max(1, (os.cpu_count() or 1) // workers)
+            logger.info(f"Starting OCR pool: {workers} workers, {thread_limit} thread(s) each")
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(pytesseract.pytesseract.tesseract_cmd, thread_limit)
+            )
+        return self._executor
+    
+    def ocr_pages(self, pdf_path: str, page_numbers: Iterable[int], zoom: float = 2,
+                  lang: str = 'eng', config: str = '') -> Iterator[Dict[str, Any]]:
+        """
+        OCR PDF pages, yielding results in page order
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_numbers: 0-based page indices
+            zoom: Rendering zoom (1 = 72 DPI)
+            lang: Tesseract language(s)
+            config: Extra Tesseract configuration
+        
+        Yields:
+            Dictionary with 'page', 'text', 'confidence' and 'error' for each page
+        """
+        for result in self._run_pages(str(pdf_path), list(page_numbers), zoom, lang, config):
+            self.pages_done += 1
+            if result.get('cached'):
+                self.cache_hits += 1
+            yield result
+    
+    def _run_pages(self, pdf_path: str, page_numbers: List[int], zoom: float,
+                   lang: str, config: str) -> Iterator[Dict[str, Any]]:
+        """Run pages in-process or in the worker processes, in page order"""
+        executor = self._get_executor(len(page_numbers))
+        
+        if executor is None:
+            try:
+                for page_num in page_numbers:
+                    yield ocr_pdf_page(pdf_path, page_num, zoom, lang, config)
+            finally:
+                _close_documents()
+            return
+        
+        pending = deque()
+        remaining = iter(page_numbers)
+        
+        for page_num in remaining:
+            pending.append(executor.submit(ocr_pdf_page, pdf_path, page_num, zoom, lang, config))
+            if len(pending) >= self.max_in_flight:
+                break
+        
+        while pending:
+            result = pending.popleft().result()
+            
+            # Refill the window before handing the result to the caller
+            next_page = next(remaining, None)
+            if next_page is not None:
+                pending.append(executor.submit(ocr_pdf_page, pdf_path, next_page, zoom, lang, config))
+            
+            yield result
+    
+    def close(self):
+        """Shut down worker processes"""
+        if self.cache_hits:
+            logger.info(f"OCR cache: {self.cache_hits}/{self.pages_done} pages reused")
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,200 @@
+"""
+Single-pass OCR result - text, confidence and word boxes from one Tesseract run
+"""
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Any, Optional
+
+from utils.logger import logger
+
+# Tesseract TSV layout levels
+LEVEL_WORD = 5
+
+
+@dataclass
+class OCRWord:
+    """A recognized word with its position in the page layout"""
+    text: str
+    confidence: float
+    bbox: Tuple[int, int, int, int]  # (left, top, width, height)
+    block_num: int = 0
+    par_num: int = 0
+    line_num: int = 0
+    word_num: int = 0
+    
+    @property
+    def line_key(self) -> Tuple[int, int, int]:
+        """(block, paragraph, line) the word belongs to"""
+        return (self.block_num, self.par_num, self.line_num)
+
+
+@dataclass
+class OCRResult:
+    """
+    OCR output parsed from Tesseract's TSV (image_to_data) format
+    
+    Tesseract already produces text, word confidences and bounding boxes in
+    a single TSV run, so callers that need both text and confidence should
+    build one OCRResult instead of calling image_to_string and then
+    image_to_data on the same image.
+    """
+    words: List[OCRWord] = field(default_factory=list)
+    preserve_spaces: bool = False
+    cached: bool = False
+    
+    @classmethod
+    def from_tsv(cls, tsv: str, preserve_spaces: bool = False) -> 'OCRResult':
+        """
+        Parse Tesseract TSV output
+        
+        Args:
+            tsv: TSV text, with or without the header row
+            preserve_spaces: Rebuild wide gaps between words as multiple
+                             spaces (like preserve_interword_spaces=1)
+        
+        Returns:
+            OCRResult with all non-empty words
+        """
+        words = []
+        for row in tsv.splitlines():
+            fields = row.split('\t')
+            if len(fields) < 12 or fields[0] != str(LEVEL_WORD):
+                # Header, layout rows (page/block/paragraph/line) and blank rows
+                continue
+            
+            text = '\t'.join(fields[11:]).strip()
+            if not text:
+                continue
+            
+            try:
+                words.append(OCRWord(
+                    text=text,
+                    confidence=float(fields[10]),
+                    bbox=(int(fields[6]), int(fields[7]), int(fields[8]), int(fields[9])),
+                    block_num=int(fields[2]),
+                    par_num=int(fields[3]),
+                    line_num=int(fields[4]),
+                    word_num=int(fields[5])
+                ))
+            except ValueError:
+                continue
+        
+        return cls(words=words, preserve_spaces=preserve_spaces)
+    
+    @property
+    def text(self) -> str:
+        """
+        Plain text rebuilt from the layout
+        
+        Words on a line are joined with spaces, lines with newlines, and
+        paragraphs/blocks are separated by a blank line - the same shape
+        image_to_string produces.
+        """
+        paragraphs = []
+        lines = []
+        current_line = []
+        current_key = None
+        
+        for word in self.words:
+            key = word.line_key
+            if key != current_key:
+                if current_line:
+                    lines.append(self._join_line(current_line))
+                    current_line = []
+                if current_key is not None and key[:2] != current_key[:2] and lines:
+                    paragraphs.append('\n'.join(lines))
+                    lines = []
+                current_key = key
+            current_line.append(word)
+        
+        if current_line:
+            lines.append(self._join_line(current_line))
+        if lines:
+            paragraphs.append('\n'.join(lines))
+        
+        return '\n\n'.join(paragraphs) + '\n' if paragraphs else ''
+    
+    def _join_line(self, words: List[OCRWord]) -> str:
+        """Join the words of one line, estimating space runs from the gaps if requested"""
+        if not self.preserve_spaces or len(words) == 1:
+            return ' '.join(w.text for w in words)
+        
+        # Average character width on this line approximates one space
+        char_width = sum(w.bbox[2] for w in words) / max(1, sum(len(w.text) for w in words))
+        
+        parts = [words[0].text]
+        for prev, word in zip(words, words[1:]):
+            gap = word.bbox[0] - (prev.bbox[0] + prev.bbox[2])
+            spaces = max(1, int(gap / char_width)) if char_width > 0 else 1
+            parts.append(' ' * spaces)
+            parts.append(word.text)
+        return ''.join(parts)
+    
+    @property
+    def confidence(self) -> float:
+        """Average word confidence (0-100), ignoring unscored words"""
+        scores = [w.confidence for w in self.words if w.confidence > 0]
+        return sum(scores) / len(scores) if scores else 0
+    
+    @property
+    def word_count(self) -> int:
+        """Number of recognized words"""
+        return len(self.words)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'text': self.text,
+            'confidence': self.confidence,
+            'word_count': self.word_count,
+            'words': [
+                {'text': w.text, 'confidence': w.confidence, 'bbox': w.bbox}
+                for w in self.words
+            ]
+        }
+
+
+def run_ocr(image, lang: str = 'eng', config: Optional[str] = None,
+            backend: Optional[str] = None, dpi: Optional[float] = None,
+            use_cache: bool = True) -> OCRResult:
+    """
+    Run Tesseract once on an image
+    
+    Results are looked up in (and stored to) the OCR cache first, so the
+    same image is only recognized once.
+    
+    Args:
+        image: PIL Image
+        lang: Tesseract language(s)
+        config: Extra Tesseract configuration
+        backend: OCR backend name (default: OCR_BACKEND, see ai.ocr_backends)
+        dpi: Rendering DPI, part of the cache key
+        use_cache: Use the OCR cache (if enabled in config)
+    
+    Returns:
+        OCRResult with text, confidences and word boxes
+    """
+    from ai.ocr_backends import get_ocr_backend
+    from ai.ocr_cache import get_ocr_cache
+    
+    config = config or ''
+    preserve_spaces = 'preserve_interword_spaces=1' in config
+    
+    cache = get_ocr_cache() if use_cache else None
+    if cache is not None:
+        key = cache.make_key(image, lang, config, dpi)
+        tsv = cache.get(key)
+        if tsv is not None:
+            result = OCRResult.from_tsv(tsv, preserve_spaces=preserve_spaces)
+            result.cached = True
+            return result
+    
+    engine = get_ocr_backend(backend)
+    if not engine.supports_language(lang):
+        logger.debug(f"{engine.name} has no '{lang}' language data, using pytesseract")
+        engine = get_ocr_backend('pytesseract')
+    
+    tsv = engine.image_to_tsv(image, lang=lang, config=config)
+    if cache is not None:
+        cache.set(key, tsv)
+    
+    return OCRResult.from_tsv(tsv, preserve_spaces=preserve_spaces)
@@ -0,0 +1,124 @@
+"""
+Page raster service - renders PDF pages to images one at a time
+"""
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+
+@dataclass
+class RasterPage:
+    """A rendered PDF page"""
+    page_num: int  # 0-based
+    image: Image.Image
+    dpi: float
+
+
+def pixmap_to_image(pix) -> Image.Image:
+    """
+    Wrap a PyMuPDF pixmap as a PIL image without copying the pixels
+    
+    The image reads straight from the pixmap's sample buffer, so the pixmap
+    is kept referenced by the image for as long as the image lives.
+    
+    Args:
+        pix: fitz.Pixmap without alpha (grayscale or RGB)
+    
+    Returns:
+        Read-only PIL image ('L' or 'RGB')
+    """
+    mode = 'L' if pix.n == 1 else 'RGB'
+    image = Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, 'raw', mode, pix.stride, 1)
+    
+    # The buffer belongs to the pixmap; freeing it would leave the image dangling
+    image._pixmap = pix
+    return image
+
+
+def render_page(page, zoom: float = 2, grayscale: bool = False) -> Image.Image:
+    """
+    Render a single page
+    
+    Args:
+        page: PyMuPDF page
+        zoom: Rendering zoom (1 = 72 DPI)
+        grayscale: Render one channel instead of RGB (enough for OCR,
+                   a third of the memory)
+    
+    Returns:
+        PIL image
+    """
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+    return pixmap_to_image(pix)
+
+
+def render_document_page(doc, page_num: int, zoom: float = 2, grayscale: bool = True) -> Image.Image:
+    """
+    Render a page of a PDF file, reading through the raster cache
+    
+    A page rendered before (same file content, zoom and color mode) is
+    loaded from the cache instead of being rasterized again.
+    
+    Args:
+        doc: PyMuPDF document opened from a file
+        page_num: 0-based page index
+        zoom: Rendering zoom (1 = 72 DPI)
+        grayscale: Render one channel instead of RGB
+    
+    Returns:
+        PIL image
+    """
+    from ai.raster_cache import get_raster_cache
+    
+    # In-memory documents have no file to key the cache on
+    cache = get_raster_cache() if doc.name else None
+    key = None
+    if cache is not None:
+        key = cache.make_key(doc.name, page_num, zoom, grayscale)
+        image = cache.get(key)
+        if image is not None:
+            return image
+    
+    start = time.perf_counter()
+    image = render_page(doc[page_num], zoom=zoom, grayscale=grayscale)
+    if cache is not None:
+        cache.set(key, image, time.perf_counter() - start)
+    return image
+
+
+def iter_page_images(pdf, page_numbers: Optional[Iterable[int]] = None, dpi: float = 144,
+                     grayscale: bool = True) -> Iterator[RasterPage]:
+    """
+    Lazily render PDF pages
+    
+    Pages are rendered (or loaded from the raster cache) only when the
+    consumer asks for the next one, so a long scan never holds more than
+    the page being processed in memory.
+    
+    Args:
+        pdf: Path to PDF file or an open PyMuPDF document
+        page_numbers: 0-based page indices (default: all pages)
+        dpi: Rendering resolution
+        grayscale: Render grayscale (default, for OCR) instead of RGB
+    
+    Yields:
+        RasterPage for each requested page, in the given order
+    """
+    owns_document = not isinstance(pdf, fitz.Document)
+    doc = fitz.open(str(pdf)) if owns_document else pdf
+    
+    try:
+        if page_numbers is None:
+            page_numbers = range(len(doc))
+        
+        zoom = dpi / 72
+        for page_num in page_numbers:
+            image = render_document_page(doc, page_num, zoom=zoom, grayscale=grayscale)
+            yield RasterPage(page_num=page_num, image=image, dpi=dpi)
+    finally:
+        if owns_document:
+            doc.close()
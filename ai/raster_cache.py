@@ -0,0 +1,168 @@
+"""
+Raster cache - keeps rendered PDF pages on disk so repeated OCR skips rasterization
+"""
+import hashlib
+import io
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from utils.disk_cache import DiskLRUCache
+from utils.logger import logger
+from config import RASTER_CACHE_ENABLED, RASTER_CACHE_DIR, RASTER_CACHE_MAX_MB, RASTER_CACHE_MIN_RENDER_MS
+
+
+# Content hashes of the PDF files seen by this process, keyed by
+# (path, size, mtime) so each file is read once however many pages are looked up
+_document_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def document_hash(pdf_path: str) -> str:
+    """
+    Hash the content of a PDF file
+    
+    Args:
+        pdf_path: Path to PDF file
+    
+    Returns:
+        SHA-256 hex digest of the file bytes
+    """
+    path = os.path.abspath(pdf_path)
+    stat = os.stat(path)
+    stamp = (path, stat.st_size, stat.st_mtime_ns)
+    
+    digest = _document_hashes.get(stamp)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+        _document_hashes[stamp] = digest
+    return digest
+
+
+class RasterCache:
+    """
+    Content-addressed cache of rendered pages
+    
+    The key is the hash of the PDF file content plus the page index, zoom,
+    color mode and PyMuPDF version, so the same upload OCR'd again (another
+    output format, OCR mode or LLM post-processing) is not rendered again,
+    while an edited file or a renderer upgrade never hits a stale entry.
+    
+    Pages are stored as fast-compressed PNG. Loading one costs a PNG
+    decode, which is slower than rendering a plain text page, so only pages
+    that took at least min_render_ms to render (scans, heavy vector
+    graphics, high DPI) are stored.
+    """
+    
+    def __init__(self, directory: str = None, max_mb: int = None, min_render_ms: int = None):
+        """
+        Initialize raster cache
+        
+        Args:
+            directory: Cache directory (default: RASTER_CACHE_DIR)
+            max_mb: Size cap in megabytes (default: RASTER_CACHE_MAX_MB)
+            min_render_ms: Only store pages that rendered at least this slowly
+                           (default: RASTER_CACHE_MIN_RENDER_MS)
+        """
+        self.store = DiskLRUCache(
+            directory or RASTER_CACHE_DIR,
+            (max_mb or RASTER_CACHE_MAX_MB) * 1024 * 1024,
+            suffix='.png'
+        )
+        self.min_render_ms = RASTER_CACHE_MIN_RENDER_MS if min_render_ms is None else min_render_ms
+    
+    @staticmethod
+    def make_key(pdf_path: str, page_num: int, zoom: float, grayscale: bool) -> str:
+        """
+        Build the cache key for a rendered page
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_num: 0-based page index
+            zoom: Rendering zoom (1 = 72 DPI)
+            grayscale: One-channel rendering
+        
+        Returns:
+            Cache key
+        """
+        params = json.dumps({
+            'page': page_num,
+            'zoom': round(zoom, 6),
+            'grayscale': grayscale,
+            'renderer': fitz.VersionBind
+        }, sort_keys=True)
+        
+        return DiskLRUCache.make_key(document_hash(pdf_path), params)
+    
+    def get(self, key: str) -> Optional[Image.Image]:
+        """Get a cached page image"""
+        data = self.store.get(key)
+        if data is None:
+            return None
+        
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.load()
+            return image
+        except Exception as e:
+            logger.debug(f"Unreadable raster cache entry {key}: {e}")
+            return None
+    
+    def set(self, key: str, image: Image.Image, render_seconds: float):
+        """
+        Store a page image if it was expensive to render
+        
+        Args:
+            key: Cache key
+            image: Rendered page
+            render_seconds: Time the rendering took
+        """
+        if render_seconds * 1000 < self.min_render_ms:
+            return
+        
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', compress_level=1)
+        self.store.set(key, buffer.getvalue())
+    
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+    
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+    
+    def stats(self):
+        """Get cache statistics"""
+        return self.store.stats()
+
+
+# Cache instance of the current process
+_cache: Optional[RasterCache] = None
+_cache_pid: Optional[int] = None
+
+
+def get_raster_cache() -> Optional[RasterCache]:
+    """
+    Get the shared raster cache
+    
+    Returns:
+        RasterCache, or None if caching is disabled (RASTER_CACHE_ENABLED)
+    """
+    global _cache, _cache_pid
+    
+    if not RASTER_CACHE_ENABLED:
+        return None
+    
+    if _cache is None or _cache_pid != os.getpid():
+        _cache = RasterCache()
+        _cache_pid = os.getpid()
+        logger.debug(f"Raster cache: {_cache.store.directory}")
+    
+    return _cache
@@ -2,11 +2,16 @@
 Advanced Table Detection using OpenCV
 Detects table structures, rows, columns, and cells in images
 """
+import uuid
 import cv2
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 from pathlib import Path
+from PIL import Image
+from ai.image_context import ImageContext, ImageSource
+from ai.ocr_result import run_ocr
 from utils.logger import logger
+from config import DEBUG_IMAGES, DEBUG_IMAGE_DIR, TABLE_DETECT_MAX_SIDE, TABLE_PREPROCESS_PROFILE
 
 
 class TableDetector:
@@ -20,48 +25,149 @@ class TableDetector:
     - Pre-processing for better OCR results
     """
     
-    def __init__(self):
-        """Initialize table detector"""
+    # Preprocessing profiles of enhance_table_image:
+    #   skew_sample: longest side of the copy the skew angle is estimated on
+    #                (None = full resolution)
+    #   rotation: interpolation used to deskew the full-resolution image
+    #   denoise: 'nlmeans' (non-local means, ~17 s on a 12 MP photo) or
+    #            'bilateral' (edge-preserving, ~0.25 s, the closest cheap
+    #            filter to non-local means here)
+    PROFILES = {
+        'quality': {'skew_sample': None, 'rotation': cv2.INTER_CUBIC, 'denoise': 'nlmeans'},
+        'fast': {'skew_sample': 1000, 'rotation': cv2.INTER_LINEAR, 'denoise': 'bilateral'},
+    }
+    
+    def __init__(self, profile: Optional[str] = None):
+        """
+        Initialize table detector
+        
+        Args:
+            profile: Preprocessing profile, 'quality' or 'fast'
+                     (default: TABLE_PREPROCESS_PROFILE)
+        """
         self.min_line_length = 30  # Minimum line length to consider
         self.max_line_gap = 10     # Maximum gap between line segments
-        
-    def detect_tables(self, image_path: str) -> List[Dict[str, Any]]:
+        self.profile = self._check_profile(profile or TABLE_PREPROCESS_PROFILE)
+    
+    def _check_profile(self, profile: str) -> str:
+        """Validate a preprocessing profile name"""
+        if profile not in self.PROFILES:
+            logger.warning(f"Unknown table preprocessing profile '{profile}', using 'quality'")
+            return 'quality'
+        return profile
+    
+    def detect_tables(self, image: ImageSource, max_side: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Detect tables in an image
         
+        Lines are detected on a pyramid level no larger than max_side (ruled lines
+        survive downscaling, the cost of the morphology passes shrinks with
+        the square of the scale) and the regions are mapped back to full
+        resolution. Images without a single run of dark pixels long enough
+        to be a ruled line are rejected before any morphology pass.
+        
         Args:
-            image_path: Path to image file
+            image: Image path, or an ImageContext already decoded by the caller
+            max_side: Longest side of the detection level
+                      (default: TABLE_DETECT_MAX_SIDE, 0 = full resolution)
         
         Returns:
             List of detected table regions with coordinates
         """
         try:
-            # Read image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                logger.error(f"Failed to read image: {image_path}")
-                return []
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = ImageContext.of(image).gray
+            level = self._pyramid_level(gray, TABLE_DETECT_MAX_SIDE if max_side is None else max_side)
             
             # Apply preprocessing
-            processed = self._preprocess_for_tables(gray)
+            processed = self._preprocess_for_tables(level)
+            
+            # No long horizontal or vertical run means no ruled lines
+            if not self._has_line_runs(processed):
+                logger.info("Detected 0 potential tables in image (no ruled lines)")
+                return []
             
             # Detect horizontal and vertical lines
             horizontal_lines = self._detect_horizontal_lines(processed)
             vertical_lines = self._detect_vertical_lines(processed)
             
             # Find table regions (intersections of h/v lines)
-            tables = self._find_table_regions(horizontal_lines, vertical_lines, image.shape)
+            tables = self._find_table_regions(horizontal_lines, vertical_lines, gray.shape)
             
             logger.info(f"Detected {len(tables)} potential tables in image")
             return tables
-            
+        
         except Exception as e:
             logger.error(f"Table detection failed: {e}")
             return []
     
+    def _pyramid_level(self, gray_image: np.ndarray, max_side: int) -> np.ndarray:
+        """
+        Halve an image until its longest side is at most max_side
+        
+        Each step averages 2x2 blocks: a thin dark line stays a (lighter)
+        line instead of disappearing between samples, and exact halving
+        is several times faster than area resizing by an arbitrary factor.
+        
+        Args:
+            gray_image: Grayscale input image
+            max_side: Longest side of the result (0 = keep the image)
+        
+        Returns:
+            Pyramid level (the image itself if it is small enough)
+        """
+        level = gray_image
+        while max_side and max(level.shape[:2]) > max_side:
+            height, width = level.shape[:2]
+            level = cv2.resize(level, (width // 2, height // 2), interpolation=cv2.INTER_AREA)
+        return level
+    
+    def _has_line_runs(self, binary_image: np.ndarray) -> bool:
+        """
+        Check whether a binary image can contain a ruled line at all
+        
+        The line detectors keep runs of foreground pixels at least as long
+        as their kernels (1/30 of the width or height; half of that at the
+        image border). A row can only hold such a run if its projection
+        counts that many foreground pixels, so runs are only measured in
+        the rows and columns whose projection passes.
+        
+        Args:
+            binary_image: Binary image from _preprocess_for_tables
+        
+        Returns:
+            False if the line detectors would find nothing
+        """
+        height, width = binary_image.shape[:2]
+        
+        for lines, kernel_size in ((binary_image, width // 30), (binary_image.T, height // 30)):
+            min_run = max(1, kernel_size // 2)
+            candidates = np.flatnonzero(np.count_nonzero(lines, axis=1) >= min_run)
+            if len(candidates) and self._longest_run(lines[candidates]) >= min_run:
+                return True
+        
+        return False
+    
+    @staticmethod
+    def _longest_run(rows: np.ndarray) -> int:
+        """
+        Length of the longest run of non-zero pixels in any row
+        
+        Args:
+            rows: 2-D array
+        
+        Returns:
+            Run length in pixels
+        """
+        padded = np.zeros((rows.shape[0], rows.shape[1] + 2), np.int8)
+        padded[:, 1:-1] = rows > 0
+        
+        # Runs start at +1 and end at -1 steps; rows are zero-padded, so
+        # starts and ends pair up in row-major order
+        steps = np.diff(padded, axis=1)
+        starts = np.flatnonzero(steps == 1)
+        ends = np.flatnonzero(steps == -1)
+        return int((ends - starts).max()) if len(starts) else 0
+    
     def _preprocess_for_tables(self, gray_image: np.ndarray) -> np.ndarray:
         """
         Preprocess image for better table detection
@@ -138,11 +244,16 @@ class TableDetector:
         Args:
             h_lines: Horizontal lines image
             v_lines: Vertical lines image
-            image_shape: Original image shape
+            image_shape: Original image shape (the line images may be a
+                         downscaled copy; regions are mapped back to it)
         
         Returns:
             List of table region dictionaries
         """
+        # Size of one line image pixel in original pixels
+        scale_y = image_shape[0] / h_lines.shape[0]
+        scale_x = image_shape[1] / h_lines.shape[1]
+        
         # Combine horizontal and vertical lines
         table_mask = cv2.add(h_lines, v_lines)
         
@@ -153,10 +264,12 @@ class TableDetector:
         min_table_area = 10000  # Minimum area to consider as table
         
         for contour in contours:
-            area = cv2.contourArea(contour)
+            area = cv2.contourArea(contour) * scale_x * scale_y
             
             if area > min_table_area:
                 x, y, w, h = cv2.boundingRect(contour)
+                x, w = round(x * scale_x), round(w * scale_x)
+                y, h = round(y * scale_y), round(h * scale_y)
                 
                 # Calculate aspect ratio
                 aspect_ratio = float(w) / h if h > 0 else 0
@@ -179,31 +292,23 @@ class TableDetector:
     
     def extract_table_structure(
         self,
-        image_path: str,
+        image: ImageSource,
         table_region: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Extract detailed structure (rows, columns, cells) from a table region
         
         Args:
-            image_path: Path to image file
+            image: Image path, or an ImageContext already decoded by the caller
             table_region: Table region dictionary with coordinates
         
         Returns:
             Dictionary with table structure details
         """
         try:
-            # Read image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                return {'rows': 0, 'columns': 0, 'cells': []}
-            
             # Extract table region
             x, y, w, h = table_region['x'], table_region['y'], table_region['width'], table_region['height']
-            table_img = image[y:y+h, x:x+w]
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(table_img, cv2.COLOR_BGR2GRAY)
+            gray = ImageContext.of(image).gray[y:y+h, x:x+w]
             
             # Preprocess
             binary = self._preprocess_for_tables(gray)
@@ -228,11 +333,79 @@ class TableDetector:
                 'row_boundaries': rows,
                 'column_boundaries': columns
             }
-            
+        
         except Exception as e:
             logger.error(f"Table structure extraction failed: {e}")
             return {'rows': 0, 'columns': 0, 'cells': []}
     
+    def extract_table_cells(
+        self,
+        image: ImageSource,
+        table_region: Dict[str, Any],
+        language: str = 'eng',
+        psm: int = 11
+    ) -> Dict[str, Any]:
+        """
+        Extract the cell grid of a table region together with the cell text
+        
+        The whole region is recognized in a single OCR run and every word
+        is assigned to the cell that contains the center of its box, so a
+        40x10 table costs one Tesseract call instead of 400.
+        
+        Args:
+            image: Image path, or an ImageContext already decoded by the caller
+            table_region: Table region dictionary with coordinates
+            language: Tesseract language(s)
+            psm: Page Segmentation Mode for the region (11 = sparse text)
+        
+        Returns:
+            Structure from extract_table_structure, each cell with its
+            'text', plus 'grid' (rows of cell texts) and 'confidence'
+        """
+        context = ImageContext.of(image)
+        structure = self.extract_table_structure(context, table_region)
+        structure['grid'] = []
+        
+        row_bounds = np.asarray(structure.get('row_boundaries', []))
+        column_bounds = np.asarray(structure.get('column_boundaries', []))
+        if len(row_bounds) < 2 or len(column_bounds) < 2:
+            return structure
+        
+        try:
+            x, y, w, h = table_region['x'], table_region['y'], table_region['width'], table_region['height']
+            region = Image.fromarray(np.ascontiguousarray(context.gray[y:y+h, x:x+w]))
+            ocr = run_ocr(region, lang=language, config=f'--psm {psm}')
+        except Exception as e:
+            logger.error(f"Table OCR failed: {e}")
+            return structure
+        
+        # Ruled lines are often read as '|' or '_' - not cell content
+        words = [word for word in ocr.words if word.text.strip('|_-—=[]')]
+        num_rows, num_columns = len(row_bounds) - 1, len(column_bounds) - 1
+        grid = [[[] for _ in range(num_columns)] for _ in range(num_rows)]
+        
+        if words:
+            boxes = np.array([word.bbox for word in words], dtype=float)
+            centers_x = boxes[:, 0] + boxes[:, 2] / 2
+            centers_y = boxes[:, 1] + boxes[:, 3] / 2
+            
+            # Cell of every word at once (boundaries are relative to the region)
+            word_rows = np.searchsorted(row_bounds, centers_y, side='right') - 1
+            word_columns = np.searchsorted(column_bounds, centers_x, side='right') - 1
+            inside = (word_rows >= 0) & (word_rows < num_rows) & (word_columns >= 0) & (word_columns < num_columns)
+            
+            # Words keep Tesseract's reading order within a cell
+            for k in np.flatnonzero(inside):
+                grid[word_rows[k]][word_columns[k]].append(words[k].text)
+        
+        structure['grid'] = [[' '.join(cell) for cell in row] for row in grid]
+        for cell in structure['cells']:
+            cell['text'] = structure['grid'][cell['row']][cell['column']]
+        structure['confidence'] = ocr.confidence
+        
+        logger.info(f"Extracted table text: {num_rows}x{num_columns} cells, {len(words)} words, one OCR pass")
+        return structure
+    
     def _find_rows(self, h_lines: np.ndarray) -> List[int]:
         """
         Find row boundaries from horizontal lines
@@ -244,19 +417,7 @@ class TableDetector:
             List of y-coordinates for row boundaries
         """
         # Sum pixels horizontally to find strong horizontal lines
-        h_projection = np.sum(h_lines, axis=1)
-        
-        # Find peaks (row boundaries)
-        threshold = np.max(h_projection) * 0.5
-        rows = []
-        
-        for i, value in enumerate(h_projection):
-            if value > threshold:
-                # Add if not too close to previous row
-                if not rows or i - rows[-1] > 10:
-                    rows.append(i)
-        
-        return rows
+        return self._find_boundaries(np.sum(h_lines, axis=1))
     
     def _find_columns(self, v_lines: np.ndarray) -> List[int]:
         """
@@ -269,19 +430,34 @@ class TableDetector:
             List of x-coordinates for column boundaries
         """
         # Sum pixels vertically to find strong vertical lines
-        v_projection = np.sum(v_lines, axis=0)
+        return self._find_boundaries(np.sum(v_lines, axis=0))
+    
+    @staticmethod
+    def _find_boundaries(projection: np.ndarray, min_gap: int = 10) -> List[int]:
+        """
+        Find line positions in a projection profile
         
-        # Find peaks (column boundaries)
-        threshold = np.max(v_projection) * 0.5
-        columns = []
+        Positions above half the strongest line are candidates; the first
+        candidate of each line is kept, and a candidate closer than min_gap
+        to the previously kept one belongs to the same line.
         
-        for i, value in enumerate(v_projection):
-            if value > threshold:
-                # Add if not too close to previous column
-                if not columns or i - columns[-1] > 10:
-                    columns.append(i)
+        Args:
+            projection: Foreground sums per row or column
+            min_gap: Largest distance still counted as the same line
         
-        return columns
+        Returns:
+            List of line coordinates
+        """
+        candidates = np.flatnonzero(projection > np.max(projection) * 0.5)
+        
+        # One jump per kept line, not one step per pixel
+        boundaries = []
+        i = 0
+        while i < len(candidates):
+            boundaries.append(int(candidates[i]))
+            i = np.searchsorted(candidates, candidates[i] + min_gap, side='right')
+        
+        return boundaries
     
     def _extract_cells(
         self,
@@ -300,25 +476,33 @@ class TableDetector:
         Returns:
             List of cell dictionaries with coordinates
         """
-        cells = []
-        offset_x = table_region['x']
-        offset_y = table_region['y']
-        
-        for i in range(len(rows) - 1):
-            for j in range(len(columns) - 1):
-                cell = {
-                    'row': i,
-                    'column': j,
-                    'x': offset_x + columns[j],
-                    'y': offset_y + rows[i],
-                    'width': columns[j + 1] - columns[j],
-                    'height': rows[i + 1] - rows[i]
-                }
-                cells.append(cell)
+        if len(rows) < 2 or len(columns) < 2:
+            return []
+        
+        rows = np.asarray(rows)
+        columns = np.asarray(columns)
+        
+        # Row and column index of every cell, row by row
+        row_index, column_index = np.divmod(np.arange((len(rows) - 1) * (len(columns) - 1)), len(columns) - 1)
+        
+        keys = ('row', 'column', 'x', 'y', 'width', 'height')
+        cells = [dict(zip(keys, values)) for values in zip(
+            row_index.tolist(),
+            column_index.tolist(),
+            (table_region['x'] + columns[column_index]).tolist(),
+            (table_region['y'] + rows[row_index]).tolist(),
+            np.diff(columns)[column_index].tolist(),
+            np.diff(rows)[row_index].tolist()
+        )]
         
         return cells
     
-    def enhance_table_image(self, image_path: str, output_path: Optional[str] = None) -> str:
+    def enhance_table_image(
+        self,
+        image: ImageSource,
+        output_path: Optional[str] = None,
+        profile: Optional[str] = None
+    ) -> Optional[np.ndarray]:
         """
         Enhance image for better table OCR
         
@@ -328,70 +512,121 @@ class TableDetector:
         - Rotation correction (deskew)
         - Border removal
         
+        The 'quality' profile estimates the skew at full resolution and
+        denoises with non-local means; 'fast' estimates the skew on a
+        downscaled copy (the angle does not change with scale), rotates
+        with bilinear interpolation and uses a bilateral filter.
+        
+        The result stays in memory; OCREngine.extract_text_from_image takes
+        the array directly. It is only written to disk if output_path is
+        given, or as a uniquely named copy in DEBUG_IMAGE_DIR if
+        DEBUG_IMAGES is enabled.
+        
         Args:
-            image_path: Input image path
-            output_path: Output path (if None, uses temp file)
+            image: Input image path, or an ImageContext already decoded by the caller
+            output_path: Also save the enhanced image to this file
+            profile: Preprocessing profile (default: the detector's profile)
         
         Returns:
-            Path to enhanced image
+            Enhanced grayscale image, or None if enhancement failed
         """
+        settings = self.PROFILES[self._check_profile(profile or self.profile)]
+        
         try:
-            # Read image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                logger.error(f"Failed to read image: {image_path}")
-                return image_path
-            
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            context = ImageContext.of(image)
+            gray = context.gray
             
             # 1. Deskew (rotation correction)
-            deskewed = self._deskew_image(gray)
+            deskewed = self._deskew_image(
+                gray,
+                sample_size=settings['skew_sample'],
+                interpolation=settings['rotation']
+            )
             
             # 2. Enhance contrast
             enhanced = cv2.equalizeHist(deskewed)
             
             # 3. Denoise
-            denoised = cv2.fastNlMeansDenoising(enhanced, h=10)
+            if settings['denoise'] == 'bilateral':
+                denoised = cv2.bilateralFilter(enhanced, 9, 75, 75)
+            else:
+                denoised = cv2.fastNlMeansDenoising(enhanced, h=10)
             
             # 4. Sharpen
             kernel = np.array([[-1,-1,-1], [-1,9,-1], [-1,-1,-1]])
             sharpened = cv2.filter2D(denoised, -1, kernel)
             
-            # Save enhanced image
-            if output_path is None:
-                output_path = str(Path(image_path).stem) + '_enhanced.png'
-            
-            cv2.imwrite(output_path, sharpened)
-            logger.info(f"Enhanced table image saved: {output_path}")
-            
-            return output_path
+            if output_path is not None:
+                cv2.imwrite(str(output_path), sharpened)
+                logger.info(f"Enhanced table image saved: {output_path}")
+            if DEBUG_IMAGES:
+                self._save_debug_image(context, sharpened, 'enhanced')
             
+            return sharpened
+        
         except Exception as e:
             logger.error(f"Image enhancement failed: {e}")
-            return image_path
+            return None
+    
+    def _save_debug_image(self, context: ImageContext, pixels: np.ndarray, label: str):
+        """
+        Save an intermediate image to DEBUG_IMAGE_DIR
+        
+        Names are unique per call, so concurrent conversions of files with
+        the same name do not overwrite each other.
+        
+        Args:
+            context: Image the pixels were derived from (for the file name)
+            pixels: Image to save
+            label: Processing stage, appended to the file name
+        """
+        try:
+            DEBUG_IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+            stem = Path(context.path or 'image').stem
+            path = DEBUG_IMAGE_DIR / f"{stem}_{uuid.uuid4().hex[:8]}_{label}.png"
+            cv2.imwrite(str(path), pixels)
+            logger.info(f"Debug image saved: {path}")
+        except Exception as e:
+            logger.warning(f"Could not save debug image: {e}")
     
-    def _deskew_image(self, gray_image: np.ndarray) -> np.ndarray:
+    def _deskew_image(
+        self,
+        gray_image: np.ndarray,
+        sample_size: Optional[int] = None,
+        interpolation: int = cv2.INTER_CUBIC
+    ) -> np.ndarray:
         """
         Correct image rotation (deskew)
         
         Args:
             gray_image: Grayscale input image
+            sample_size: Estimate the angle on a copy downscaled to this
+                         longest side (None = full resolution)
+            interpolation: OpenCV interpolation flag for the rotation
         
         Returns:
             Deskewed image
         """
+        sample = gray_image
+        longest = max(gray_image.shape[:2])
+        if sample_size and longest > sample_size:
+            scale = sample_size / longest
+            sample = cv2.resize(gray_image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
         # Apply threshold
-        thresh = cv2.threshold(gray_image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
+        thresh = cv2.threshold(sample, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
         
-        # Find coordinates of all non-zero points
-        coords = np.column_stack(np.where(thresh > 0))
+        # Find coordinates of all non-zero points (int32 (x, y) pairs, a
+        # quarter of the memory of np.column_stack(np.where(...)))
+        coords = cv2.findNonZero(thresh)
         
-        if len(coords) < 100:
+        if coords is None or len(coords) < 100:
             # Not enough points to determine angle
             return gray_image
         
-        # Find minimum area rectangle
-        angle = cv2.minAreaRect(coords)[-1]
+        # Find minimum area rectangle (of (row, column) points, as the
+        # angle correction below expects)
+        angle = cv2.minAreaRect(coords[:, 0, ::-1])[-1]
         
         # Adjust angle (fix: only apply small corrections)
         if angle < -45:
@@ -406,7 +641,7 @@ class TableDetector:
             center = (w // 2, h // 2)
             M = cv2.getRotationMatrix2D(center, angle, 1.0)
             rotated = cv2.warpAffine(gray_image, M, (w, h), 
-                                     flags=cv2.INTER_CUBIC, 
+                                     flags=interpolation, 
                                      borderMode=cv2.BORDER_REPLICATE)
             logger.info(f"Image deskewed by {angle:.2f} degrees")
             return rotated
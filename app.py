@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 import time
 import uuid
+import threading
 from datetime import datetime
 
 from converters import UniversalConverter
@@ -18,7 +19,7 @@ from config import (
     APP_HOST, APP_PORT, DEBUG,
     UPLOAD_FOLDER, OUTPUT_FOLDER, TEMP_FOLDER,
     MAX_FILE_SIZE_BYTES, ALLOWED_EXTENSIONS,
-    SUPPORTED_CONVERSIONS
+    SUPPORTED_CONVERSIONS, PREVIEW_PAGES
 )
 
 # Initialize Flask app
@@ -40,6 +41,60 @@ validator = Validator()
 conversion_tasks = {}
 
 
+def run_conversion(task_id, output_filename, **convert_args):
+    """
+    Run a conversion and record its outcome in conversion_tasks
+    
+    The task entry is updated in place, so a preview_file recorded by
+    preview mode stays available after the full conversion finishes.
+    
+    Args:
+        task_id: Task to update
+        output_filename: Output file name (inside OUTPUT_FOLDER)
+        **convert_args: Arguments for UniversalConverter.convert
+    
+    Returns:
+        ConversionResult
+    """
+    start_time = time.time()
+    try:
+        result = converter.convert(**convert_args)
+    except Exception as e:
+        conversion_tasks[task_id].update({'status': 'failed', 'progress': 0, 'message': str(e)})
+        raise
+    
+    processing_time = time.time() - start_time
+    
+    if result.success:
+        conversion_tasks[task_id].update({
+            'status': 'completed',
+            'progress': 100,
+            'message': 'Conversion completed successfully',
+            'output_file': output_filename,
+            'processing_time': round(processing_time, 2),
+            'quality_score': result.quality_score,
+            'warnings': result.warnings
+        })
+        logger.info(f"Conversion successful: {output_filename}")
+    else:
+        conversion_tasks[task_id].update({
+            'status': 'failed',
+            'progress': 0,
+            'message': result.error
+        })
+        logger.error(f"Conversion failed: {result.error}")
+    
+    return result
+
+
+def run_conversion_in_background(task_id, output_filename, **convert_args):
+    """Thread target for run_conversion (failures are recorded in the task)"""
+    try:
+        run_conversion(task_id, output_filename, **convert_args)
+    except Exception as e:
+        logger.error(f"Background conversion error: {e}", exc_info=True)
+
+
 @app.route('/')
 def index():
     """Render main page"""
@@ -153,6 +208,11 @@ def convert_file():
             # Get output format from form data
             output_format = request.form.get('output_format')
             quality_check = request.form.get('quality_check', 'false').lower() == 'true'
+            use_ocr = request.form.get('use_ocr', 'false').lower() == 'true'
+            use_llm = request.form.get('use_llm', 'false').lower() == 'true'
+            llm_provider = request.form.get('llm_provider', 'auto')
+            preview = request.form.get('preview', 'false').lower() == 'true'
+            preview_pages = request.form.get('preview_pages', PREVIEW_PAGES)
             
             if not output_format:
                 return jsonify({
@@ -179,6 +239,8 @@ def convert_file():
             use_ocr = data.get('use_ocr', False)
             use_llm = data.get('use_llm', False)
             llm_provider = data.get('llm_provider', 'auto')
+            preview = data.get('preview', False)
+            preview_pages = data.get('preview_pages', PREVIEW_PAGES)
             
             if not file_id or not output_format:
                 return jsonify({
@@ -232,10 +294,8 @@ def convert_file():
         if use_ocr:
             logger.info(f"OCR enabled, LLM: {use_llm}, Provider: {llm_provider}")
         
-        # Perform conversion
-        start_time = time.time()
-        result = converter.convert(
-            str(input_file),
+        convert_args = dict(
+            input_file=str(input_file),
             input_format=input_format,
             output_format=output_format,
             output_file=str(output_file),
@@ -245,39 +305,79 @@ def convert_file():
             llm_provider=llm_provider
         )
         
-        processing_time = time.time() - start_time
-        
-        if result.success:
-            conversion_tasks[task_id] = {
-                'status': 'completed',
-                'progress': 100,
-                'message': 'Conversion completed successfully',
-                'output_file': output_filename,
-                'processing_time': round(processing_time, 2),
-                'quality_score': result.quality_score,
-                'warnings': result.warnings
-            }
+        if preview and input_format == 'pdf':
+            # Preview mode: convert the first pages now, the full document in the background
+            try:
+                preview_pages = max(1, int(preview_pages))
+            except (TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid preview_pages'
+                }), 400
+            
+            preview_filename = f"{output_file.stem}_preview{output_file.suffix}"
+            start_time = time.time()
+            preview_result = converter.convert(**{
+                **convert_args,
+                'output_file': str(output_file.with_name(preview_filename)),
+                'quality_check': False,
+                'pages': f"1-{preview_pages}"
+            })
+            preview_time = time.time() - start_time
+            
+            if not preview_result.success:
+                conversion_tasks[task_id] = {
+                    'status': 'failed',
+                    'progress': 0,
+                    'message': preview_result.error
+                }
+                logger.error(f"Preview conversion failed: {preview_result.error}")
+                return jsonify({
+                    'success': False,
+                    'task_id': task_id,
+                    'error': preview_result.error
+                }), 500
+            
+            conversion_tasks[task_id].update({
+                'message': 'Preview ready, converting full document...',
+                'preview_file': preview_filename
+            })
+            threading.Thread(
+                target=run_conversion_in_background,
+                args=(task_id, output_filename),
+                kwargs=convert_args,
+                daemon=True
+            ).start()
             
-            logger.info(f"Conversion successful: {output_filename}")
+            logger.info(f"Preview ready: {preview_filename}, full conversion continues (task {task_id})")
             
             return jsonify({
                 'success': True,
                 'task_id': task_id,
+                'status': 'processing',
+                'preview_file': preview_filename,
+                'preview_pages': preview_result.metadata.get('pages_converted'),
+                'total_pages': preview_result.metadata.get('pages'),
                 'output_file': output_filename,
                 'output_format': output_format,
-                'processing_time': round(processing_time, 2),
+                'processing_time': round(preview_time, 2),
+                'warnings': preview_result.warnings
+            })
+        
+        # Perform conversion
+        result = run_conversion(task_id, output_filename, **convert_args)
+        
+        if result.success:
+            return jsonify({
+                'success': True,
+                'task_id': task_id,
+                'output_file': output_filename,
+                'output_format': output_format,
+                'processing_time': conversion_tasks[task_id]['processing_time'],
                 'quality_score': result.quality_score,
                 'warnings': result.warnings
             })
         else:
-            conversion_tasks[task_id] = {
-                'status': 'failed',
-                'progress': 0,
-                'message': result.error
-            }
-            
-            logger.error(f"Conversion failed: {result.error}")
-            
             return jsonify({
                 'success': False,
                 'task_id': task_id,
@@ -0,0 +1,80 @@
+"""
+Benchmark: filling DOCX tables
+
+Times a large table written cell by cell through python-docx's proxies
+(table.rows[i].cells[j].text, as the converters did) against the one-pass
+builder utils.docx_tables.add_table, including saving the document.
+
+Every cells[j] access walks the whole table, so cell-by-cell filling grows
+with the square of the table size; it is timed on the first --legacy-rows
+rows only (a 2,000-row table takes hours that way).
+
+Usage:
+    python benchmark_docx_tables.py [--rows 2000] [--cols 6] [--legacy-rows 200]
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+from docx import Document
+
+from utils.docx_tables import add_table
+
+sys.path.insert(0, str(Path(__file__).parent / 'tests'))
+from test_docx_tables import legacy_add_table  # noqa: E402
+
+
+def make_rows(num_rows: int, num_cols: int):
+    """Header row plus data rows"""
+    rows = [[f'Column {j + 1}' for j in range(num_cols)]]
+    for i in range(num_rows):
+        rows.append([f'R{i}C{j} {i * j % 97}.{j}' for j in range(num_cols)])
+    return rows
+
+
+def time_table(func, rows):
+    """Fill and save one table; returns (fill seconds, total seconds, cell texts)"""
+    doc = Document()
+    start = time.perf_counter()
+    func(doc, rows, header_rows=1)
+    fill = time.perf_counter() - start
+    doc.save(io.BytesIO())
+    total = time.perf_counter() - start
+    return fill, total, [cell.text for cell in doc.tables[0]._cells]
+
+
+def run_benchmark(num_rows: int, num_cols: int, legacy_rows: int):
+    rows = make_rows(num_rows, num_cols)
+    legacy_rows = min(legacy_rows, num_rows)
+    
+    print("=" * 60)
+    print("DOCX TABLE BENCHMARK")
+    print(f"Rows: {num_rows} + header, columns: {num_cols}")
+    print("=" * 60)
+    
+    results = {}
+    for name, func, size in [
+        ('cell-by-cell', legacy_add_table, legacy_rows),
+        ('bulk', add_table, legacy_rows),
+        ('bulk', add_table, num_rows),
+    ]:
+        results[(name, size)] = time_table(func, rows[:size + 1])
+        fill, total, _ = results[(name, size)]
+        print(f"  {name:<13} {size:>6} rows  fill {fill * 1000:>10.1f} ms   fill + save {total * 1000:>10.1f} ms")
+    
+    legacy = results[('cell-by-cell', legacy_rows)]
+    bulk = results[('bulk', legacy_rows)]
+    print(f"\n  Speedup at {legacy_rows} rows: {legacy[1] / bulk[1]:.0f}x")
+    print(f"  Identical cell text: {legacy[2] == bulk[2]}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark DOCX table filling')
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--cols', type=int, default=6)
+    parser.add_argument('--legacy-rows', type=int, default=200)
+    args = parser.parse_args()
+    
+    run_benchmark(args.rows, args.cols, args.legacy_rows)
@@ -0,0 +1,77 @@
+"""
+Benchmark: per-page OCR latency of the available OCR backends
+
+Renders synthetic text pages and runs each backend on them. pytesseract
+starts a tesseract process (and reloads the language data) for every page;
+tesserocr keeps a warm engine in-process, so only the first page pays the
+startup cost.
+
+Usage:
+    python benchmark_ocr_backends.py [--pages 20] [--lang eng] [--zoom 2] [--config "--oem 3 --psm 6"]
+"""
+import argparse
+import statistics
+import time
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from ai.ocr_backends import BACKENDS
+
+
+def render_pages(num_pages: int, zoom: float):
+    """Render pages with a heading and a few lines of text"""
+    doc = fitz.open()
+    images = []
+    for page_num in range(num_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {page_num + 1}", fontsize=18)
+        for i in range(15):
+            page.insert_text((72, 110 + i * 18), f"Line {i} of page {page_num + 1}: the quick brown fox jumps.", fontsize=11)
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        images.append(Image.frombytes("RGB", [pix.width, pix.height], pix.samples))
+    doc.close()
+    return images
+
+
+def run_benchmark(num_pages: int, lang: str, zoom: float, config: str):
+    images = render_pages(num_pages, zoom)
+    
+    print("=" * 60)
+    print("OCR BACKEND BENCHMARK: per-page latency")
+    print(f"Pages: {num_pages}, language: {lang}, zoom: {zoom}x, config: '{config}'")
+    print("=" * 60)
+    print(f"\n  {'Backend':<12} | {'First (ms)':>10} | {'Median (ms)':>11} | {'Mean (ms)':>9} | {'Words':>6}")
+    print(f"  {'-' * 12}-+-{'-' * 10}-+-{'-' * 11}-+-{'-' * 9}-+-{'-' * 6}")
+    
+    for name, backend_class in BACKENDS.items():
+        backend = backend_class()
+        if not backend.is_available() or not backend.supports_language(lang):
+            print(f"  {name:<12} | not available")
+            continue
+        
+        timings = []
+        words = 0
+        for image in images:
+            start = time.perf_counter()
+            result = backend.ocr(image, lang=lang, config=config)
+            timings.append((time.perf_counter() - start) * 1000)
+            words += result.word_count
+        
+        # First page includes engine startup for in-process backends
+        rest = timings[1:] or timings
+        print(f"  {name:<12} | {timings[0]:>10.1f} | {statistics.median(rest):>11.1f} | "
+              f"{statistics.mean(rest):>9.1f} | {words:>6}")
+    
+    print("\n  Median/mean exclude the first page (engine warm-up).")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark OCR backends')
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--lang', default='eng')
+    parser.add_argument('--zoom', type=float, default=2)
+    parser.add_argument('--config', default='--oem 3 --psm 6')
+    args = parser.parse_args()
+    
+    run_benchmark(args.pages, args.lang, args.zoom, args.config)
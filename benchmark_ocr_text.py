@@ -0,0 +1,85 @@
+"""
+Benchmark: OCR text cleanup on a long OCR dump
+
+Builds a synthetic OCR dump (page markers, repeated running headers,
+paragraphs with ragged whitespace, table rules, page numbers) and times the
+shared utils.ocr_text passes against the implementations they replaced
+(kept in the tests) on growing prefixes of the dump, so the time per page
+shows whether each pass scales linearly.
+
+Usage:
+    python benchmark_ocr_text.py [--pages 1000] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+from utils.ocr_text import join_ocr_paragraphs, strip_ocr_noise, normalize_whitespace
+
+sys.path.insert(0, str(Path(__file__).parent / 'tests'))
+from test_ocr_text import (  # noqa: E402
+    legacy_join_ocr_paragraphs, legacy_strip_ocr_noise, legacy_normalize_whitespace
+)
+
+WORDS = [
+    'the', 'finite', 'element', 'method', 'solves', 'Poisson', 'equation', 'with', 'boundary',
+    'conditions', 'on', 'a', 'triangular', 'mesh', 'node', 'value', 'u(x)', '|', 'weak', 'form',
+]
+
+
+def make_page(rng: random.Random, page_num: int) -> str:
+    """One page of OCR output"""
+    lines = [f"=== Page {page_num} ===", "Solving the 2d Poisson Equation using the FEM and a CG Method", ""]
+    for _ in range(rng.randint(4, 8)):
+        for _ in range(rng.randint(3, 8)):
+            words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+            lines.append(rng.choice(['', ' ', '  ']) + words + rng.choice(['', '  ', '\t']))
+        if rng.random() < 0.2:
+            lines.append('|----|----|')
+        lines.append(rng.choice(['', '', '   ', '\n']))
+    lines.extend([str(page_num), ''])
+    return '\n'.join(lines)
+
+
+def run_benchmark(num_pages: int, seed: int):
+    rng = random.Random(seed)
+    pages = [make_page(rng, i + 1) for i in range(num_pages)]
+    sizes = sorted({max(1, num_pages // 8), max(1, num_pages // 4), max(1, num_pages // 2), num_pages})
+    
+    passes = [
+        ('paragraphs', join_ocr_paragraphs, legacy_join_ocr_paragraphs),
+        ('llm noise', strip_ocr_noise, legacy_strip_ocr_noise),
+        ('whitespace', normalize_whitespace, legacy_normalize_whitespace),
+    ]
+    
+    print("=" * 72)
+    print("OCR TEXT CLEANUP BENCHMARK")
+    print(f"Pages: {num_pages}, dump size: {len(chr(10).join(pages)) / 1024 / 1024:.1f} MB")
+    print("=" * 72)
+    print(f"  {'pass':<11} {'pages':>6} {'legacy ms':>11} {'new ms':>9} {'new us/page':>12} {'speedup':>8}  same")
+    
+    for name, new, old in passes:
+        for size in sizes:
+            dump = '\n\n'.join(pages[:size])
+            
+            start = time.perf_counter()
+            expected = old(dump)
+            old_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            result = new(dump)
+            new_time = time.perf_counter() - start
+            
+            print(f"  {name:<11} {size:>6} {old_time * 1000:>11.1f} {new_time * 1000:>9.1f} "
+                  f"{new_time / size * 1e6:>12.1f} {old_time / new_time:>7.1f}x  {result == expected}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark OCR text cleanup')
+    parser.add_argument('--pages', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    run_benchmark(args.pages, args.seed)
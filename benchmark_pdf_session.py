@@ -0,0 +1,86 @@
+"""
+Benchmark: PDF conversion wall time vs. page count
+
+Generates synthetic PDFs (text + one ruled table per page) of increasing size
+and times the text-layer PDF paths. With the shared PDFDocumentSession the
+time per page should stay roughly flat, i.e. total time grows linearly.
+
+Usage:
+    python benchmark_pdf_session.py [--pages 25 50 100 200] [--formats md docx html] [--workers N]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from converters.pdf_converter import PDFConverter
+
+
+def create_benchmark_pdf(path: str, num_pages: int):
+    """Create a PDF with a heading, some paragraphs and a ruled table on every page"""
+    doc = fitz.open()
+    for page_num in range(num_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {page_num + 1}", fontsize=18)
+        y = 110
+        for i in range(12):
+            page.insert_text((72, y), f"Paragraph line {i} of page {page_num + 1} with some filler text.", fontsize=11)
+            y += 16
+        
+        # 4x3 ruled table
+        x0, y0 = 72, y + 30
+        rows, cols = 4, 3
+        for r in range(rows + 1):
+            page.draw_line((x0, y0 + r * 20), (x0 + cols * 120, y0 + r * 20))
+        for c in range(cols + 1):
+            page.draw_line((x0 + c * 120, y0), (x0 + c * 120, y0 + rows * 20))
+        for r in range(rows):
+            for c in range(cols):
+                page.insert_text((x0 + c * 120 + 5, y0 + r * 20 + 14), f"R{r}C{c}", fontsize=10)
+    doc.save(path)
+    doc.close()
+
+
+def run_benchmark(page_counts, formats, workers=1):
+    converter = PDFConverter()
+    
+    print("=" * 60)
+    print("PDF SESSION BENCHMARK: wall time vs. page count")
+    print(f"Workers: {workers}")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fmt in formats:
+            print(f"\n📄 PDF -> {fmt}")
+            print(f"  {'Pages':>6} | {'Total (s)':>10} | {'ms/page':>8}")
+            print(f"  {'-' * 6}-+-{'-' * 10}-+-{'-' * 8}")
+            
+            for num_pages in page_counts:
+                pdf_path = str(Path(tmp_dir) / f"bench_{num_pages}.pdf")
+                if not Path(pdf_path).exists():
+                    create_benchmark_pdf(pdf_path, num_pages)
+                output_path = str(Path(tmp_dir) / f"bench_{num_pages}.{fmt}")
+                
+                start = time.perf_counter()
+                result = converter.convert(pdf_path, output_path, workers=workers)
+                elapsed = time.perf_counter() - start
+                
+                if not result.success:
+                    print(f"  {num_pages:>6} | failed: {result.error}")
+                    continue
+                
+                print(f"  {num_pages:>6} | {elapsed:>10.2f} | {elapsed / num_pages * 1000:>8.1f}")
+    
+    print("\n  A flat ms/page column means wall time grows linearly with page count.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark PDF conversion scaling')
+    parser.add_argument('--pages', type=int, nargs='+', default=[25, 50, 100, 200])
+    parser.add_argument('--formats', nargs='+', default=['md', 'docx', 'html'])
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes (0 = one per CPU core)')
+    args = parser.parse_args()
+    
+    run_benchmark(args.pages, args.formats, args.workers)
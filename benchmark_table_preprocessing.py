@@ -0,0 +1,98 @@
+"""
+Benchmark: table image preprocessing profiles
+
+Runs the deskew step and the whole TableDetector.enhance_table_image with
+every preprocessing profile on a synthetic skewed table scan (or --image)
+and reports latency, peak memory and how far each result is from the
+'quality' output.
+
+Peak memory is measured with tracemalloc, which sees numpy arrays and
+OpenCV's output buffers but not OpenCV's internal scratch memory.
+
+Usage:
+    python benchmark_table_preprocessing.py [--width 4000] [--height 3000] [--angle 2] [--image photo.jpg]
+"""
+import argparse
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from ai.image_context import ImageContext
+from ai.table_detector import TableDetector
+
+
+def make_scan(width: int, height: int, angle: float, rows: int = 20, cols: int = 6) -> np.ndarray:
+    """Grayscale photo of a ruled table, rotated by angle degrees, with sensor noise"""
+    image = np.full((height, width), 235, np.uint8)
+    x0, y0, x1, y1 = width // 12, height // 10, width - width // 12, height - height // 10
+    scale = width / 2000
+    
+    for i in range(rows + 1):
+        y = y0 + (y1 - y0) * i // rows
+        cv2.line(image, (x0, y), (x1, y), 20, max(1, int(2 * scale)))
+    for j in range(cols + 1):
+        x = x0 + (x1 - x0) * j // cols
+        cv2.line(image, (x, y0), (x, y1), 20, max(1, int(2 * scale)))
+    for i in range(rows):
+        for j in range(cols):
+            origin = (x0 + (x1 - x0) * j // cols + int(20 * scale), y0 + (y1 - y0) * (i + 1) // rows - int(15 * scale))
+            cv2.putText(image, f"R{i}C{j} {i * j % 97}.{j}", origin,
+                        cv2.FONT_HERSHEY_SIMPLEX, scale, 30, max(1, int(2.5 * scale)))
+    
+    center = (width / 2, height / 2)
+    image = cv2.warpAffine(image, cv2.getRotationMatrix2D(center, angle, 1.0), (width, height), borderValue=235)
+    noise = np.random.default_rng(0).normal(0, 12, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+def measure(func):
+    """Run func once; returns (result, seconds, peak traced bytes)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def run_benchmark(gray: np.ndarray):
+    detector = TableDetector()
+    
+    print("=" * 72)
+    print("TABLE PREPROCESSING BENCHMARK")
+    print(f"Image: {gray.shape[1]}x{gray.shape[0]} ({gray.size / 1e6:.1f} MP)")
+    print("=" * 72)
+    print(f"  {'profile':<9} {'step':<9} {'latency':>12} {'peak memory':>14} {'mean |diff| vs quality':>24}")
+    
+    outputs = {}
+    for profile, settings in detector.PROFILES.items():
+        for step in ('deskew', 'enhance'):
+            if step == 'deskew':
+                func = lambda: detector._deskew_image(gray, settings['skew_sample'], settings['rotation'])
+            else:
+                func = lambda: detector.enhance_table_image(ImageContext.from_array(gray), profile=profile)
+            
+            result, seconds, peak = measure(func)
+            outputs[(profile, step)] = result
+            
+            reference = outputs[('quality', step)]
+            diff = np.abs(result.astype(np.int16) - reference).mean()
+            print(f"  {profile:<9} {step:<9} {seconds * 1000:>9.0f} ms {peak / 1e6:>11.1f} MB {diff:>24.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark table image preprocessing profiles')
+    parser.add_argument('--width', type=int, default=4000)
+    parser.add_argument('--height', type=int, default=3000)
+    parser.add_argument('--angle', type=float, default=2.0)
+    parser.add_argument('--image', help='Benchmark this image instead of a synthetic scan')
+    args = parser.parse_args()
+    
+    if args.image:
+        source = np.array(ImageContext.load(args.image).gray)
+    else:
+        source = make_scan(args.width, args.height, args.angle)
+    run_benchmark(source)
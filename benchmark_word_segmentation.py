@@ -0,0 +1,87 @@
+"""
+Benchmark: concatenated-word repair throughput and accuracy
+
+Times the lexicon-based segmenter against the previous approach (one
+case-insensitive re.sub per common word) on the layout text of
+test_comprehensive.pdf, and checks how many run-together word pairs each
+one repairs.
+
+Usage:
+    python benchmark_word_segmentation.py [--pdf test_comprehensive.pdf] [--repeat 50]
+"""
+import argparse
+import random
+import re
+import time
+
+import pdfplumber
+
+from utils.word_segmenter import WordSegmenter, segment_words
+
+PREVIOUS_COMMON_WORDS = [
+    'the', 'and', 'for', 'with', 'from', 'that', 'this', 'such',
+    'given', 'find', 'using', 'where', 'which', 'each', 'also',
+    'into', 'over', 'then', 'when', 'have', 'been', 'will', 'would',
+    'could', 'should', 'must', 'function', 'domain', 'source',
+    'equation', 'boundary', 'condition', 'method', 'element',
+    'finite', 'described', 'strong', 'form', 'unknown', 'potential',
+    'temperature', 'heat', 'problem', 'requires', 'twice',
+    'differentiate', 'restrictive', 'difficult', 'computationally',
+    'notation', 'inner', 'product', 'goal', 'on', 'is', 'by', 'to',
+    'an', 'or', 'be', 'as', 'at', 'if', 'of', 'in', 'it'
+]
+
+
+def previous_split(text: str) -> str:
+    """The word-list approach that segment_words replaced"""
+    for word in PREVIOUS_COMMON_WORDS:
+        text = re.sub(rf'([a-z])({word})([a-z])', r'\1 \2 \3', text, flags=re.IGNORECASE)
+    return re.sub(r' +', ' ', text)
+
+
+def load_text(pdf_path: str) -> str:
+    with pdfplumber.open(pdf_path) as pdf:
+        return '\n'.join(page.extract_text() or '' for page in pdf.pages)
+
+
+def make_concatenations(num: int, seed: int = 0):
+    """Pairs of common lexicon words glued together"""
+    rng = random.Random(seed)
+    words = [w for w in WordSegmenter._load_lexicon('en')[:5000] if len(w) > 2]
+    return [(rng.choice(words), rng.choice(words)) for _ in range(num)]
+
+
+def run_benchmark(pdf_path: str, repeat: int):
+    text = load_text(pdf_path)
+    segment_words('warm up')  # load the lexicon outside the timing
+    
+    print("=" * 60)
+    print("WORD SEGMENTATION BENCHMARK")
+    print(f"Input: {pdf_path} ({len(text)} characters) x {repeat}")
+    print("=" * 60)
+    
+    timings = {}
+    for name, func in [('previous', previous_split), ('lexicon', segment_words)]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(text)
+        timings[name] = time.perf_counter() - start
+        print(f"  {name:<9} {timings[name] * 1000:>9.1f} ms  "
+              f"{len(text) * repeat / timings[name] / 1e6:>6.2f} MB/s")
+    print(f"\n  Speedup: {timings['previous'] / timings['lexicon']:.2f}x")
+    
+    pairs = make_concatenations(1000)
+    for name, func in [('previous', previous_split), ('lexicon', segment_words)]:
+        repaired = sum(func(a + b) == f"{a} {b}" for a, b in pairs)
+        unchanged = sum(func(w) == w for w in text.split())
+        print(f"  {name:<9} repaired {repaired}/{len(pairs)} glued pairs, "
+              f"left {unchanged}/{len(text.split())} PDF words intact")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark concatenated-word repair')
+    parser.add_argument('--pdf', default='test_comprehensive.pdf')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+    
+    run_benchmark(args.pdf, args.repeat)
@@ -0,0 +1,71 @@
+"""
+Benchmark: word spacing repair throughput
+
+Builds a large set of synthetic text blocks (slide-deck style: glued words,
+camelCase, punctuation without spaces) and times fix_word_spacing against
+the original pass-per-pattern implementation kept in the tests.
+
+Usage:
+    python benchmark_word_spacing.py [--blocks 20000] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+from utils.word_spacing import fix_word_spacing
+
+sys.path.insert(0, str(Path(__file__).parent / 'tests'))
+from test_word_spacing import legacy_fix_word_spacing  # noqa: E402
+
+WORDS = [
+    'element', 'boundary', 'condition', 'Method', 'domain', 'Heat', 'equation', 'the', 'and',
+    'source', 'function', 'with', 'from', 'potential', 'temperature', 'Finite', 'weak', 'form',
+    'solution', 'problem', 'integral', 'mesh', 'node', 'Galerkin', 'x', 'u(x)', '[0,1]',
+]
+
+
+def make_blocks(num_blocks: int, seed: int):
+    """Create text blocks where some words are glued together"""
+    rng = random.Random(seed)
+    blocks = []
+    for _ in range(num_blocks):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(5, 40))]
+        parts = []
+        for word in words:
+            parts.append(word)
+            parts.append(rng.choice([' ', ' ', ' ', '', '.', ',', ':', '  ']))
+        blocks.append(''.join(parts))
+    return blocks
+
+
+def run_benchmark(num_blocks: int, seed: int):
+    blocks = make_blocks(num_blocks, seed)
+    total_chars = sum(len(block) for block in blocks)
+    
+    print("=" * 60)
+    print("WORD SPACING BENCHMARK")
+    print(f"Blocks: {num_blocks}, characters: {total_chars}")
+    print("=" * 60)
+    
+    timings = {}
+    outputs = {}
+    for name, func in [('legacy', legacy_fix_word_spacing), ('fused', fix_word_spacing)]:
+        start = time.perf_counter()
+        outputs[name] = [func(block) for block in blocks]
+        timings[name] = time.perf_counter() - start
+        print(f"  {name:<8} {timings[name] * 1000:>9.1f} ms  "
+              f"{num_blocks / timings[name]:>10.0f} blocks/s  {total_chars / timings[name] / 1e6:>6.2f} MB/s")
+    
+    print(f"\n  Speedup: {timings['legacy'] / timings['fused']:.2f}x")
+    print(f"  Identical output: {outputs['legacy'] == outputs['fused']}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark word spacing repair')
+    parser.add_argument('--blocks', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    run_benchmark(args.blocks, args.seed)
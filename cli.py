@@ -31,6 +31,8 @@ def main():
   # OCR modu ile PDF dönüştürme (sunum PDF'leri için önerilen)
   python cli.py convert presentation.pdf --to markdown --ocr
   python cli.py convert presentation.pdf --to docx --ocr --ocr-lang tur
+  python cli.py convert mixed.pdf --to markdown --ocr-auto
+  python cli.py convert slides.pdf --to markdown --geometry
   
   # LLM ile gelişmiş dönüştürme (en yüksek kalite!)
   python cli.py convert math_doc.pdf --to markdown --ocr --llm
@@ -63,6 +65,30 @@ def main():
     convert_parser.add_argument('--ocr', action='store_true', help='OCR modu kullan (sunum PDF\'leri için önerilen)')
     convert_parser.add_argument('--ocr-lang', default='eng', help='OCR dili (örn: eng, tur, deu). Varsayılan: eng')
     convert_parser.add_argument('--ocr-dpi', type=int, default=2, help='OCR çözünürlük çarpanı (1-4). Varsayılan: 2')
+    convert_parser.add_argument('--ocr-auto', action='store_true',
+                               help='Sayfa bazında otomatik OCR (yalnızca metin katmanı olmayan sayfalar OCR\'lanır)')
+    convert_parser.add_argument('--geometry', action='store_true',
+                               help='Kelime boşluklarını karakter konumlarından yeniden oluştur (bitişik kelimeler için OCR\'dan hızlı)')
+    convert_parser.add_argument('--pages', default=None,
+                               help='Yalnızca bu PDF sayfalarını dönüştür (örn: 1-5,10). Varsayılan: tüm sayfalar')
+    
+    # Output image options (DOCX)
+    convert_parser.add_argument('--image-dpi', type=int, default=None,
+                               help='DOCX görselleri için en yüksek çözünürlük (0 = küçültme yok). Varsayılan: 220')
+    convert_parser.add_argument('--image-quality', type=int, default=None,
+                               help='Yeniden sıkıştırılan JPEG görsellerin kalitesi (1-95). Varsayılan: 85')
+    convert_parser.add_argument('--keep-images', action='store_true',
+                               help='Görselleri orijinal haliyle göm (küçültme/sıkıştırma yapma)')
+    
+    # Performance options
+    convert_parser.add_argument('--workers', type=int, default=None,
+                               help='Sayfa-paralel PDF dönüşümü için işlemci sayısı (0 = tüm çekirdekler). Varsayılan: 1')
+    convert_parser.add_argument('--ocr-workers', type=int, default=None,
+                               help='OCR için paralel işlemci sayısı (0 = tüm çekirdekler). Varsayılan: 1')
+    convert_parser.add_argument('--table-profile', default=None, choices=['quality', 'fast'],
+                               help='Görsellerdeki tablolar için ön işleme: quality (yavaş) veya fast (büyük fotoğraflar için). Varsayılan: quality')
+    convert_parser.add_argument('--table-cells', action='store_true',
+                               help='Görsellerdeki çizgili tabloları hücre hücre oku (tablo başına tek OCR)')
     
     # LLM options
     convert_parser.add_argument('--llm', action='store_true', help='LLM post-processing kullan (en yüksek kalite)')
@@ -122,6 +148,43 @@ def convert_file(args):
         options['ocr_lang'] = getattr(args, 'ocr_lang', 'eng')
         options['ocr_dpi'] = getattr(args, 'ocr_dpi', 2)
         logger.info(f"OCR modu aktif - Dil: {options['ocr_lang']}, DPI: {options['ocr_dpi']}x")
+    elif getattr(args, 'ocr_auto', False):
+        options['use_ocr'] = 'auto'
+        options['ocr_lang'] = getattr(args, 'ocr_lang', 'eng')
+        options['ocr_dpi'] = getattr(args, 'ocr_dpi', 2)
+        logger.info(f"Otomatik OCR modu - Dil: {options['ocr_lang']}, DPI: {options['ocr_dpi']}x")
+    
+    # Word spacing from glyph positions
+    if getattr(args, 'geometry', False):
+        options['extraction'] = 'geometry'
+        logger.info("Geometri modu - kelime boşlukları karakter konumlarından")
+    
+    # Page selection
+    if getattr(args, 'pages', None):
+        options['pages'] = args.pages
+        logger.info(f"Sayfa seçimi: {args.pages}")
+    
+    # Output image policy
+    if getattr(args, 'keep_images', False):
+        options['optimize_images'] = False
+    if getattr(args, 'image_dpi', None) is not None:
+        options['image_max_dpi'] = args.image_dpi
+    if getattr(args, 'image_quality', None) is not None:
+        options['image_quality'] = args.image_quality
+    
+    # Page-parallel PDF conversion
+    if getattr(args, 'workers', None) is not None:
+        options['workers'] = args.workers
+        logger.info(f"Sayfa-paralel dönüşüm - Worker sayısı: {args.workers}")
+    if getattr(args, 'ocr_workers', None) is not None:
+        options['ocr_workers'] = args.ocr_workers
+        logger.info(f"Paralel OCR - Worker sayısı: {args.ocr_workers}")
+    if getattr(args, 'table_profile', None):
+        options['table_profile'] = args.table_profile
+        logger.info(f"Tablo ön işleme profili: {args.table_profile}")
+    if getattr(args, 'table_cells', False):
+        options['table_cells'] = True
+        logger.info("Tablo hücreleri ızgaradan okunuyor")
     
     # LLM options
     if hasattr(args, 'llm') and args.llm:
@@ -267,7 +330,7 @@ def check_llm_providers():
         print("     1. https://makersuite.google.com/app/apikey adresinden API key al")
         print("     2. GOOGLE_API_KEY ortam değişkenini ayarla")
         print("     3. pip install google-generativeai\n")
-        
+    
     except ImportError as e:
         print(f"  ⚠️  LLM modülü yüklenemedi: {e}")
         print("     Gerekli paketleri yükleyin: pip install requests")
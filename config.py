@@ -49,6 +49,50 @@ DEFAULT_DPI = int(os.getenv('DEFAULT_DPI', 300))
 OCR_LANGUAGE = os.getenv('OCR_LANGUAGE', 'tur+eng')
 ENABLE_AI_QUALITY_CHECK = os.getenv('ENABLE_AI_QUALITY_CHECK', 'True').lower() == 'true'
 
+# Page-parallel PDF conversion (worker processes, 1 = serial, 0 = one per CPU core)
+PDF_WORKERS = int(os.getenv('PDF_WORKERS', 1))
+
+# OCR worker pool for scanned PDFs (worker processes, 1 = serial, 0 = one per CPU core)
+OCR_WORKERS = int(os.getenv('OCR_WORKERS', 1))
+
+# OCR backend: 'auto' (tesserocr if installed, else pytesseract), 'tesserocr' or 'pytesseract'
+OCR_BACKEND = os.getenv('OCR_BACKEND', 'auto')
+
+# OCR result cache (skips Tesseract when the same page/image is converted again)
+OCR_CACHE_ENABLED = os.getenv('OCR_CACHE_ENABLED', 'True').lower() == 'true'
+OCR_CACHE_DIR = TEMP_FOLDER / os.getenv('OCR_CACHE_DIR', 'ocr_cache')
+OCR_CACHE_MAX_MB = int(os.getenv('OCR_CACHE_MAX_MB', 256))
+
+# Rendered page cache for OCR (skips rasterization when a PDF is OCR'd again);
+# only pages slower to render than RASTER_CACHE_MIN_RENDER_MS are stored
+RASTER_CACHE_ENABLED = os.getenv('RASTER_CACHE_ENABLED', 'True').lower() == 'true'
+RASTER_CACHE_DIR = TEMP_FOLDER / os.getenv('RASTER_CACHE_DIR', 'raster_cache')
+RASTER_CACHE_MAX_MB = int(os.getenv('RASTER_CACHE_MAX_MB', 512))
+RASTER_CACHE_MIN_RENDER_MS = int(os.getenv('RASTER_CACHE_MIN_RENDER_MS', 50))
+
+# Table image preprocessing before OCR: 'quality' (skew estimated at full
+# resolution, non-local means denoising) or 'fast' (skew estimated on a
+# downscaled copy, bilateral filter; for large photos)
+TABLE_PREPROCESS_PROFILE = os.getenv('TABLE_PREPROCESS_PROFILE', 'quality')
+
+# Table detection runs on the first pyramid level (image halved until its
+# longest side fits) not larger than this (0 = full resolution); regions are
+# mapped back to full resolution
+TABLE_DETECT_MAX_SIDE = int(os.getenv('TABLE_DETECT_MAX_SIDE', 1200))
+
+# Debug copies of intermediate images (e.g. enhanced tables before OCR); off by
+# default so conversions never write scratch images
+DEBUG_IMAGES = os.getenv('DEBUG_IMAGES', 'False').lower() == 'true'
+DEBUG_IMAGE_DIR = TEMP_FOLDER / os.getenv('DEBUG_IMAGE_DIR', 'debug_images')
+
+# Images embedded in DOCX output are downsampled to this resolution at their
+# display size and photos are re-encoded as JPEG with this quality
+IMAGE_MAX_DPI = int(os.getenv('IMAGE_MAX_DPI', 220))
+IMAGE_JPEG_QUALITY = int(os.getenv('IMAGE_JPEG_QUALITY', 85))
+
+# Web preview: number of leading PDF pages converted before the full document
+PREVIEW_PAGES = int(os.getenv('PREVIEW_PAGES', 3))
+
 # Tesseract OCR Path
 TESSERACT_CMD = os.getenv('TESSERACT_CMD', '')
 
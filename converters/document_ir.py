@@ -0,0 +1,282 @@
+"""
+Document IR - format-neutral intermediate representation of a PDF
+
+A PDF is parsed once into pages of text blocks (lines of styled spans),
+image blocks and tables; the Markdown, HTML and DOCX renderers all work
+from this representation, so converting one file to several formats does
+not repeat the extraction.
+"""
+import json
+import statistics
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional, Tuple, Union, Dict, Any
+
+import fitz  # PyMuPDF
+
+from converters.pdf_session import PDFDocumentSession
+
+# PyMuPDF span flags
+FLAG_ITALIC = 1 << 1
+FLAG_BOLD = 1 << 4
+
+MONOSPACE_FONTS = ('courier', 'mono', 'consolas', 'menlo')
+
+# Text dicts without image blocks (those would carry every image's pixels)
+DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+RAWDICT_FLAGS = fitz.TEXTFLAGS_RAWDICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Geometry mode: a gap between two glyphs is a word boundary if it is this
+# much (in font-size units) wider than the typical glyph gap of its line.
+# MuPDF itself only inserts spaces for gaps of roughly 0.15 em and more.
+WORD_GAP_RATIO = 0.06
+
+BBox = Tuple[float, float, float, float]
+
+
+@dataclass
+class Span:
+    """Run of text with one font"""
+    text: str
+    size: float = 12
+    flags: int = 0
+    font: str = ''
+    
+    @property
+    def bold(self) -> bool:
+        return bool(self.flags & FLAG_BOLD)
+    
+    @property
+    def italic(self) -> bool:
+        return bool(self.flags & FLAG_ITALIC)
+    
+    @property
+    def monospace(self) -> bool:
+        font_name = self.font.lower()
+        return any(mono in font_name for mono in MONOSPACE_FONTS)
+
+
+@dataclass
+class Line:
+    """Line of spans"""
+    spans: List[Span] = field(default_factory=list)
+
+
+@dataclass
+class TextBlock:
+    """Block of lines"""
+    bbox: BBox
+    lines: List[Line] = field(default_factory=list)
+    type: str = 'text'
+
+
+@dataclass
+class ImageBlock:
+    """Image placement (pixels are read from the PDF on demand via xref)"""
+    bbox: BBox
+    xref: Optional[int] = None
+    type: str = 'image'
+
+
+@dataclass
+class Table:
+    """Table found on a page"""
+    bbox: BBox
+    rows: List[List[Optional[str]]]
+
+
+Block = Union[TextBlock, ImageBlock]
+
+
+@dataclass
+class PageIR:
+    """One page: blocks in reading order, tables and layout text"""
+    number: int  # 0-based
+    width: float
+    height: float
+    blocks: List[Block] = field(default_factory=list)
+    tables: List[Table] = field(default_factory=list)
+    layout_text: Optional[str] = None  # pdfplumber layout text (HTML renderer)
+    table_error: Optional[str] = None
+    tables_skipped: bool = False  # no ruling lines, table finder not run
+    geometry: bool = False  # word spaces rebuilt from glyph positions
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PageIR':
+        blocks = []
+        for block in data.get('blocks', []):
+            if block.get('type') == 'image':
+                blocks.append(ImageBlock(bbox=tuple(block['bbox']), xref=block.get('xref')))
+            else:
+                lines = [Line([Span(**span) for span in line['spans']]) for line in block.get('lines', [])]
+                blocks.append(TextBlock(bbox=tuple(block['bbox']), lines=lines))
+        
+        return cls(
+            number=data['number'],
+            width=data['width'],
+            height=data['height'],
+            blocks=blocks,
+            tables=[Table(bbox=tuple(t['bbox']), rows=t['rows']) for t in data.get('tables', [])],
+            layout_text=data.get('layout_text'),
+            table_error=data.get('table_error'),
+            tables_skipped=data.get('tables_skipped', False),
+            geometry=data.get('geometry', False)
+        )
+
+
+@dataclass
+class DocumentIR:
+    """Whole document"""
+    source: str
+    page_count: int
+    pages: List[PageIR] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DocumentIR':
+        return cls(
+            source=data['source'],
+            page_count=data['page_count'],
+            pages=[PageIR.from_dict(page) for page in data.get('pages', [])],
+            metadata=data.get('metadata', {})
+        )
+    
+    def to_json(self) -> str:
+        """Serialize (e.g. for caching)"""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+    
+    @classmethod
+    def from_json(cls, text: str) -> 'DocumentIR':
+        return cls.from_dict(json.loads(text))
+
+
+def geometry_span_texts(line: Dict[str, Any]) -> List[str]:
+    """
+    Rebuild the span texts of a rawdict line, inserting spaces at word gaps
+    
+    Args:
+        line: Line of page.get_text("rawdict")
+    
+    Returns:
+        Text of each span of the line
+    """
+    spans = line.get("spans", [])
+    direction = line.get("dir", (1, 0))
+    if abs(direction[1]) > 0.1:
+        # Rotated or vertical text: keep the glyph order as is
+        return [''.join(char["c"] for char in span.get("chars", [])) for span in spans]
+    
+    # Gaps between consecutive non-space glyphs of the whole line
+    glyphs = [(char, span.get("size", 12)) for span in spans for char in span.get("chars", [])]
+    gaps = [
+        cur["bbox"][0] - prev["bbox"][2]
+        for (prev, _), (cur, _) in zip(glyphs, glyphs[1:])
+        if not prev["c"].isspace() and not cur["c"].isspace()
+    ]
+    typical_gap = statistics.median(gaps) if gaps else 0.0
+    
+    texts = []
+    prev = None
+    for span in spans:
+        threshold = typical_gap + WORD_GAP_RATIO * span.get("size", 12)
+        parts = []
+        for char in span.get("chars", []):
+            if (prev is not None and not prev["c"].isspace() and not char["c"].isspace()
+                    and char["bbox"][0] - prev["bbox"][2] > threshold):
+                parts.append(' ')
+            parts.append(char["c"])
+            prev = char
+        texts.append(''.join(parts))
+    return texts
+
+
+def _place_images(text_blocks: List[TextBlock], images: List[ImageBlock]) -> List[Block]:
+    """Insert image blocks into the text blocks before the first block that starts below them"""
+    pending = sorted(images, key=lambda image: image.bbox[1])
+    blocks = []
+    for block in text_blocks:
+        while pending and pending[0].bbox[1] <= block.bbox[1]:
+            blocks.append(pending.pop(0))
+        blocks.append(block)
+    blocks.extend(pending)
+    return blocks
+
+
+def extract_page(session: PDFDocumentSession, page_num: int, layout_text: bool = True,
+                 geometry: bool = False) -> PageIR:
+    """
+    Extract one page into the IR
+    
+    Text comes from an image-free text dict; images are only recorded as
+    placements with their xref, their pixels are read when a renderer needs them.
+    
+    Args:
+        session: Open PDF session
+        page_num: 0-based page index
+        layout_text: Also extract the layout text (needed for HTML)
+        geometry: Rebuild word spacing from glyph positions (rawdict) instead
+                  of using the text layer's spaces; the layout text is then
+                  built from the same lines instead of pdfplumber
+    
+    Returns:
+        PageIR
+    """
+    page = session.page(page_num)
+    ir = PageIR(number=page_num, width=page.rect.width, height=page.rect.height, geometry=geometry)
+    
+    text_blocks = []
+    if geometry:
+        text_dict = page.get_text("rawdict", flags=RAWDICT_FLAGS)
+    else:
+        text_dict = page.get_text("dict", flags=DICT_FLAGS)
+    for block in text_dict.get("blocks", []):
+        if block.get("type") == 0:
+            lines = []
+            for line in block.get("lines", []):
+                spans = line.get("spans", [])
+                texts = geometry_span_texts(line) if geometry else [span.get("text", "") for span in spans]
+                lines.append(Line([
+                    Span(
+                        text=text,
+                        size=span.get("size", 12),
+                        flags=span.get("flags", 0),
+                        font=span.get("font", "")
+                    )
+                    for span, text in zip(spans, texts)
+                ]))
+            text_blocks.append(TextBlock(bbox=tuple(block.get("bbox", (0, 0, 0, 0))), lines=lines))
+    
+    # Inline images (xref 0) cannot be read back by xref and are left out
+    images = [
+        ImageBlock(bbox=tuple(info["bbox"]), xref=info["xref"])
+        for info in page.get_image_info(xrefs=True)
+        if info.get("xref")
+    ]
+    ir.blocks = _place_images(text_blocks, images)
+    
+    if layout_text and geometry:
+        # One line per text line, a blank line between blocks
+        ir.layout_text = '\n\n'.join(
+            '\n'.join(''.join(span.text for span in line.spans).strip() for line in block.lines)
+            for block in ir.blocks if block.type == 'text'
+        )
+    elif layout_text:
+        # Layout text before tables: the table finder flushes pdfplumber's parsed page
+        ir.layout_text = session.plumber_page(page_num).extract_text() or ''
+    
+    if not session.may_contain_tables(page_num):
+        ir.tables_skipped = True
+        return ir
+    
+    try:
+        ir.tables = [
+            Table(bbox=tuple(t['bbox']), rows=t['rows'])
+            for t in session.get_tables(page_num)
+            if t['rows']
+        ]
+    except Exception as e:
+        ir.table_error = str(e)
+    
+    return ir
@@ -1,6 +1,7 @@
 """
 HTML converter - handles all HTML conversions
 """
+import io
 import time
 from pathlib import Path
 from typing import Optional
@@ -23,6 +24,8 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from converters.base import BaseConverter, ConversionResult
 from utils.logger import logger
 from utils.post_processor import apply_post_processing
+from utils.image_policy import ImagePolicy, read_image_source, display_width_inches
+from utils.docx_tables import add_table
 
 
 class HTMLConverter(BaseConverter):
@@ -502,13 +505,14 @@ class HTMLConverter(BaseConverter):
             
             # Create DOCX document
             doc = Document()
+            image_policy = ImagePolicy.from_options(options)
             
             # Process body content
             body = soup.find('body')
             if not body:
                 body = soup
             
-            self._process_html_element(body, doc)
+            self._process_html_element(body, doc, base_dir=Path(input_file).parent, image_policy=image_policy)
             
             # Save document
             doc.save(output_file)
@@ -518,7 +522,8 @@ class HTMLConverter(BaseConverter):
                 input_file,
                 output_file,
                 'html',
-                'docx'
+                'docx',
+                metadata={'image_bytes_saved': image_policy.bytes_saved}
             )
             
         except Exception as e:
@@ -597,7 +602,24 @@ class HTMLConverter(BaseConverter):
             logger.error(f"HTML to Markdown conversion failed: {e}")
             raise
     
-    def _process_html_element(self, element, doc, level=0):
+    def _add_docx_image(self, img, doc, base_dir: Optional[Path], image_policy: Optional[ImagePolicy]):
+        """Embed the picture of an <img> tag (local files and data: URIs)"""
+        if base_dir is None or not img.get('src'):
+            return
+        data = read_image_source(img['src'], base_dir)
+        if data is None:
+            return
+        
+        width = display_width_inches(data)
+        if image_policy is not None:
+            data = image_policy.apply(data, width)
+        try:
+            doc.add_picture(io.BytesIO(data), width=Inches(width))
+        except Exception as e:
+            logger.warning(f"Image not embedded ({img['src'][:60]}): {e}")
+    
+    def _process_html_element(self, element, doc, level=0, base_dir: Optional[Path] = None,
+                              image_policy: Optional[ImagePolicy] = None):
         """Recursively process HTML elements and add to DOCX with enhanced formatting"""
         from docx.shared import Pt, RGBColor
         from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -634,6 +656,13 @@ class HTMLConverter(BaseConverter):
                 # Paragraph with inline formatting support
                 para = doc.add_paragraph()
                 self._add_formatted_text(child, para)
+                
+                # Pictures of the paragraph follow its text
+                for img in child.find_all('img'):
+                    self._add_docx_image(img, doc, base_dir, image_policy)
+            
+            elif child.name == 'img':
+                self._add_docx_image(child, doc, base_dir, image_policy)
             
             elif child.name in ['ul', 'ol']:
                 # List with proper bullet/number style
@@ -657,28 +686,17 @@ class HTMLConverter(BaseConverter):
             
             elif child.name == 'table':
                 # Table with proper structure
-                rows = child.find_all('tr')
+                rows = [row.find_all(['td', 'th']) for row in child.find_all('tr')]
                 if rows:
-                    # Count max columns
-                    max_cols = max(len(row.find_all(['td', 'th'])) for row in rows)
-                    
-                    table = doc.add_table(rows=len(rows), cols=max_cols)
-                    table.style = 'Table Grid'
-                    
-                    for i, row in enumerate(rows):
-                        cells = row.find_all(['td', 'th'])
-                        for j, cell in enumerate(cells):
-                            if j < max_cols:
-                                cell_text = cell.get_text().strip()
-                                table_cell = table.rows[i].cells[j]
-                                table_cell.text = cell_text
-                                
-                                # Bold and color header row
-                                if cell.name == 'th' or i == 0:
-                                    for paragraph in table_cell.paragraphs:
-                                        for run in paragraph.runs:
-                                            run.font.bold = True
-                                            run.font.color.rgb = RGBColor(0, 102, 204)
+                    # Bold and color header row and <th> cells
+                    add_table(
+                        doc,
+                        [[cell.get_text() for cell in row] for row in rows],
+                        style='Table Grid',
+                        header_rows=1,
+                        header_color=RGBColor(0, 102, 204),
+                        header_cells={(i, j) for i, row in enumerate(rows) for j, cell in enumerate(row) if cell.name == 'th'}
+                    )
             
             elif child.name in ['pre', 'code']:
                 # Code block
@@ -713,9 +731,9 @@ class HTMLConverter(BaseConverter):
                     run = para.add_run(text)
                     run.italic = True
             
-            elif child.name in ['div', 'section', 'article', 'main', 'aside', 'header', 'footer', 'nav']:
+            elif child.name in ['div', 'section', 'article', 'main', 'aside', 'header', 'footer', 'nav', 'figure']:
                 # Container elements - recurse
-                self._process_html_element(child, doc, level + 1)
+                self._process_html_element(child, doc, level + 1, base_dir, image_policy)
             
             elif child.name == 'br':
                 # Line break - add empty paragraph
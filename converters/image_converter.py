@@ -11,6 +11,7 @@ import io
 
 from converters.base import BaseConverter, ConversionResult
 from converters.markdown_converter import MarkdownConverter
+from ai.image_context import ImageContext, ImageSource
 from ai.ocr_engine import OCREngine
 from ai.table_detector import TableDetector
 from ai.math_recognizer import MathRecognizer
@@ -52,6 +53,10 @@ class ImageConverter(BaseConverter):
                 - detect_math: Enable math formula recognition (default: False)
                 - detect_tables: Enable table detection (default: True)
                 - detect_code: Enable code block detection (default: True)
+                - table_profile: Table image preprocessing, 'quality' or 'fast'
+                  (default: TABLE_PREPROCESS_PROFILE)
+                - table_cells: Read ruled tables cell by cell from their grid lines,
+                  one OCR pass per table (default: False)
                 - quality_check: Run quality check after conversion (default: False)
         
         Returns:
@@ -116,7 +121,7 @@ class ImageConverter(BaseConverter):
             
             logger.info(f"Successfully converted image to {output_format}: {output_file}")
             return result
-            
+        
         except Exception as e:
             logger.error(f"Image conversion failed: {e}")
             return self._create_error_result(
@@ -153,18 +158,33 @@ class ImageConverter(BaseConverter):
             detect_tables = options.get('detect_tables', True)
             detect_code = options.get('detect_code', True)
             
+            # Decode the image once; every phase below works on this buffer
+            try:
+                image = ImageContext.load(input_file)
+            except Exception as e:
+                return self._create_error_result(
+                    input_file,
+                    f"Could not read image: {e}",
+                    'image',
+                    'markdown'
+                )
+            
             # Phase 1: Advanced Layout Analysis (with OpenCV)
             logger.info("Phase 1: Layout analysis (OpenCV table detection)")
-            layout_info = self._analyze_layout(input_file)
+            layout_info = self._analyze_layout(image)
             
             # Phase 1.5: Image preprocessing for tables if detected
-            image_to_ocr = input_file
+            image_to_ocr = image
             if layout_info.get('has_tables', False) and detect_tables:
                 logger.info("Phase 1.5: Enhancing image for table OCR")
                 try:
-                    enhanced_path = self.table_detector.enhance_table_image(input_file)
-                    image_to_ocr = enhanced_path
-                    logger.info(f"Using enhanced image: {enhanced_path}")
+                    enhanced = self.table_detector.enhance_table_image(
+                        image,
+                        profile=options.get('table_profile')
+                    )
+                    if enhanced is not None:
+                        image_to_ocr = enhanced
+                        logger.info("Using enhanced image for OCR")
                 except Exception as e:
                     logger.warning(f"Image enhancement failed, using original: {e}")
             
@@ -193,13 +213,24 @@ class ImageConverter(BaseConverter):
             logger.info("Phase 2.5: OCR post-processing")
             cleaned_text = self._post_process_ocr(raw_text, ocr_confidence)
             
+            # Phase 2.6: Cell text of ruled tables (one OCR pass per table)
+            grid_tables = []
+            if detect_tables and options.get('table_cells', False):
+                logger.info("Phase 2.6: Table cell extraction")
+                for region in layout_info.get('detected_structures', {}).get('tables', []):
+                    cells = self.table_detector.extract_table_cells(image, region, language=ocr_language)
+                    table = self._table_from_rows(cells['grid'])
+                    if table:
+                        grid_tables.append(table)
+            
             # Phase 3: Specialized Content Transformation
             markdown_content = self._transform_content(
                 cleaned_text,
                 layout_info,
                 detect_math=detect_math,
                 detect_tables=detect_tables,
-                detect_code=detect_code
+                detect_code=detect_code,
+                tables=grid_tables
             )
             
             # Phase 4: Structural Reconstruction
@@ -224,12 +255,12 @@ class ImageConverter(BaseConverter):
                     'layout_blocks': len(layout_info.get('blocks', []))
                 }
             )
-            
+        
         except Exception as e:
             logger.error(f"Image to Markdown conversion failed: {e}")
             raise
     
-    def _analyze_layout(self, image_path: str) -> Dict[str, Any]:
+    def _analyze_layout(self, image: ImageSource) -> Dict[str, Any]:
         """
         Analyze image layout to detect logical blocks using OpenCV
         
@@ -241,18 +272,17 @@ class ImageConverter(BaseConverter):
         - Images/diagrams
         
         Args:
-            image_path: Path to image file
+            image: Path to image file, or its decoded ImageContext
         
         Returns:
             Dictionary with layout information
         """
         try:
-            # Open image
-            image = Image.open(image_path)
+            image = ImageContext.of(image)
             width, height = image.size
             
             # Detect tables using OpenCV
-            detected_tables = self.table_detector.detect_tables(image_path)
+            detected_tables = self.table_detector.detect_tables(image)
             
             layout_info = {
                 'width': width,
@@ -269,7 +299,7 @@ class ImageConverter(BaseConverter):
             
             logger.info(f"Layout analysis: {width}x{height}px, {len(detected_tables)} tables detected")
             return layout_info
-            
+        
         except Exception as e:
             logger.warning(f"Layout analysis failed: {e}")
             return {
@@ -451,7 +481,8 @@ class ImageConverter(BaseConverter):
         layout_info: Dict[str, Any],
         detect_math: bool = False,
         detect_tables: bool = True,
-        detect_code: bool = True
+        detect_code: bool = True,
+        tables: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Transform raw OCR text into structured content
@@ -462,6 +493,8 @@ class ImageConverter(BaseConverter):
             detect_math: Enable math detection
             detect_tables: Enable table detection
             detect_code: Enable code detection
+            tables: Tables already read from the image grid (replace the
+                    tables guessed from the text layout)
         
         Returns:
             Dictionary with transformed content
@@ -475,7 +508,7 @@ class ImageConverter(BaseConverter):
         
         # Detect and extract tables
         if detect_tables:
-            content['tables'] = self._detect_tables(raw_text, layout_info)
+            content['tables'] = tables or self._detect_tables(raw_text, layout_info)
         
         # Detect and extract code blocks
         if detect_code:
@@ -606,8 +639,20 @@ class ImageConverter(BaseConverter):
             
             if cells:
                 parsed_rows.append(cells)
-                max_cols = max(max_cols, len(cells))
         
+        return self._table_from_rows(parsed_rows)
+    
+    def _table_from_rows(self, parsed_rows: List[List[str]]) -> Optional[Dict[str, Any]]:
+        """
+        Build a structured Markdown table from rows of cell texts
+        
+        Args:
+            parsed_rows: Rows of cell texts, the first row is the header
+        
+        Returns:
+            Structured table dictionary or None if invalid
+        """
+        max_cols = max((len(row) for row in parsed_rows), default=0)
         if not parsed_rows or max_cols < 2:
             return None
         
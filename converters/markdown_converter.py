@@ -1,6 +1,7 @@
 """
 Markdown converter - handles all Markdown conversions
 """
+import io
 import time
 import os
 from pathlib import Path
@@ -24,6 +25,7 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from converters.base import BaseConverter, ConversionResult
 from utils.logger import logger
 from utils.post_processor import apply_post_processing
+from utils.image_policy import ImagePolicy, read_image_source, display_width_inches
 
 
 class MarkdownConverter(BaseConverter):
@@ -558,6 +560,8 @@ pre {
             
             # Create DOCX document
             doc = Document()
+            image_policy = ImagePolicy.from_options(options)
+            base_dir = Path(input_file).parent
             
             # Parse markdown line by line
             lines = md_content.split('\n')
@@ -609,6 +613,17 @@ pre {
                     text = re.sub(r'^\d+\.\s', '', line.strip())
                     doc.add_paragraph(text, style='List Number')
                 
+                # Image on its own line: ![alt](src "title")
+                elif re.match(r'^!\[[^\]]*\]\(\s*<?[^)\s>]+>?(\s+"[^"]*")?\s*\)$', line.strip()):
+                    src = re.match(r'^!\[[^\]]*\]\(\s*<?([^)\s>]+)', line.strip()).group(1)
+                    data = read_image_source(src, base_dir)
+                    if data is not None:
+                        width = display_width_inches(data)
+                        try:
+                            doc.add_picture(io.BytesIO(image_policy.apply(data, width)), width=Inches(width))
+                        except Exception as e:
+                            logger.warning(f"Image not embedded ({src[:60]}): {e}")
+                
                 # Regular paragraph
                 elif line.strip():
                     para = doc.add_paragraph()
@@ -624,7 +639,8 @@ pre {
                 input_file,
                 output_file,
                 'markdown',
-                'docx'
+                'docx',
+                metadata={'image_bytes_saved': image_policy.bytes_saved}
             )
             
         except Exception as e:
@@ -1,27 +1,50 @@
 """
 PDF converter - handles all PDF conversions
 """
+import os
 import time
 import re
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 import fitz  # PyMuPDF
-import pdfplumber
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import markdown
 from bs4 import BeautifulSoup
-from PIL import Image
 import io
 
 from converters.base import BaseConverter, ConversionResult
+from converters.pdf_session import PDFDocumentSession
+from converters.document_ir import DocumentIR, PageIR, extract_page, geometry_span_texts
 from utils.logger import logger
+from utils.word_spacing import fix_word_spacing
+from utils.word_segmenter import segment_words
+from utils.image_policy import ImagePolicy
+from utils.docx_tables import add_table
+from utils.output_sink import TextSink
+from utils.page_ranges import PageSpec, parse_page_ranges, format_page_ranges
+from utils.ocr_text import join_ocr_paragraphs
+from config import PDF_WORKERS
 
 
 class PDFConverter(BaseConverter):
     """Convert PDF to other formats"""
     
+    # Tesseract settings for OCR modes
+    OCR_CONFIG = r'--oem 3 --psm 6'
+    MATH_OCR_CONFIG = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
+    
+    # Display width of images in DOCX output
+    DOCX_IMAGE_WIDTH_INCHES = 5.0
+    
+    # Text-layer extraction modes: 'text' uses the spaces of the text layer,
+    # 'geometry' rebuilds word gaps from glyph positions (slide decks)
+    EXTRACTION_MODES = ('text', 'geometry')
+    
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters"""
         if not text:
@@ -44,62 +67,7 @@ class PDFConverter(BaseConverter):
     
     def _fix_word_spacing(self, text: str) -> str:
         """Fix missing spaces between words (common in PDF extraction from presentations)"""
-        import re
-        if not text:
-            return ''
-        
-        # First pass: Fix obvious concatenations
-        # Add space between lowercase and uppercase (camelCase)
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-        
-        # Add space after punctuation if followed by letter (not decimal)
-        text = re.sub(r'([.])([A-Z])', r'\1 \2', text)
-        text = re.sub(r'([,:;!?])([A-Za-z])', r'\1 \2', text)
-        
-        # Add space after closing parenthesis/bracket if followed by letter
-        text = re.sub(r'([\)\]])([A-Za-z])', r'\1 \2', text)
-        
-        # Add space before opening parenthesis/bracket if preceded by letter
-        text = re.sub(r'([a-zA-Z])([\(\[])', r'\1 \2', text)
-        
-        # Second pass: Fix common concatenated words
-        # These patterns are common in PDF extraction errors
-        word_boundaries = [
-            (r'([a-z])(the)([A-Z])', r'\1 \2 \3'),
-            (r'([a-z])(and)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(for)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(with)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(from)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(that)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(this)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(such)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(given)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(find)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(using)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(where)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(which)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(each)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(also)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(into)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(over)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(then)([a-z])', r'\1 \2 \3'),
-            (r'([a-z])(when)([a-z])', r'\1 \2 \3'),
-            (r'on([A-Z])', r'on \1'),  # "onA" -> "on A"
-            (r'in([A-Z])', r'in \1'),  # "inA" -> "in A"
-            (r'of([A-Z])', r'of \1'),  # "ofA" -> "of A"
-            (r'to([A-Z])', r'to \1'),  # "toA" -> "to A"
-            (r'is([A-Z])', r'is \1'),  # "isA" -> "is A"
-            (r'by([A-Z])', r'by \1'),  # "byA" -> "by A"
-            (r'as([A-Z])', r'as \1'),  # "asA" -> "as A"
-        ]
-        
-        for pattern, replacement in word_boundaries:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        # Clean up multiple spaces
-        text = re.sub(r' +', ' ', text)
-        
-        return text
+        return fix_word_spacing(text)
     
     def _fix_concatenated_text(self, text: str) -> str:
         """Advanced fix for heavily concatenated text (pdfplumber extraction issues)"""
@@ -107,24 +75,8 @@ class PDFConverter(BaseConverter):
         if not text:
             return ''
         
-        # Common English word patterns that get concatenated
-        common_words = [
-            'the', 'and', 'for', 'with', 'from', 'that', 'this', 'such', 
-            'given', 'find', 'using', 'where', 'which', 'each', 'also',
-            'into', 'over', 'then', 'when', 'have', 'been', 'will', 'would',
-            'could', 'should', 'must', 'function', 'domain', 'source',
-            'equation', 'boundary', 'condition', 'method', 'element',
-            'finite', 'described', 'strong', 'form', 'unknown', 'potential',
-            'temperature', 'heat', 'problem', 'requires', 'twice',
-            'differentiate', 'restrictive', 'difficult', 'computationally',
-            'notation', 'inner', 'product', 'goal', 'on', 'is', 'by', 'to',
-            'an', 'or', 'be', 'as', 'at', 'if', 'of', 'in', 'it'
-        ]
-        
-        for word in common_words:
-            # Add space before word if preceded by lowercase letter
-            pattern = rf'([a-z])({word})([a-z])'
-            text = re.sub(pattern, rf'\1 \2 \3', text, flags=re.IGNORECASE)
+        # Split run-together words with the word-frequency lexicon (English or Turkish)
+        text = segment_words(text)
         
         # Fix "e.g.," and "i.e.," patterns
         text = re.sub(r'(\w)(e\.g\.,)', r'\1 \2', text)
@@ -143,12 +95,22 @@ class PDFConverter(BaseConverter):
         """Route to appropriate conversion method
         
         Options:
-            use_ocr (bool): Use OCR for text extraction (better for presentations)
+            use_ocr (bool or 'auto'): Use OCR for text extraction (better for presentations).
+                                      'auto' scores every page and OCRs only the pages
+                                      without a usable text layer (see route_pages)
             enhance_math (bool): Use AI-enhanced math processing (default: True with OCR)
             use_llm (bool): Use LLM for post-processing (requires API key or Ollama)
             llm_provider (str): LLM provider - 'auto', 'ollama', 'huggingface', 'gemini'
             ocr_lang (str): OCR language code (default: 'eng')
             ocr_dpi (int): OCR resolution DPI multiplier (default: 2)
+            workers (int): Worker processes for page-parallel text-layer conversion
+                           (default: PDF_WORKERS, 1 = serial, 0 = one per CPU core)
+            extraction (str): Text-layer extraction mode, 'text' (default) or 'geometry'
+                              (word spacing from glyph positions, see detect_if_ocr_needed)
+            optimize_images (bool): Downsample/recompress DOCX images (default: True, see
+                                    ImagePolicy for image_max_dpi, image_quality, image_photo_to_jpeg)
+            pages (str, int or list): Convert only these 1-based pages, e.g. "1-5,10"
+                                      (default: all pages, see parse_page_ranges)
         """
         output_format = Path(output_file).suffix.lower().lstrip('.')
         use_ocr = options.get('use_ocr', False)
@@ -162,7 +124,33 @@ class PDFConverter(BaseConverter):
         if error:
             return self._create_error_result(input_file, error, 'pdf', output_format)
         
+        if options.get('extraction', 'text') not in self.EXTRACTION_MODES:
+            return self._create_error_result(
+                input_file,
+                f"Unknown extraction mode: {options['extraction']}",
+                'pdf',
+                output_format
+            )
+        
+        try:
+            page_numbers = self._parse_pages(input_file, options.get('pages'))
+        except ValueError as e:
+            return self._create_error_result(input_file, str(e), 'pdf', output_format)
+        if page_numbers is not None:
+            options = {**options, 'page_numbers': page_numbers}
+        
         try:
+            page_routes = None
+            if use_ocr == 'auto':
+                # Score every page; OCR only the pages whose text layer is unusable
+                page_routes = self.route_pages(input_file, page_numbers)
+                ocr_pages = [r['page'] for r in page_routes if r['route'] == 'ocr']
+                logger.info(f"Auto OCR routing: {len(ocr_pages)}/{len(page_routes)} pages need OCR")
+                
+                use_ocr = bool(page_routes) and len(ocr_pages) == len(page_routes)
+                if not use_ocr:
+                    options = {**options, 'ocr_pages': ocr_pages}
+            
             if output_format in ['docx', 'doc']:
                 if use_ocr:
                     result = self._pdf_to_docx_ocr(input_file, output_file, **options)
@@ -191,6 +179,16 @@ class PDFConverter(BaseConverter):
                     output_format
                 )
             
+            if page_routes is not None and result.success:
+                result.metadata = result.metadata or {}
+                result.metadata['page_routes'] = page_routes
+                result.metadata['ocr_pages'] = sum(1 for r in page_routes if r['route'] == 'ocr')
+            
+            if page_numbers is not None and result.success:
+                result.metadata = result.metadata or {}
+                result.metadata['page_ranges'] = format_page_ranges(page_numbers)
+                result.metadata['pages_converted'] = len(page_numbers)
+            
             processing_time = time.time() - start_time
             result.processing_time = processing_time
             return result
@@ -205,133 +203,23 @@ class PDFConverter(BaseConverter):
         
         doc = Document()
         warnings = []
+        image_policy = ImagePolicy.from_options(options)
         
         try:
-            # Open PDF with PyMuPDF for better text extraction
-            pdf_document = fitz.open(input_file)
-            
-            for page_num in range(len(pdf_document)):
-                page = pdf_document[page_num]
-                
-                # Try table extraction first with pdfplumber
-                try:
-                    import pdfplumber
-                    with pdfplumber.open(input_file) as pdf_plumber:
-                        plumber_page = pdf_plumber.pages[page_num]
-                        tables = plumber_page.extract_tables()
-                        
-                        if tables:
-                            for table_data in tables:
-                                if table_data and len(table_data) > 0:
-                                    # Add table to document
-                                    num_rows = len(table_data)
-                                    num_cols = max(len(row) for row in table_data)
-                                    
-                                    table = doc.add_table(rows=num_rows, cols=num_cols)
-                                    table.style = 'Table Grid'
-                                    
-                                    for i, row in enumerate(table_data):
-                                        for j, cell in enumerate(row):
-                                            if j < num_cols and cell:
-                                                table.rows[i].cells[j].text = str(cell).strip()
-                                    
-                                    # Add spacing after table
-                                    doc.add_paragraph()
-                except Exception as e:
-                    warnings.append(f"Table extraction failed: {e}")
-                
-                # Extract text with formatting
-                text_dict = page.get_text("dict")
-                blocks = text_dict.get("blocks", [])
-                
-                for block in blocks:
-                    if block.get("type") == 0:  # Text block
-                        block_text = []
-                        max_font_size = 0
-                        is_bold = False
-                        
-                        for line in block.get("lines", []):
-                            line_text = ""
-                            line_spans = line.get("spans", [])
-                            
-                            for span_idx, span in enumerate(line_spans):
-                                span_text = span.get("text", "")
-                                
-                                # Smart span joining - preserve leading spaces in span
-                                if span_idx > 0:
-                                    # If current span starts with space, keep it
-                                    # If not, add space between spans (unless previous ended with hyphen)
-                                    if not span_text.startswith(' ') and line_text and not line_text.endswith('-'):
-                                        # Check if we need a space
-                                        if line_text[-1:].isalnum() and span_text[:1].isalnum():
-                                            line_text += " "
-                                
-                                line_text += span_text
-                                
-                                # Track font properties
-                                font_size = span.get("size", 12)
-                                if font_size > max_font_size:
-                                    max_font_size = font_size
-                                
-                                # Check if bold
-                                font_flags = span.get("flags", 0)
-                                if font_flags & 2**4:  # Bold flag
-                                    is_bold = True
-                            
-                            if line_text.strip():
-                                block_text.append(line_text.strip())
-                        
-                        if block_text:
-                            full_text = " ".join(block_text)
-                            
-                            if full_text.strip():
-                                # Clean text for XML compatibility and fix spacing
-                                full_text = self._clean_text_for_xml(full_text)
-                                full_text = self._fix_word_spacing(full_text)
-                                
-                                # Detect if it's a heading based on font size and properties
-                                para = doc.add_paragraph()
-                                
-                                # Smart heading detection
-                                if max_font_size > 18 or (max_font_size > 16 and is_bold):
-                                    para.style = 'Heading 1'
-                                elif max_font_size > 14 or (max_font_size > 12 and is_bold and len(full_text) < 100):
-                                    para.style = 'Heading 2'
-                                elif max_font_size > 12 and is_bold and len(full_text) < 80:
-                                    para.style = 'Heading 3'
-                                else:
-                                    para.style = 'Normal'
-                                
-                                # Add text to paragraph
-                                run = para.add_run(full_text)
-                                if is_bold and para.style == 'Normal':
-                                    run.bold = True
-                                
-                                # Add spacing after paragraph for better readability
-                                para.paragraph_format.space_after = Pt(6)
+            num_pages = 0
+            table_pages_skipped = 0
+            
+            # Images are read lazily by xref while the pages are added
+            with PDFDocumentSession(input_file) as image_session:
+                for fragment in self._document_fragments(input_file, 'docx', options):
+                    # Page break between pages (the selection may end before the last page)
+                    if num_pages:
+                        doc.add_page_break()
                     
-                    elif block.get("type") == 1:  # Image block
-                        try:
-                            # Extract and add image
-                            img = block.get("image")
-                            if img:
-                                xref = block.get("xref")
-                                if xref:
-                                    base_image = pdf_document.extract_image(xref)
-                                    image_bytes = base_image["image"]
-                                    
-                                    # Save temporarily and add to document
-                                    image_stream = io.BytesIO(image_bytes)
-                                    doc.add_picture(image_stream, width=Inches(5.0))
-                        except Exception as e:
-                            warnings.append(f"Could not extract image: {e}")
-                
-                # Page break after each page (except last)
-                if page_num < len(pdf_document) - 1:
-                    doc.add_page_break()
-            
-            num_pages = len(pdf_document)
-            pdf_document.close()
+                    num_pages = fragment['page_count']
+                    table_pages_skipped += fragment.get('tables_skipped', False)
+                    warnings.extend(fragment['warnings'])
+                    self._add_docx_items(doc, fragment['items'], warnings, image_session, image_policy)
             
             # Save document
             doc.save(output_file)
@@ -343,229 +231,157 @@ class PDFConverter(BaseConverter):
                 'pdf', 
                 'docx',
                 warnings=warnings,
-                metadata={'pages': num_pages}
+                metadata={
+                    'pages': num_pages,
+                    'table_pages_skipped': table_pages_skipped,
+                    'image_bytes_saved': image_policy.bytes_saved
+                }
             )
             
         except Exception as e:
             logger.error(f"PDF to DOCX conversion failed: {e}")
             raise
     
-    def _pdf_to_markdown(self, input_file: str, output_file: str, **options) -> ConversionResult:
-        """Convert PDF to Markdown with enhanced table, list, and formatting support"""
-        logger.info(f"Converting PDF to Markdown: {input_file} -> {output_file}")
+    def _docx_page(self, session: PDFDocumentSession, page: PageIR) -> Dict[str, Any]:
+        """
+        Render one page as a list of DOCX items
         
-        markdown_content = []
+        Items are plain tuples so they can be built in a worker process:
+        ('table', rows), ('paragraph', text, style, bold) and ('image', xref);
+        image bytes are only read when the items are added to the document
+        """
+        items = []
         warnings = []
         
-        try:
-            # Use both PyMuPDF (for formatting) and pdfplumber (for tables)
-            doc = fitz.open(input_file)
-            num_pages = len(doc)
-            
-            for page_num in range(num_pages):
-                page = doc[page_num]
-                
-                # Add page header with proper spacing
-                if page_num > 0:
-                    markdown_content.append("\n\n---\n\n")
+        # Tables first
+        if page.table_error:
+            warnings.append(f"Table extraction failed: {page.table_error}")
+        for table in page.tables:
+            items.append(('table', table.rows))
+        
+        for block in page.blocks:
+            if block.type == 'text':
+                block_text = []
+                max_font_size = 0
+                is_bold = False
                 
-                markdown_content.append(f"## Page {page_num + 1}\n\n")
-                
-                # STEP 1: Extract tables first with pdfplumber
-                tables_extracted = []
-                table_bboxes = []
-                
-                try:
-                    with pdfplumber.open(input_file) as pdf_plumber:
-                        plumber_page = pdf_plumber.pages[page_num]
-                        tables = plumber_page.extract_tables()
+                for line in block.lines:
+                    line_text = ""
+                    line_spans = line.spans
+                    
+                    for span_idx, span in enumerate(line_spans):
+                        span_text = span.text
                         
-                        if tables:
-                            for table_data in tables:
-                                if table_data and len(table_data) > 0:
-                                    # Convert table to markdown
-                                    md_table = self._table_to_markdown(table_data)
-                                    tables_extracted.append(md_table)
-                                    
-                                    # Try to get table bbox (approximate)
-                                    try:
-                                        table_obj = plumber_page.find_tables()
-                                        if table_obj:
-                                            for t in table_obj:
-                                                table_bboxes.append(t.bbox)
-                                    except:
-                                        pass
-                except Exception as e:
-                    warnings.append(f"Table extraction failed on page {page_num + 1}: {e}")
-                
-                # STEP 2: Extract text blocks with formatting
-                blocks = page.get_text("dict")["blocks"]
-                
-                # Calculate average font size for the page
-                all_font_sizes = []
-                for block in blocks:
-                    if block.get("type") == 0:
-                        for line in block.get("lines", []):
-                            for span in line.get("spans", []):
-                                all_font_sizes.append(span.get("size", 12))
-                
-                avg_font_size = sum(all_font_sizes) / len(all_font_sizes) if all_font_sizes else 12
-                
-                for block in blocks:
-                    if block.get("type") == 0:  # Text block
-                        # Check if block overlaps with a table (skip if yes)
-                        block_bbox = block.get("bbox", [0, 0, 0, 0])
-                        is_in_table = False
+                        # Smart span joining - preserve leading spaces in span
+                        if span_idx > 0:
+                            # If current span starts with space, keep it
+                            # If not, add space between spans (unless previous ended with hyphen)
+                            if not span_text.startswith(' ') and line_text and not line_text.endswith('-'):
+                                # Check if we need a space
+                                if line_text[-1:].isalnum() and span_text[:1].isalnum():
+                                    line_text += " "
                         
-                        for table_bbox in table_bboxes:
-                            if self._bbox_overlap(block_bbox, table_bbox):
-                                is_in_table = True
-                                break
+                        line_text += span_text
                         
-                        if is_in_table:
-                            continue
+                        # Track font properties
+                        if span.size > max_font_size:
+                            max_font_size = span.size
                         
-                        # Process lines in block
-                        for line in block.get("lines", []):
-                            line_text_parts = []
-                            line_font_size = 0
-                            is_bold = False
-                            is_italic = False
-                            is_monospace = False
-                            
-                            for span in line.get("spans", []):
-                                span_text = span.get("text", "").strip()
-                                if not span_text:
-                                    continue
-                                
-                                # Font properties
-                                font_size = span.get("size", 12)
-                                font_flags = span.get("flags", 0)
-                                font_name = span.get("font", "").lower()
-                                
-                                if font_size > line_font_size:
-                                    line_font_size = font_size
-                                
-                                # Check bold (bit 4 = 16)
-                                span_bold = bool(font_flags & (1 << 4))
-                                # Check italic (bit 1 = 2)
-                                span_italic = bool(font_flags & (1 << 1))
-                                # Check monospace fonts
-                                span_monospace = any(mono in font_name for mono in ['courier', 'mono', 'consolas', 'menlo'])
-                                
-                                # Apply formatting
-                                formatted_text = span_text
-                                
-                                if span_monospace:
-                                    formatted_text = f"`{formatted_text}`"
-                                    is_monospace = True
-                                elif span_bold and span_italic:
-                                    formatted_text = f"***{formatted_text}***"
-                                elif span_bold:
-                                    formatted_text = f"**{formatted_text}**"
-                                    is_bold = True
-                                elif span_italic:
-                                    formatted_text = f"*{formatted_text}*"
-                                    is_italic = True
-                                
-                                line_text_parts.append(formatted_text)
-                            
-                            if not line_text_parts:
-                                continue
-                            
-                            full_line = " ".join(line_text_parts)
-                            
-                            # Smart content type detection
-                            
-                            # 1. Heading detection (based on font size)
-                            if line_font_size > avg_font_size * 1.5:
-                                heading_level = 1
-                            elif line_font_size > avg_font_size * 1.3:
-                                heading_level = 2
-                            elif line_font_size > avg_font_size * 1.15:
-                                heading_level = 3
-                            else:
-                                heading_level = 0
-                            
-                            # Additional heading indicators
-                            if heading_level == 0:
-                                # All caps + short = heading
-                                if len(full_line) < 100 and full_line.upper() == full_line and len(full_line) > 3:
-                                    heading_level = 3
-                                    full_line = full_line.title()
-                                # Ends with colon + short = subheading
-                                elif len(full_line) < 80 and full_line.endswith(':'):
-                                    heading_level = 4
-                            
-                            if heading_level > 0:
-                                # Remove markdown formatting from headings
-                                clean_line = full_line.replace('**', '').replace('*', '').replace('`', '')
-                                markdown_content.append(f"\n{'#' * heading_level} {clean_line}\n\n")
-                                continue
-                            
-                            # 2. List detection (bullet or numbered)
-                            stripped_line = full_line.lstrip()
-                            
-                            # Bullet list detection
-                            if stripped_line and stripped_line[0] in ['•', '·', '◦', '▪', '▫', '-', '–', '—']:
-                                list_text = stripped_line[1:].strip()
-                                markdown_content.append(f"- {list_text}\n")
-                                continue
-                            
-                            # Numbered list detection (1., a., i., etc.)
-                            import re
-                            numbered_match = re.match(r'^(\d+|[a-z]|[ivxlcdm]+)[\.\)]\s+(.+)', stripped_line, re.IGNORECASE)
-                            if numbered_match:
-                                list_text = numbered_match.group(2)
-                                markdown_content.append(f"1. {list_text}\n")
-                                continue
-                            
-                            # 3. Code block detection (multiple monospace spans)
-                            if is_monospace or full_line.count('`') > 2:
-                                # Remove inline code markers for code block
-                                code_line = full_line.replace('`', '')
-                                # Check if previous line was also code
-                                if markdown_content and markdown_content[-1].startswith('    '):
-                                    markdown_content.append(f"    {code_line}\n")
-                                else:
-                                    markdown_content.append(f"\n    {code_line}\n")
-                                continue
-                            
-                            # 4. Regular paragraph
-                            # Handle hyphenation
-                            if full_line.endswith('-'):
-                                markdown_content.append(full_line[:-1])  # Remove hyphen
-                            else:
-                                markdown_content.append(full_line)
-                                
-                                # Add proper line break
-                                if not full_line.endswith(('.', '!', '?', ':', ';')):
-                                    markdown_content.append(" ")
-                                else:
-                                    markdown_content.append("\n\n")
+                        if span.bold:
+                            is_bold = True
+                    
+                    if line_text.strip():
+                        block_text.append(line_text.strip())
                 
-                # STEP 3: Add extracted tables at the end of page content
-                if tables_extracted:
-                    markdown_content.append("\n\n")
-                    for table_md in tables_extracted:
-                        markdown_content.append(table_md)
-                        markdown_content.append("\n\n")
-            
-            doc.close()
-            
-            # Clean up the final content
-            final_content = ''.join(markdown_content)
+                if block_text:
+                    full_text = " ".join(block_text)
+                    
+                    if full_text.strip():
+                        # Clean text for XML compatibility and fix spacing
+                        full_text = self._clean_text_for_xml(full_text)
+                        if not page.geometry:
+                            full_text = self._fix_word_spacing(full_text)
+                        
+                        # Smart heading detection
+                        if max_font_size > 18 or (max_font_size > 16 and is_bold):
+                            style = 'Heading 1'
+                        elif max_font_size > 14 or (max_font_size > 12 and is_bold and len(full_text) < 100):
+                            style = 'Heading 2'
+                        elif max_font_size > 12 and is_bold and len(full_text) < 80:
+                            style = 'Heading 3'
+                        else:
+                            style = 'Normal'
+                        
+                        items.append(('paragraph', full_text, style, is_bold))
             
-            # Fix word spacing issues from PDF extraction (use advanced fix)
-            final_content = self._fix_concatenated_text(final_content)
-            final_content = self._fix_word_spacing(final_content)
+            elif block.type == 'image' and block.xref:
+                items.append(('image', block.xref))
+        
+        return {'items': items, 'warnings': warnings}
+    
+    def _add_docx_items(self, doc, items: List[tuple], warnings: List[str], session: PDFDocumentSession,
+                        image_policy: ImagePolicy):
+        """Append items produced by _docx_page to a DOCX document (session serves the image bytes)"""
+        for item in items:
+            kind = item[0]
+            
+            if kind == 'table':
+                # Add table to document (built in one pass)
+                add_table(doc, item[1], style='Table Grid')
+                
+                # Add spacing after table
+                doc.add_paragraph()
             
-            # Remove excessive blank lines (more than 2)
-            final_content = re.sub(r'\n{4,}', '\n\n\n', final_content)
+            elif kind == 'paragraph':
+                _, full_text, style, is_bold = item
+                
+                para = doc.add_paragraph()
+                para.style = style
+                
+                # Add text to paragraph
+                run = para.add_run(full_text)
+                if is_bold and style == 'Normal':
+                    run.bold = True
+                
+                # Add spacing after paragraph for better readability
+                para.paragraph_format.space_after = Pt(6)
             
-            # Write to file
-            with open(output_file, 'w', encoding='utf-8-sig') as f:
-                f.write(final_content)
+            elif kind == 'image':
+                try:
+                    # Read once per xref; python-docx stores identical images once
+                    image_data = image_policy.apply(session.image_bytes(item[1]), self.DOCX_IMAGE_WIDTH_INCHES)
+                    doc.add_picture(io.BytesIO(image_data), width=Inches(self.DOCX_IMAGE_WIDTH_INCHES))
+                except Exception as e:
+                    warnings.append(f"Could not extract image: {e}")
+    
+    def _pdf_to_markdown(self, input_file: str, output_file: str, **options) -> ConversionResult:
+        """Convert PDF to Markdown with enhanced table, list, and formatting support"""
+        logger.info(f"Converting PDF to Markdown: {input_file} -> {output_file}")
+        
+        warnings = []
+        
+        try:
+            num_pages = 0
+            total_tables = 0
+            table_pages_skipped = 0
+            
+            # Each page is cleaned and written as soon as it is rendered
+            with TextSink(output_file, encoding='utf-8-sig') as sink:
+                # Newlines at the end of a page are held back and cleaned with the
+                # next page, so blank-line runs across pages collapse as well
+                pending = ''
+                for fragment in self._document_fragments(input_file, 'markdown', options):
+                    num_pages = fragment['page_count']
+                    total_tables += fragment['tables']
+                    table_pages_skipped += fragment.get('tables_skipped', False)
+                    warnings.extend(fragment['warnings'])
+                    
+                    content = self._clean_markdown(pending + fragment['content'], options)
+                    body = content.rstrip('\n')
+                    pending = content[len(body):]
+                    sink.write(body)
+                    sink.flush()
+                sink.write(pending)
             
             logger.info(f"Successfully converted PDF to Markdown: {output_file}")
             return self._create_success_result(
@@ -574,13 +390,186 @@ class PDFConverter(BaseConverter):
                 'pdf',
                 'markdown',
                 warnings=warnings,
-                metadata={'pages': num_pages, 'tables': len(tables_extracted)}
+                metadata={'pages': num_pages, 'tables': total_tables, 'table_pages_skipped': table_pages_skipped}
             )
             
         except Exception as e:
             logger.error(f"PDF to Markdown conversion failed: {e}")
             raise
     
+    def _clean_markdown(self, text: str, options: Dict[str, Any]) -> str:
+        """Clean up rendered Markdown (one or more whole pages)"""
+        # Fix word spacing issues from PDF extraction (use advanced fix);
+        # geometry extraction already has the real word gaps
+        text = self._fix_concatenated_text(text)
+        if options.get('extraction', 'text') != 'geometry':
+            text = self._fix_word_spacing(text)
+        
+        # Remove excessive blank lines (more than 2)
+        return re.sub(r'\n{4,}', '\n\n\n', text)
+    
+    def _markdown_page(self, session: PDFDocumentSession, page: PageIR) -> Dict[str, Any]:
+        """Render one page of a PDF as a Markdown fragment"""
+        page_num = page.number
+        markdown_content = []
+        warnings = []
+        
+        # Add page header with proper spacing
+        if page_num > 0:
+            markdown_content.append("\n\n---\n\n")
+        
+        markdown_content.append(f"## Page {page_num + 1}\n\n")
+        
+        # STEP 1: Tables (rendered at the end of the page)
+        if page.table_error:
+            warnings.append(f"Table extraction failed on page {page_num + 1}: {page.table_error}")
+        tables_extracted = [self._table_to_markdown(table.rows) for table in page.tables]
+        table_bboxes = [table.bbox for table in page.tables]
+        
+        # STEP 2: Text blocks with formatting
+        text_blocks = [block for block in page.blocks if block.type == 'text']
+        
+        # Calculate average font size for the page
+        all_font_sizes = [span.size for block in text_blocks for line in block.lines for span in line.spans]
+        
+        avg_font_size = sum(all_font_sizes) / len(all_font_sizes) if all_font_sizes else 12
+        
+        for block in text_blocks:
+            # Check if block overlaps with a table (skip if yes)
+            is_in_table = False
+            
+            for table_bbox in table_bboxes:
+                if self._bbox_overlap(block.bbox, table_bbox):
+                    is_in_table = True
+                    break
+            
+            if is_in_table:
+                continue
+            
+            # Process lines in block
+            for line in block.lines:
+                line_text_parts = []
+                line_font_size = 0
+                is_bold = False
+                is_italic = False
+                is_monospace = False
+                
+                for span in line.spans:
+                    span_text = span.text.strip()
+                    if not span_text:
+                        continue
+                    
+                    if span.size > line_font_size:
+                        line_font_size = span.size
+                    
+                    span_bold = span.bold
+                    span_italic = span.italic
+                    span_monospace = span.monospace
+                    
+                    # Apply formatting
+                    formatted_text = span_text
+                    
+                    if span_monospace:
+                        formatted_text = f"`{formatted_text}`"
+                        is_monospace = True
+                    elif span_bold and span_italic:
+                        formatted_text = f"***{formatted_text}***"
+                    elif span_bold:
+                        formatted_text = f"**{formatted_text}**"
+                        is_bold = True
+                    elif span_italic:
+                        formatted_text = f"*{formatted_text}*"
+                        is_italic = True
+                    
+                    line_text_parts.append(formatted_text)
+                
+                if not line_text_parts:
+                    continue
+                
+                full_line = " ".join(line_text_parts)
+                
+                # Smart content type detection
+                
+                # 1. Heading detection (based on font size)
+                if line_font_size > avg_font_size * 1.5:
+                    heading_level = 1
+                elif line_font_size > avg_font_size * 1.3:
+                    heading_level = 2
+                elif line_font_size > avg_font_size * 1.15:
+                    heading_level = 3
+                else:
+                    heading_level = 0
+                
+                # Additional heading indicators
+                if heading_level == 0:
+                    # All caps + short = heading
+                    if len(full_line) < 100 and full_line.upper() == full_line and len(full_line) > 3:
+                        heading_level = 3
+                        full_line = full_line.title()
+                    # Ends with colon + short = subheading
+                    elif len(full_line) < 80 and full_line.endswith(':'):
+                        heading_level = 4
+                
+                if heading_level > 0:
+                    # Remove markdown formatting from headings
+                    clean_line = full_line.replace('**', '').replace('*', '').replace('`', '')
+                    markdown_content.append(f"\n{'#' * heading_level} {clean_line}\n\n")
+                    continue
+                
+                # 2. List detection (bullet or numbered)
+                stripped_line = full_line.lstrip()
+                
+                # Bullet list detection
+                if stripped_line and stripped_line[0] in ['•', '·', '◦', '▪', '▫', '-', '–', '—']:
+                    list_text = stripped_line[1:].strip()
+                    markdown_content.append(f"- {list_text}\n")
+                    continue
+                
+                # Numbered list detection (1., a., i., etc.)
+                import re
+                numbered_match = re.match(r'^(\d+|[a-z]|[ivxlcdm]+)[\.\)]\s+(.+)', stripped_line, re.IGNORECASE)
+                if numbered_match:
+                    list_text = numbered_match.group(2)
+                    markdown_content.append(f"1. {list_text}\n")
+                    continue
+                
+                # 3. Code block detection (multiple monospace spans)
+                if is_monospace or full_line.count('`') > 2:
+                    # Remove inline code markers for code block
+                    code_line = full_line.replace('`', '')
+                    # Check if previous line was also code
+                    if markdown_content and markdown_content[-1].startswith('    '):
+                        markdown_content.append(f"    {code_line}\n")
+                    else:
+                        markdown_content.append(f"\n    {code_line}\n")
+                    continue
+                
+                # 4. Regular paragraph
+                # Handle hyphenation
+                if full_line.endswith('-'):
+                    markdown_content.append(full_line[:-1])  # Remove hyphen
+                else:
+                    markdown_content.append(full_line)
+                    
+                    # Add proper line break
+                    if not full_line.endswith(('.', '!', '?', ':', ';')):
+                        markdown_content.append(" ")
+                    else:
+                        markdown_content.append("\n\n")
+    
+        # STEP 3: Add extracted tables at the end of page content
+        if tables_extracted:
+            markdown_content.append("\n\n")
+            for table_md in tables_extracted:
+                markdown_content.append(table_md)
+                markdown_content.append("\n\n")
+        
+        return {
+            'content': ''.join(markdown_content),
+            'tables': len(tables_extracted),
+            'warnings': warnings
+        }
+    
     def _table_to_markdown(self, table_data):
         """Convert table data to Markdown table format"""
         if not table_data or len(table_data) == 0:
@@ -770,116 +759,21 @@ class PDFConverter(BaseConverter):
         warnings = []
         
         try:
-            # Use pdfplumber for better structured extraction
-            with pdfplumber.open(input_file) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    html_parts.append(f'<div class="page">')
-                    html_parts.append(f'<div class="page-number">Page {page_num} of {len(pdf.pages)}</div>')
-                    
-                    # Extract text with layout preservation
-                    text = page.extract_text()
-                    if text:
-                        # Fix word spacing issues (use advanced fix for concatenated text)
-                        text = self._fix_concatenated_text(text)
-                        text = self._fix_word_spacing(text)
-                        
-                        # Split into lines for better processing
-                        lines = text.split('\n')
-                        current_paragraph = []
-                        in_list = False
-                        
-                        for line in lines:
-                            line = line.strip()
-                            if not line:
-                                # Empty line - end current paragraph
-                                if current_paragraph:
-                                    para_text = ' '.join(current_paragraph)
-                                    html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
-                                    current_paragraph = []
-                                if in_list:
-                                    html_parts.append('</ul>')
-                                    in_list = False
-                                continue
-                            
-                            # Detect headings by font size and formatting
-                            # Check if line is all uppercase and short (likely heading)
-                            if len(line) < 100 and line.isupper() and not any(char.isdigit() for char in line[:3]):
-                                if current_paragraph:
-                                    para_text = ' '.join(current_paragraph)
-                                    html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
-                                    current_paragraph = []
-                                html_parts.append(f'<h2>{self._escape_html(line.title())}</h2>')
-                            
-                            # Detect subheadings (lines ending with colon)
-                            elif len(line) < 80 and line.endswith(':') and not line.startswith(' '):
-                                if current_paragraph:
-                                    para_text = ' '.join(current_paragraph)
-                                    html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
-                                    current_paragraph = []
-                                html_parts.append(f'<h3>{self._escape_html(line)}</h3>')
-                            
-                            # Detect bullet points or numbered lists
-                            elif line.startswith(('•', '-', '*', '▪', '◦', '▫', '■', '□')) or \
-                                 (len(line) > 2 and line[0].isdigit() and line[1] in '.):'):
-                                if current_paragraph:
-                                    para_text = ' '.join(current_paragraph)
-                                    html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
-                                    current_paragraph = []
-                                if not in_list:
-                                    html_parts.append('<ul>')
-                                    in_list = True
-                                # Remove bullet/number prefix
-                                list_text = line.lstrip('•-*▪◦▫■□ ')
-                                if line[0].isdigit():
-                                    list_text = line.split('.', 1)[1].strip() if '.' in line else line
-                                html_parts.append(f'<li>{self._escape_html(list_text)}</li>')
-                            
-                            # Regular text line
-                            else:
-                                if in_list:
-                                    html_parts.append('</ul>')
-                                    in_list = False
-                                current_paragraph.append(line)
-                        
-                        # Close any remaining paragraph or list
-                        if current_paragraph:
-                            para_text = ' '.join(current_paragraph)
-                            html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
-                        if in_list:
-                            html_parts.append('</ul>')
-                    
-                    # Extract tables with better formatting
-                    tables = page.extract_tables()
-                    if tables:
-                        for table in tables:
-                            if table and len(table) > 0:
-                                html_parts.append('<table>')
-                                
-                                for row_idx, row in enumerate(table):
-                                    html_parts.append('<tr>')
-                                    tag = 'th' if row_idx == 0 else 'td'
-                                    
-                                    for cell in row:
-                                        if cell:
-                                            # Clean and escape cell content
-                                            cell_content = ' '.join(str(cell).split())
-                                            cell_content = self._escape_html(cell_content)
-                                        else:
-                                            cell_content = ''
-                                        html_parts.append(f'<{tag}>{cell_content}</{tag}>')
-                                    
-                                    html_parts.append('</tr>')
-                                
-                                html_parts.append('</table>')
-                    
-                    html_parts.append('</div>')
+            num_pages = 0
+            table_pages_skipped = 0
             
-            html_parts.extend(['</div>', '</body>', '</html>'])
-            
-            # Write to file with UTF-8 encoding
-            final_html = '\n'.join(html_parts)
-            with open(output_file, 'w', encoding='utf-8-sig') as f:
-                f.write(final_html)
+            # Write to file with UTF-8 encoding, page by page
+            with TextSink(output_file, encoding='utf-8-sig', separator='\n') as sink:
+                sink.write_parts(html_parts)
+                
+                for fragment in self._document_fragments(input_file, 'html', options):
+                    num_pages = fragment['page_count']
+                    table_pages_skipped += fragment.get('tables_skipped', False)
+                    warnings.extend(fragment['warnings'])
+                    sink.write_parts(fragment['parts'])
+                    sink.flush()
+                
+                sink.write_parts(['</div>', '</body>', '</html>'])
             
             logger.info(f"Successfully converted PDF to HTML: {output_file}")
             return self._create_success_result(
@@ -888,13 +782,461 @@ class PDFConverter(BaseConverter):
                 'pdf',
                 'html',
                 warnings=warnings,
-                metadata={'pages': len(pdf.pages)}
+                metadata={'pages': num_pages, 'table_pages_skipped': table_pages_skipped}
             )
             
         except Exception as e:
             logger.error(f"PDF to HTML conversion failed: {e}")
             raise
 
+    def _html_page(self, session: PDFDocumentSession, page: PageIR) -> Dict[str, Any]:
+        """Render one page of a PDF as a list of HTML parts"""
+        html_parts = []
+        warnings = []
+        
+        html_parts.append(f'<div class="page">')
+        html_parts.append(f'<div class="page-number">Page {page.number + 1} of {session.page_count}</div>')
+        
+        # pdfplumber layout text keeps the reading order of the page
+        text = page.layout_text
+        if text:
+            # Fix word spacing issues (use advanced fix for concatenated text)
+            text = self._fix_concatenated_text(text)
+            if not page.geometry:
+                text = self._fix_word_spacing(text)
+            
+            # Split into lines for better processing
+            lines = text.split('\n')
+            current_paragraph = []
+            in_list = False
+            
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    # Empty line - end current paragraph
+                    if current_paragraph:
+                        para_text = ' '.join(current_paragraph)
+                        html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
+                        current_paragraph = []
+                    if in_list:
+                        html_parts.append('</ul>')
+                        in_list = False
+                    continue
+                
+                # Detect headings by font size and formatting
+                # Check if line is all uppercase and short (likely heading)
+                if len(line) < 100 and line.isupper() and not any(char.isdigit() for char in line[:3]):
+                    if current_paragraph:
+                        para_text = ' '.join(current_paragraph)
+                        html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
+                        current_paragraph = []
+                    html_parts.append(f'<h2>{self._escape_html(line.title())}</h2>')
+                
+                # Detect subheadings (lines ending with colon)
+                elif len(line) < 80 and line.endswith(':') and not line.startswith(' '):
+                    if current_paragraph:
+                        para_text = ' '.join(current_paragraph)
+                        html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
+                        current_paragraph = []
+                    html_parts.append(f'<h3>{self._escape_html(line)}</h3>')
+                
+                # Detect bullet points or numbered lists
+                elif line.startswith(('•', '-', '*', '▪', '◦', '▫', '■', '□')) or \
+                     (len(line) > 2 and line[0].isdigit() and line[1] in '.):'):
+                    if current_paragraph:
+                        para_text = ' '.join(current_paragraph)
+                        html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
+                        current_paragraph = []
+                    if not in_list:
+                        html_parts.append('<ul>')
+                        in_list = True
+                    # Remove bullet/number prefix
+                    list_text = line.lstrip('•-*▪◦▫■□ ')
+                    if line[0].isdigit():
+                        list_text = line.split('.', 1)[1].strip() if '.' in line else line
+                    html_parts.append(f'<li>{self._escape_html(list_text)}</li>')
+                
+                # Regular text line
+                else:
+                    if in_list:
+                        html_parts.append('</ul>')
+                        in_list = False
+                    current_paragraph.append(line)
+            
+            # Close any remaining paragraph or list
+            if current_paragraph:
+                para_text = ' '.join(current_paragraph)
+                html_parts.append(f'<p>{self._escape_html(para_text)}</p>')
+            if in_list:
+                html_parts.append('</ul>')
+        
+        # Tables with better formatting
+        if page.table_error:
+            warnings.append(f"Table extraction failed on page {page.number + 1}: {page.table_error}")
+        tables = [t.rows for t in page.tables]
+        if tables:
+            for table in tables:
+                if table and len(table) > 0:
+                    html_parts.append('<table>')
+                    
+                    for row_idx, row in enumerate(table):
+                        html_parts.append('<tr>')
+                        tag = 'th' if row_idx == 0 else 'td'
+                        
+                        for cell in row:
+                            if cell:
+                                # Clean and escape cell content
+                                cell_content = ' '.join(str(cell).split())
+                                cell_content = self._escape_html(cell_content)
+                            else:
+                                cell_content = ''
+                            html_parts.append(f'<{tag}>{cell_content}</{tag}>')
+                        
+                        html_parts.append('</tr>')
+                    
+                    html_parts.append('</table>')
+        
+        html_parts.append('</div>')
+        
+        return {'parts': html_parts, 'warnings': warnings}
+    
+    # ==================== PAGE-PARALLEL PIPELINE ====================
+    
+    def _render_page(self, session: PDFDocumentSession, kind: str, page_num: int,
+                     extraction: str = 'text') -> Dict[str, Any]:
+        """
+        Render a single page into a fragment of the given kind
+        
+        Kinds are 'markdown', 'html' and 'docx'; 'ir' returns the extracted
+        page itself (fragment['ir']) without rendering it. extraction is one
+        of EXTRACTION_MODES.
+        """
+        # Only the HTML renderer reads the (expensive) pdfplumber layout text
+        page = extract_page(session, page_num, layout_text=kind in ('html', 'ir'),
+                            geometry=extraction == 'geometry')
+        
+        if kind == 'ir':
+            fragment = {'ir': page, 'warnings': []}
+        else:
+            fragment = self._render_page_ir(session, kind, page)
+        fragment['page'] = page_num
+        fragment['page_count'] = session.page_count
+        return fragment
+    
+    def _render_page_ir(self, session: PDFDocumentSession, kind: str, page: PageIR) -> Dict[str, Any]:
+        """Render an extracted page into a fragment of the given kind ('markdown', 'html', 'docx')"""
+        renderers = {
+            'markdown': self._markdown_page,
+            'html': self._html_page,
+            'docx': self._docx_page,
+        }
+        fragment = renderers[kind](session, page)
+        fragment['tables_skipped'] = page.tables_skipped
+        return fragment
+    
+    def _page_fragments(self, input_file: str, kind: str, workers: int = 1,
+                        page_numbers: Optional[List[int]] = None,
+                        extraction: str = 'text') -> Iterator[Dict[str, Any]]:
+        """
+        Render the pages of a PDF and yield the fragments in page order
+        
+        With more than one worker, contiguous page chunks are rendered in a
+        process pool (each worker opens its own PDF session) and merged back
+        in page order.
+        
+        Args:
+            input_file: Path to PDF file
+            kind: Fragment kind ('markdown', 'html' or 'docx')
+            workers: Number of worker processes (1 = serial, 0 = one per CPU core)
+            page_numbers: Ascending 0-based page indices to render (default: all pages)
+            extraction: Text extraction mode ('text' or 'geometry')
+        
+        Yields:
+            Fragment dictionaries with 'page' and 'page_count' keys
+        """
+        session = PDFDocumentSession(input_file)
+        
+        try:
+            if page_numbers is None:
+                page_numbers = list(range(session.page_count))
+            num_pages = len(page_numbers)
+            if num_pages == 0:
+                return
+            workers = self._resolve_workers(workers, num_pages)
+            
+            if workers <= 1:
+                for page_num in page_numbers:
+                    yield self._render_page(session, kind, page_num, extraction)
+                return
+            
+            # Workers open their own handles, release ours before starting them
+            session.close()
+            
+            chunks = [
+                [page_numbers[i] for i in chunk]
+                for chunk in self._chunk_pages(num_pages, workers)
+            ]
+            logger.info(f"Rendering {num_pages} pages with {workers} workers ({len(chunks)} chunks)")
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for fragments in executor.map(_render_page_chunk, repeat(input_file), repeat(kind), chunks,
+                                              repeat(extraction)):
+                    yield from fragments
+        finally:
+            session.close()
+    
+    def _ir_fragments(self, input_file: str, kind: str, document_ir: DocumentIR,
+                      page_numbers: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Render the pages of an already extracted document (only page_numbers, if given)"""
+        # The session only serves image bytes and the page count here
+        with PDFDocumentSession(input_file) as session:
+            for page in document_ir.pages:
+                if page_numbers is not None and page.number not in page_numbers:
+                    continue
+                fragment = self._render_page_ir(session, kind, page)
+                fragment['page'] = page.number
+                fragment['page_count'] = document_ir.page_count
+                yield fragment
+    
+    def extract_document(self, input_file: str, workers: Optional[int] = None,
+                         extraction: str = 'text', pages: PageSpec = None) -> DocumentIR:
+        """
+        Extract a PDF into the format-neutral document IR
+        
+        The IR holds everything the Markdown, HTML and DOCX renderers need, so
+        it can be rendered to several formats (see convert_many) or serialized
+        with DocumentIR.to_json() and cached.
+        
+        Args:
+            input_file: Path to PDF file
+            workers: Worker processes (default: PDF_WORKERS)
+            extraction: Text extraction mode ('text' or 'geometry')
+            pages: Only extract these 1-based pages, e.g. "1-5,10" (default: all pages)
+        
+        Returns:
+            DocumentIR
+        
+        Raises:
+            ValueError: If pages is not a valid selection
+        """
+        workers = PDF_WORKERS if workers is None else workers
+        page_numbers = self._parse_pages(input_file, pages)
+        page_irs = []
+        page_count = 0
+        
+        for fragment in self._page_fragments(input_file, 'ir', workers, page_numbers, extraction):
+            page_irs.append(fragment['ir'])
+            page_count = fragment['page_count']
+        
+        with fitz.open(input_file) as doc:
+            metadata = doc.metadata or {}
+        
+        return DocumentIR(source=str(input_file), page_count=page_count, pages=page_irs, metadata=metadata)
+    
+    def convert_many(self, input_file: str, output_files: Dict[str, str], **options) -> Dict[str, ConversionResult]:
+        """
+        Convert one PDF to several formats, extracting the document only once
+        
+        Args:
+            input_file: Path to PDF file
+            output_files: Mapping of output format ('markdown', 'html', 'docx') to output path
+            **options: Conversion options (see convert); 'document_ir' may pass
+                       a previously extracted DocumentIR
+        
+        Returns:
+            Mapping of output format to ConversionResult
+        """
+        if options.get('use_ocr'):
+            # OCR paths do not use the text-layer IR (repeated OCR is served by the OCR cache)
+            return {
+                fmt: self.convert(input_file, output_file, **options)
+                for fmt, output_file in output_files.items()
+            }
+        
+        document_ir = options.get('document_ir')
+        if document_ir is None and Path(input_file).is_file():
+            start_time = time.time()
+            try:
+                document_ir = self.extract_document(input_file, options.get('workers', PDF_WORKERS),
+                                                    options.get('extraction', 'text'), options.get('pages'))
+            except ValueError as e:
+                return {fmt: self._create_error_result(input_file, str(e), 'pdf', fmt) for fmt in output_files}
+            logger.info(f"Extracted {document_ir.page_count} pages in {time.time() - start_time:.2f}s "
+                        f"for {len(output_files)} output formats")
+        
+        return {
+            fmt: self.convert(input_file, output_file, **{**options, 'document_ir': document_ir})
+            for fmt, output_file in output_files.items()
+        }
+    
+    @staticmethod
+    def _resolve_workers(workers: Optional[int], num_pages: int) -> int:
+        """Clamp requested worker count to [1, num_pages]; 0/None means one per CPU core"""
+        if not workers:
+            workers = os.cpu_count() or 1
+        return max(1, min(int(workers), num_pages))
+    
+    @staticmethod
+    def _chunk_pages(num_pages: int, workers: int) -> List[List[int]]:
+        """Split page indices into contiguous chunks (about 4 per worker for load balancing)"""
+        chunk_size = max(1, -(-num_pages // (workers * 4)))
+        return [
+            list(range(start, min(start + chunk_size, num_pages)))
+            for start in range(0, num_pages, chunk_size)
+        ]
+    
+    @staticmethod
+    def _parse_pages(input_file: str, pages: PageSpec) -> Optional[List[int]]:
+        """0-based indices of a "1-5,10" style page selection (None = all pages); raises ValueError"""
+        if pages is None:
+            return None
+        with fitz.open(input_file) as doc:
+            return parse_page_ranges(pages, len(doc))
+    
+    @staticmethod
+    def _selected_pages(options: Dict[str, Any], page_count: int) -> List[int]:
+        """0-based pages to convert (the selection resolved by convert, default: all pages)"""
+        page_numbers = options.get('page_numbers')
+        return list(range(page_count)) if page_numbers is None else page_numbers
+    
+    # ==================== PER-PAGE OCR ROUTING ====================
+    
+    def _score_page(self, page) -> Dict[str, Any]:
+        """
+        Score the text layer of a page and decide how to extract it
+        
+        Args:
+            page: PyMuPDF page
+        
+        Returns:
+            dict with 'route' ('text' or 'ocr'), 'reason' and the page scores
+        """
+        text = page.get_text()
+        chars = len(text.strip())
+        words = text.split()
+        
+        # Concatenated words (no space between lower and upper case letters)
+        concat_ratio = len(re.findall(r'[a-z][A-Z]', text)) / len(words) if words else 0.0
+        
+        # Very long words are usually several words run together
+        long_word_ratio = sum(1 for w in words if len(w) > 25) / len(words) if words else 0.0
+        
+        # Share of the page covered by images (scans are one big image)
+        page_area = abs(page.rect)
+        image_area = sum(abs(fitz.Rect(info['bbox']) & page.rect) for info in page.get_image_info())
+        image_coverage = min(1.0, image_area / page_area) if page_area else 0.0
+        
+        if chars < 50 and image_coverage >= 0.3:
+            route, reason = 'ocr', 'No text layer on image page'
+        elif image_coverage >= 0.8 and chars < 200:
+            route, reason = 'ocr', 'Page is mostly an image'
+        elif len(words) >= 20 and (concat_ratio > 0.15 or long_word_ratio > 0.1):
+            route, reason = 'ocr', 'Text layer has extraction issues'
+        else:
+            route, reason = 'text', 'Usable text layer'
+        
+        return {
+            'page': page.number,
+            'route': route,
+            'reason': reason,
+            'chars': chars,
+            'concat_ratio': round(concat_ratio, 3),
+            'long_word_ratio': round(long_word_ratio, 3),
+            'image_coverage': round(image_coverage, 3)
+        }
+    
+    def route_pages(self, input_file: str, page_numbers: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Decide for every page whether to use the text layer or OCR
+        
+        Args:
+            input_file: Path to PDF file
+            page_numbers: 0-based page indices to score (default: all pages)
+        
+        Returns:
+            List of per-page routing decisions (see _score_page)
+        """
+        with fitz.open(input_file) as doc:
+            if page_numbers is None:
+                return [self._score_page(page) for page in doc]
+            return [self._score_page(doc[page_num]) for page_num in page_numbers]
+    
+    def _document_fragments(self, input_file: str, kind: str, options: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield page fragments in page order, OCR-ing the pages listed in options['ocr_pages']
+        
+        Text-layer pages go through the page-parallel pipeline, OCR pages
+        through the OCR pool; both streams are merged by page number.
+        """
+        workers = options.get('workers', PDF_WORKERS)
+        extraction = options.get('extraction', 'text')
+        ocr_pages = sorted(options.get('ocr_pages') or [])
+        page_numbers = options.get('page_numbers')
+        
+        if options.get('document_ir') is not None:
+            yield from self._ir_fragments(input_file, kind, options['document_ir'], page_numbers)
+            return
+        
+        if not ocr_pages:
+            yield from self._page_fragments(input_file, kind, workers, page_numbers, extraction)
+            return
+        
+        with fitz.open(input_file) as doc:
+            page_count = len(doc)
+        
+        ocr_set = set(ocr_pages)
+        text_pages = [page_num for page_num in self._selected_pages(options, page_count) if page_num not in ocr_set]
+        
+        yield from heapq.merge(
+            self._page_fragments(input_file, kind, workers, text_pages, extraction),
+            self._ocr_page_fragments(input_file, kind, ocr_pages, page_count, options),
+            key=lambda fragment: fragment['page']
+        )
+    
+    def _ocr_page_fragments(self, input_file: str, kind: str, page_numbers: List[int],
+                            page_count: int, options: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """OCR the given pages and yield fragments shaped like the text-layer ones"""
+        from ai.ocr_pool import OCRPool
+        
+        setup_warnings = []
+        if not self._setup_tesseract():
+            setup_warnings.append("Tesseract not found, OCR may not work properly")
+        
+        with OCRPool(options.get('ocr_workers')) as pool:
+            for page_result in pool.ocr_pages(input_file, page_numbers, zoom=options.get('ocr_dpi', 2),
+                                              lang=options.get('ocr_lang', 'eng'), config=self.OCR_CONFIG):
+                page_num = page_result['page']
+                text = page_result['text'] if not page_result['error'] else ''
+                warnings = setup_warnings
+                setup_warnings = []
+                
+                if page_result['error']:
+                    warnings.append(f"Page {page_num + 1}: OCR failed - {page_result['error']}")
+                elif not text.strip():
+                    warnings.append(f"Page {page_num + 1}: No text detected via OCR")
+                
+                paragraphs = [' '.join(para.split()) for para in text.strip().split('\n\n') if para.strip()]
+                
+                if kind == 'markdown':
+                    header = "\n\n---\n\n" if page_num > 0 else ""
+                    content = f"{header}## Page {page_num + 1}\n\n"
+                    if text.strip():
+                        content += self._clean_ocr_text(text) + "\n\n"
+                    fragment = {'content': content, 'tables': 0}
+                elif kind == 'html':
+                    parts = ['<div class="page">', f'<div class="page-number">Page {page_num + 1} of {page_count}</div>']
+                    parts.extend(f'<p>{self._escape_html(para)}</p>' for para in paragraphs)
+                    parts.append('</div>')
+                    fragment = {'parts': parts}
+                else:
+                    fragment = {'items': [
+                        ('paragraph', self._clean_text_for_xml(para), 'Normal', False)
+                        for para in paragraphs
+                    ]}
+                
+                fragment.update({'warnings': warnings, 'page': page_num, 'page_count': page_count})
+                yield fragment
+    
     # ==================== OCR-BASED CONVERSION METHODS ====================
     
     def _setup_tesseract(self):
@@ -924,27 +1266,9 @@ class PDFConverter(BaseConverter):
         except:
             pass
         
-        return False
-    
-    def _pdf_page_to_image(self, page, dpi_multiplier: int = 2) -> Image.Image:
-        """Convert a PyMuPDF page to PIL Image"""
-        # Create high-resolution pixmap
-        matrix = fitz.Matrix(dpi_multiplier, dpi_multiplier)
-        pix = page.get_pixmap(matrix=matrix)
-        
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        return img
-    
-    def _ocr_image(self, img: Image.Image, lang: str = 'eng') -> str:
-        """Perform OCR on an image"""
-        import pytesseract
-        
-        # Configure Tesseract for better results
-        custom_config = r'--oem 3 --psm 6'
-        
-        text = pytesseract.image_to_string(img, lang=lang, config=custom_config)
-        return text
+        # In-process Tesseract bindings work without the executable
+        from ai.ocr_backends import get_ocr_backend
+        return get_ocr_backend().is_available()
     
     def _pdf_to_markdown_ocr(self, input_file: str, output_file: str, **options) -> ConversionResult:
         """Convert PDF to Markdown using OCR (better for presentations and scanned documents)"""
@@ -960,8 +1284,8 @@ class PDFConverter(BaseConverter):
         
         try:
             import pytesseract
+            from ai.ocr_pool import OCRPool
             doc = fitz.open(input_file)
-            markdown_content = []
             
             # Get document title from metadata or filename
             metadata = doc.metadata
@@ -969,40 +1293,33 @@ class PDFConverter(BaseConverter):
             if not title:
                 title = Path(input_file).stem.replace('_', ' ')
             
-            markdown_content.append(f"# {title}\n\n")
+            num_pages = len(doc)
+            doc.close()
+            page_numbers = self._selected_pages(options, num_pages)
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
+            # Rasterize and OCR pages in the worker pool, results arrive in page order
+            # and are written as they come
+            with TextSink(output_file) as sink, OCRPool(options.get('ocr_workers')) as pool:
+                sink.write(f"# {title}\n\n")
                 
-                # Convert page to image
-                img = self._pdf_page_to_image(page, dpi_multiplier)
-                
-                # OCR the image
-                try:
-                    text = self._ocr_image(img, ocr_lang)
+                for page_result in pool.ocr_pages(input_file, page_numbers, zoom=dpi_multiplier,
+                                                  lang=ocr_lang, config=self.OCR_CONFIG):
+                    page_num = page_result['page']
+                    text = page_result['text']
                     
-                    if text.strip():
+                    if page_result['error']:
+                        warnings.append(f"Page {page_num + 1}: OCR failed - {page_result['error']}")
+                    elif text.strip():
                         # Add page header for multi-page documents
-                        if len(doc) > 1:
-                            markdown_content.append(f"---\n\n## Page {page_num + 1}\n\n")
+                        if num_pages > 1:
+                            sink.write(f"---\n\n## Page {page_num + 1}\n\n")
                         
                         # Clean up OCR text
-                        cleaned_text = self._clean_ocr_text(text)
-                        markdown_content.append(cleaned_text)
-                        markdown_content.append("\n\n")
+                        sink.write(self._clean_ocr_text(text))
+                        sink.write("\n\n")
+                        sink.flush()
                     else:
                         warnings.append(f"Page {page_num + 1}: No text detected via OCR")
-                        
-                except Exception as e:
-                    warnings.append(f"Page {page_num + 1}: OCR failed - {e}")
-            
-            num_pages = len(doc)
-            doc.close()
-            
-            # Write to file
-            final_content = ''.join(markdown_content)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(final_content)
             
             logger.info(f"Successfully converted PDF to Markdown (OCR): {output_file}")
             return self._create_success_result(
@@ -1021,36 +1338,8 @@ class PDFConverter(BaseConverter):
             raise
     
     def _clean_ocr_text(self, text: str) -> str:
-        """Clean up OCR output text"""
-        if not text:
-            return ''
-        
-        # Remove multiple blank lines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # Fix common OCR errors
-        text = text.replace('|', 'I')  # Common OCR confusion
-        
-        # Clean up line breaks within paragraphs (keep paragraph breaks)
-        lines = text.split('\n')
-        cleaned_lines = []
-        current_paragraph = []
-        
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                # Empty line indicates paragraph break
-                if current_paragraph:
-                    cleaned_lines.append(' '.join(current_paragraph))
-                    current_paragraph = []
-                cleaned_lines.append('')
-            else:
-                current_paragraph.append(stripped)
-        
-        if current_paragraph:
-            cleaned_lines.append(' '.join(current_paragraph))
-        
-        return '\n\n'.join([l for l in cleaned_lines if l or (cleaned_lines.index(l) > 0 and cleaned_lines[cleaned_lines.index(l)-1])])
+        """Clean up OCR output text (joins the lines of each paragraph)"""
+        return join_ocr_paragraphs(text)
     
     def _pdf_to_html_ocr(self, input_file: str, output_file: str, **options) -> ConversionResult:
         """Convert PDF to HTML using OCR"""
@@ -1066,6 +1355,7 @@ class PDFConverter(BaseConverter):
         
         try:
             import pytesseract
+            from ai.ocr_pool import OCRPool
             doc = fitz.open(input_file)
             
             # Get document title
@@ -1074,7 +1364,7 @@ class PDFConverter(BaseConverter):
             if not title:
                 title = Path(input_file).stem.replace('_', ' ')
             
-            html_parts = [
+            head_parts = [
                 '<!DOCTYPE html>',
                 '<html lang="en">',
                 '<head>',
@@ -1092,18 +1382,26 @@ class PDFConverter(BaseConverter):
                 f'<h1>{self._escape_html(title)}</h1>',
             ]
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Convert page to image
-                img = self._pdf_page_to_image(page, dpi_multiplier)
+            num_pages = len(doc)
+            doc.close()
+            page_numbers = self._selected_pages(options, num_pages)
+            
+            # Rasterize and OCR pages in the worker pool, results arrive in page order
+            # and are written as they come
+            with TextSink(output_file, separator='\n') as sink, OCRPool(options.get('ocr_workers')) as pool:
+                sink.write_parts(head_parts)
                 
-                # OCR the image
-                try:
-                    text = self._ocr_image(img, ocr_lang)
+                for page_result in pool.ocr_pages(input_file, page_numbers, zoom=dpi_multiplier,
+                                                  lang=ocr_lang, config=self.OCR_CONFIG):
+                    page_num = page_result['page']
+                    text = page_result['text']
+                    
+                    if page_result['error']:
+                        warnings.append(f"Page {page_num + 1}: OCR failed - {page_result['error']}")
+                        continue
                     
-                    html_parts.append(f'<div class="page">')
-                    if len(doc) > 1:
+                    html_parts = [f'<div class="page">']
+                    if num_pages > 1:
                         html_parts.append(f'<div class="page-header">Page {page_num + 1}</div>')
                     
                     if text.strip():
@@ -1117,19 +1415,10 @@ class PDFConverter(BaseConverter):
                         warnings.append(f"Page {page_num + 1}: No text detected via OCR")
                     
                     html_parts.append('</div>')
-                    
-                except Exception as e:
-                    warnings.append(f"Page {page_num + 1}: OCR failed - {e}")
-            
-            num_pages = len(doc)
-            doc.close()
-            
-            html_parts.extend(['</body>', '</html>'])
-            
-            # Write to file
-            final_html = '\n'.join(html_parts)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(final_html)
+                    sink.write_parts(html_parts)
+                    sink.flush()
+                
+                sink.write_parts(['</body>', '</html>'])
             
             logger.info(f"Successfully converted PDF to HTML (OCR): {output_file}")
             return self._create_success_result(
@@ -1161,6 +1450,7 @@ class PDFConverter(BaseConverter):
         
         try:
             import pytesseract
+            from ai.ocr_pool import OCRPool
             doc = Document()
             pdf_doc = fitz.open(input_file)
             
@@ -1173,17 +1463,22 @@ class PDFConverter(BaseConverter):
             # Add title
             title_para = doc.add_heading(title, level=0)
             
-            for page_num in range(len(pdf_doc)):
-                page = pdf_doc[page_num]
-                
-                # Convert page to image
-                img = self._pdf_page_to_image(page, dpi_multiplier)
-                
-                # OCR the image
-                try:
-                    text = self._ocr_image(img, ocr_lang)
+            num_pages = len(pdf_doc)
+            pdf_doc.close()
+            page_numbers = self._selected_pages(options, num_pages)
+            
+            # Rasterize and OCR pages in the worker pool, results arrive in page order
+            with OCRPool(options.get('ocr_workers')) as pool:
+                for page_result in pool.ocr_pages(input_file, page_numbers, zoom=dpi_multiplier,
+                                                  lang=ocr_lang, config=self.OCR_CONFIG):
+                    page_num = page_result['page']
+                    text = page_result['text']
                     
-                    if len(pdf_doc) > 1:
+                    if page_result['error']:
+                        warnings.append(f"Page {page_num + 1}: OCR failed - {page_result['error']}")
+                        continue
+                    
+                    if num_pages > 1:
                         doc.add_heading(f'Page {page_num + 1}', level=1)
                     
                     if text.strip():
@@ -1198,14 +1493,8 @@ class PDFConverter(BaseConverter):
                         warnings.append(f"Page {page_num + 1}: No text detected via OCR")
                     
                     # Add page break except for last page
-                    if page_num < len(pdf_doc) - 1:
+                    if page_num < page_numbers[-1]:
                         doc.add_page_break()
-                        
-                except Exception as e:
-                    warnings.append(f"Page {page_num + 1}: OCR failed - {e}")
-            
-            num_pages = len(pdf_doc)
-            pdf_doc.close()
             
             # Save document
             doc.save(output_file)
@@ -1226,11 +1515,26 @@ class PDFConverter(BaseConverter):
             logger.error(f"PDF to DOCX (OCR) conversion failed: {e}")
             raise
     
+    @staticmethod
+    def _text_layer_issues(sample_text: str) -> Tuple[int, int]:
+        """Count signs of missing word spaces: (lower/upper case joins, words over 25 chars)"""
+        # Check for concatenated words (no spaces between capitals)
+        concatenation_count = len(re.findall(r'[a-z][A-Z]', sample_text))
+        
+        # Check for very long words (likely concatenated)
+        long_word_count = sum(1 for w in sample_text.split() if len(w) > 25)
+        return concatenation_count, long_word_count
+    
     def detect_if_ocr_needed(self, input_file: str) -> dict:
         """Analyze PDF and suggest whether OCR should be used
         
+        When the text layer has missing word spaces, the sample is extracted
+        again from glyph positions; if that fixes it, the cheaper geometry
+        extraction (extraction='geometry') is suggested instead of OCR.
+        
         Returns:
-            dict with 'recommended': bool, 'reason': str, 'confidence': float
+            dict with 'recommended': bool, 'reason': str, 'confidence': float,
+            'mode': 'text', 'geometry' or 'ocr'
         """
         try:
             doc = fitz.open(input_file)
@@ -1244,51 +1548,75 @@ class PDFConverter(BaseConverter):
                 is_presentation = 1.3 < aspect_ratio < 2.0  # 4:3 = 1.33, 16:9 = 1.78
                 
                 # Check 2: Sample text extraction quality
+                sample_pages = range(min(3, len(doc)))
                 sample_text = ""
-                for i in range(min(3, len(doc))):
+                for i in sample_pages:
                     sample_text += doc[i].get_text()
                 
-                # Check for concatenated words (no spaces between capitals)
-                concatenation_pattern = re.compile(r'[a-z][A-Z]')
-                concatenation_count = len(concatenation_pattern.findall(sample_text))
+                concatenation_count, long_word_count = self._text_layer_issues(sample_text)
+                
+                has_issues = (
+                    (is_presentation and (concatenation_count > 10 or long_word_count > 5)) or
+                    concatenation_count > 20 or long_word_count > 10
+                )
                 
-                # Check for very long words (likely concatenated)
-                words = sample_text.split()
-                long_words = [w for w in words if len(w) > 25]
+                # Check 3: Word gaps from glyph positions
+                geometry_clean = False
+                if has_issues:
+                    geometry_text = '\n'.join(
+                        ''.join(geometry_span_texts(line))
+                        for i in sample_pages
+                        for block in doc[i].get_text("rawdict").get("blocks", [])
+                        for line in block.get("lines", [])
+                    )
+                    geometry_concatenations, geometry_long_words = self._text_layer_issues(geometry_text)
+                    geometry_clean = geometry_concatenations <= 10 and geometry_long_words <= 5
                 
                 doc.close()
                 
                 # Decision logic
-                if is_presentation and (concatenation_count > 10 or len(long_words) > 5):
+                if has_issues and geometry_clean:
+                    return {
+                        'recommended': False,
+                        'reason': 'Missing word spaces can be rebuilt from glyph positions (geometry extraction)',
+                        'confidence': 0.8,
+                        'mode': 'geometry'
+                    }
+                elif is_presentation and (concatenation_count > 10 or long_word_count > 5):
                     return {
                         'recommended': True,
                         'reason': 'Presentation format with text extraction issues detected',
-                        'confidence': 0.9
+                        'confidence': 0.9,
+                        'mode': 'ocr'
                     }
-                elif concatenation_count > 20 or len(long_words) > 10:
+                elif concatenation_count > 20 or long_word_count > 10:
                     return {
                         'recommended': True,
                         'reason': 'Significant text extraction issues detected',
-                        'confidence': 0.8
+                        'confidence': 0.8,
+                        'mode': 'ocr'
                     }
                 elif is_presentation:
                     return {
                         'recommended': True,
                         'reason': 'Presentation format detected (OCR often produces better results)',
-                        'confidence': 0.6
+                        'confidence': 0.6,
+                        'mode': 'ocr'
                     }
                 else:
                     return {
                         'recommended': False,
                         'reason': 'Standard document, text extraction should work well',
-                        'confidence': 0.7
+                        'confidence': 0.7,
+                        'mode': 'text'
                     }
                     
         except Exception as e:
             return {
                 'recommended': False,
                 'reason': f'Could not analyze PDF: {e}',
-                'confidence': 0.0
+                'confidence': 0.0,
+                'mode': 'text'
             }
     
     def _pdf_to_markdown_math_ocr(self, input_file: str, output_file: str, **options) -> ConversionResult:
@@ -1309,6 +1637,7 @@ class PDFConverter(BaseConverter):
         
         try:
             import pytesseract
+            from ai.ocr_pool import OCRPool
             from ai.math_ocr_processor import MathOCRProcessor
             
             doc = fitz.open(input_file)
@@ -1322,30 +1651,23 @@ class PDFConverter(BaseConverter):
             # Process all pages with high-resolution OCR
             all_page_texts = []
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # High-resolution rendering for better OCR
-                matrix = fitz.Matrix(dpi_multiplier, dpi_multiplier)
-                pix = page.get_pixmap(matrix=matrix)
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                
-                # OCR with settings optimized for academic content
-                custom_config = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
-                
-                try:
-                    text = pytesseract.image_to_string(img, lang=ocr_lang, config=custom_config)
+            num_pages = len(doc)
+            doc.close()
+            page_numbers = self._selected_pages(options, num_pages)
+            
+            # High-resolution OCR in the worker pool, results arrive in page order
+            with OCRPool(options.get('ocr_workers')) as pool:
+                for page_result in pool.ocr_pages(input_file, page_numbers, zoom=dpi_multiplier,
+                                                  lang=ocr_lang, config=self.MATH_OCR_CONFIG):
+                    page_num = page_result['page']
+                    text = page_result['text']
                     
-                    if text.strip():
+                    if page_result['error']:
+                        warnings.append(f"Page {page_num + 1}: OCR failed - {page_result['error']}")
+                    elif text.strip():
                         all_page_texts.append(f"## Page {page_num + 1}\n\n{text}")
                     else:
                         warnings.append(f"Page {page_num + 1}: No text detected via OCR")
-                        
-                except Exception as e:
-                    warnings.append(f"Page {page_num + 1}: OCR failed - {e}")
-            
-            num_pages = len(doc)
-            doc.close()
             
             # Combine all pages
             raw_ocr_text = '\n\n---\n\n'.join(all_page_texts)
@@ -1404,6 +1726,7 @@ class PDFConverter(BaseConverter):
         
         try:
             import pytesseract
+            from ai.ocr_pool import OCRPool
             from ai.llm_post_processor import LLMPostProcessor
             
             # Initialize LLM processor
@@ -1429,48 +1752,37 @@ class PDFConverter(BaseConverter):
             if not title:
                 title = Path(input_file).stem.replace('_', ' ')
             
-            # Process all pages with high-resolution OCR
-            all_page_texts = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # High-resolution rendering
-                matrix = fitz.Matrix(dpi_multiplier, dpi_multiplier)
-                pix = page.get_pixmap(matrix=matrix)
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                
-                # OCR with optimized settings
-                custom_config = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
-                
-                try:
-                    text = pytesseract.image_to_string(img, lang=ocr_lang, config=custom_config)
+            num_pages = len(doc)
+            doc.close()
+            page_numbers = self._selected_pages(options, num_pages)
+            
+            def ocr_page_texts(pool):
+                """High-resolution OCR in the worker pool, results arrive in page order"""
+                for page_result in pool.ocr_pages(input_file, page_numbers, zoom=dpi_multiplier,
+                                                  lang=ocr_lang, config=self.MATH_OCR_CONFIG):
+                    page_num = page_result['page']
+                    text = page_result['text']
                     
-                    if text.strip():
-                        all_page_texts.append(f"=== Page {page_num + 1} ===\n\n{text}")
+                    if page_result['error']:
+                        warnings.append(f"Page {page_num + 1}: OCR failed - {page_result['error']}")
+                    elif text.strip():
+                        yield f"=== Page {page_num + 1} ===\n\n{text}"
                     else:
                         warnings.append(f"Page {page_num + 1}: No text detected via OCR")
-                        
-                except Exception as e:
-                    warnings.append(f"Page {page_num + 1}: OCR failed - {e}")
-            
-            num_pages = len(doc)
-            doc.close()
             
-            # Combine all pages
-            raw_ocr_text = '\n\n'.join(all_page_texts)
-            
-            # Process with LLM
+            # Pages stream through OCR and the LLM; each processed chunk is written right away
             logger.info("Processing with LLM (this may take a moment)...")
-            processed_content, llm_metadata = llm_processor.process_math_document(raw_ocr_text)
-            
-            # Add title if not present
-            if not processed_content.startswith('#'):
-                processed_content = f"# {title}\n\n{processed_content}"
-            
-            # Write to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(processed_content)
+            llm_metadata = {}
+            with TextSink(output_file, separator='\n\n') as sink, OCRPool(options.get('ocr_workers')) as pool:
+                for chunk in llm_processor.process_math_pages(ocr_page_texts(pool), llm_metadata):
+                    # Add title if not present
+                    if not sink.chars_written and not chunk.startswith('#'):
+                        sink.write(f"# {title}\n\n")
+                    sink.write_parts([chunk])
+                    sink.flush()
+                
+                if not sink.chars_written:
+                    sink.write(f"# {title}\n\n")
             
             logger.info(f"Successfully converted PDF to Markdown (LLM-Enhanced): {output_file}")
             return self._create_success_result(
@@ -1495,3 +1807,24 @@ class PDFConverter(BaseConverter):
         except Exception as e:
             logger.error(f"PDF to Markdown (LLM-Enhanced) conversion failed: {e}")
             raise
+
+
+def _render_page_chunk(input_file: str, kind: str, page_nums: List[int],
+                       extraction: str = 'text') -> List[Dict[str, Any]]:
+    """
+    Render a chunk of pages in a worker process
+    
+    Module-level so ProcessPoolExecutor can pickle it.
+    
+    Args:
+        input_file: Path to PDF file
+        kind: Fragment kind ('markdown', 'html' or 'docx')
+        page_nums: 0-based page indices to render
+        extraction: Text extraction mode ('text' or 'geometry')
+    
+    Returns:
+        List of fragment dictionaries in page order
+    """
+    converter = PDFConverter()
+    with PDFDocumentSession(input_file) as session:
+        return [converter._render_page(session, kind, page_num, extraction) for page_num in page_nums]
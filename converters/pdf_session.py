@@ -0,0 +1,177 @@
+"""
+PDF document session - keeps PDF handles open for the lifetime of one conversion
+"""
+from typing import List, Dict, Any
+import fitz  # PyMuPDF
+import pdfplumber
+
+from utils.logger import logger
+
+
+class PDFDocumentSession:
+    """
+    Shared per-conversion view of a PDF document
+    
+    Opening a PDF with PyMuPDF or pdfplumber parses the whole file, so the
+    converters open it once through a session and ask it for pages and tables
+    instead of reopening the document for every page.
+    
+    Features:
+    - One PyMuPDF (fitz) handle, opened eagerly
+    - One pdfplumber handle, opened lazily on first use
+    - Per-page table cache (each page is run through the table finder once)
+    - Ruling-line pre-check that skips the table finder on pages without tables
+    - Per-xref image cache (a logo on every page is read once)
+    """
+    
+    # pdfplumber drops edges shorter than this before joining collinear pieces
+    # (edge_min_length_prefilter), so shorter segments can never form a table
+    MIN_RULING_LENGTH = 1
+    
+    def __init__(self, input_file: str):
+        """
+        Open a PDF session
+        
+        Args:
+            input_file: Path to PDF file
+        """
+        self.input_file = str(input_file)
+        self.doc = fitz.open(self.input_file)
+        self._plumber = None
+        self._tables: Dict[int, List[Dict[str, Any]]] = {}
+        self._images: Dict[int, bytes] = {}
+    
+    def __enter__(self) -> 'PDFDocumentSession':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.page_count
+    
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document"""
+        return len(self.doc)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """PDF metadata dictionary (may be empty)"""
+        return self.doc.metadata or {}
+    
+    @property
+    def plumber(self):
+        """Lazily opened pdfplumber document"""
+        if self._plumber is None:
+            self._plumber = pdfplumber.open(self.input_file)
+        return self._plumber
+    
+    def page(self, page_num: int):
+        """Get PyMuPDF page (0-based index)"""
+        return self.doc[page_num]
+    
+    def plumber_page(self, page_num: int):
+        """Get pdfplumber page (0-based index)"""
+        return self.plumber.pages[page_num]
+    
+    def may_contain_tables(self, page_num: int) -> bool:
+        """
+        Cheap check whether the table finder can find anything on a page
+        
+        pdfplumber's default ('lines') strategy builds cells only from line,
+        rectangle and curve edges, so a page needs at least two horizontal and
+        two vertical ruling segments for a table. Counting them in PyMuPDF's
+        vector drawings is far cheaper than running the finder, and pages
+        without them (prose) are skipped.
+        
+        Segments are classified as loosely as pdfplumber does (any line that
+        is not exactly horizontal counts as vertical), so no table is lost.
+        
+        Args:
+            page_num: 0-based page index
+        
+        Returns:
+            False if the page certainly has no table
+        """
+        horizontal = vertical = 0
+        for drawing in self.page(page_num).get_cdrawings():
+            for item in drawing.get('items', ()):
+                if item[0] == 're':
+                    x0, y0, x1, y1 = item[1]
+                    points = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+                elif item[0] == 'qu':
+                    ul, ur, ll, lr = item[1]
+                    points = [ul, ur, lr, ll, ul]
+                else:
+                    # 'l' and the control polygon of 'c'
+                    points = item[1:]
+                
+                for (x0, y0), (x1, y1) in zip(points, points[1:]):
+                    dx, dy = abs(x1 - x0), abs(y1 - y0)
+                    if dy <= self.MIN_RULING_LENGTH and dx >= self.MIN_RULING_LENGTH:
+                        horizontal += 1
+                    if dy >= self.MIN_RULING_LENGTH:
+                        vertical += 1
+                
+                if horizontal >= 2 and vertical >= 2:
+                    return True
+        return False
+    
+    def get_tables(self, page_num: int) -> List[Dict[str, Any]]:
+        """
+        Get tables found on a page
+        
+        The table finder runs at most once per page; repeated calls return
+        the cached result.
+        
+        Args:
+            page_num: 0-based page index
+        
+        Returns:
+            List of dicts with 'bbox' (x0, top, x1, bottom) and 'rows'
+            (list of rows, each a list of cell strings or None)
+        """
+        if page_num not in self._tables:
+            tables = []
+            plumber_page = self.plumber_page(page_num)
+            try:
+                for table in plumber_page.find_tables():
+                    tables.append({
+                        'bbox': tuple(table.bbox),
+                        'rows': table.extract()
+                    })
+            finally:
+                # Parsed layout objects are only needed for table finding
+                plumber_page.flush_cache()
+            self._tables[page_num] = tables
+        
+        return self._tables[page_num]
+    
+    def image_bytes(self, xref: int) -> bytes:
+        """
+        Get the stored bytes of an image
+        
+        Args:
+            xref: Image xref (see ImageBlock)
+        
+        Returns:
+            Image file bytes (PNG, JPEG, ...) as stored in the PDF
+        """
+        if xref not in self._images:
+            self._images[xref] = self.doc.extract_image(xref)["image"]
+        return self._images[xref]
+    
+    def close(self):
+        """Close all open handles"""
+        if self._plumber is not None:
+            try:
+                self._plumber.close()
+            except Exception as e:
+                logger.debug(f"Could not close pdfplumber handle: {e}")
+            self._plumber = None
+        if self.doc is not None:
+            self.doc.close()
+            self.doc = None
+        self._tables.clear()
+        self._images.clear()
@@ -2,7 +2,7 @@
 Universal converter - routes to specific converters
 """
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict
 from converters.base import BaseConverter, ConversionResult
 from converters.pdf_converter import PDFConverter
 from converters.docx_converter import DOCXConverter
@@ -146,6 +146,60 @@ class UniversalConverter(BaseConverter):
                 output_format
             )
     
+    def convert_many(
+        self,
+        input_file: str,
+        output_formats: List[str],
+        output_dir: Optional[str] = None,
+        quality_check: bool = False,
+        **options
+    ) -> Dict[str, ConversionResult]:
+        """
+        Convert one file to several formats
+        
+        For PDF input the document is extracted once into the document IR and
+        every output format is rendered from it.
+        
+        Args:
+            input_file: Path to input file
+            output_formats: Target formats (e.g. ['markdown', 'html', 'docx'])
+            output_dir: Output directory (optional, default: next to the input)
+            quality_check: Whether to perform quality checks
+            **options: Additional conversion options
+            
+        Returns:
+            Dictionary of output format to ConversionResult
+        """
+        input_format = self.validator.get_file_format(input_file)
+        
+        if input_format == 'pdf' and not options.get('use_ocr') and 'document_ir' not in options:
+            try:
+                options['document_ir'] = self.pdf_converter.extract_document(
+                    input_file, options.get('workers'), options.get('extraction', 'text'), options.get('pages')
+                )
+            except Exception as e:
+                # Each conversion extracts on its own (and reports the error)
+                logger.warning(f"Shared PDF extraction failed, converting formats separately: {e}")
+        
+        results = {}
+        for output_format in output_formats:
+            if output_dir:
+                ext = self._get_extension_for_format(output_format.lower().lstrip('.'))
+                output_file = str(Path(output_dir) / Path(input_file).with_suffix(ext).name)
+            else:
+                output_file = None
+            
+            results[output_format] = self.convert(
+                input_file,
+                input_format,
+                output_format,
+                output_file,
+                quality_check,
+                **options
+            )
+        
+        return results
+    
     def batch_convert(
         self,
         input_files: List[str],
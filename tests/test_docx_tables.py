@@ -0,0 +1,91 @@
+"""
+Tests for the bulk DOCX table builder
+"""
+import pytest
+from docx import Document
+from docx.shared import RGBColor
+
+from converters.html_converter import HTMLConverter
+from utils.docx_tables import add_table
+
+
+def legacy_add_table(doc, rows, header_rows=0, header_color=None, header_cells=()):
+    """Reference: the cell-by-cell filling the converters used before"""
+    num_cols = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=num_cols)
+    table.style = 'Table Grid'
+    for i, row in enumerate(rows):
+        for j, cell in enumerate(row):
+            if cell:
+                table_cell = table.rows[i].cells[j]
+                table_cell.text = str(cell).strip()
+                if i < header_rows or (i, j) in header_cells:
+                    for run in table_cell.paragraphs[0].runs:
+                        run.font.bold = True
+                        if header_color is not None:
+                            run.font.color.rgb = header_color
+    return table
+
+
+def _cells(table):
+    """Text, bold and color of every cell"""
+    result = []
+    for row in table.rows:
+        for cell in row.cells:
+            runs = cell.paragraphs[0].runs
+            result.append((
+                cell.text,
+                bool(runs) and bool(runs[0].bold),
+                runs[0].font.color.rgb if runs and runs[0].font.color.type else None
+            ))
+    return result
+
+
+class TestAddTable:
+    """Test add_table against cell-by-cell filling"""
+    
+    ROWS = [
+        ['Name', 'Value', 'Note'],
+        ['a & b', '<1>', None],
+        ['multi\nline', '\ttab', '  padded  '],
+        ['short'],
+    ]
+    
+    def test_same_content_as_cell_text(self):
+        """Test text, padding and header styling match python-docx's own API"""
+        color = RGBColor(0, 102, 204)
+        new = add_table(Document(), self.ROWS, header_rows=1, header_color=color, header_cells={(2, 0)})
+        old = legacy_add_table(Document(), self.ROWS, header_rows=1, header_color=color, header_cells={(2, 0)})
+        
+        assert len(new.rows) == 4 and len(new.columns) == 3
+        assert _cells(new) == _cells(old)
+        assert new.style.name == 'Table Grid'
+        assert new.rows[0].cells[0]._tc.xml.count('w:w="2880"') == 1
+    
+    def test_invalid_xml_characters_are_dropped(self):
+        """Test control characters from PDF text do not break the table"""
+        table = add_table(Document(), [['bad\x00\x0bchar', 'ok']])
+        assert table.rows[0].cells[0].text == 'badchar'
+    
+    def test_html_table_headers(self, tmp_path):
+        """Test HTML tables keep the header row and <th> styling"""
+        html_file = tmp_path / "table.html"
+        html_file.write_text(
+            '<html><body><table>'
+            '<tr><td>H1</td><td>H2</td></tr>'
+            '<tr><th>Row</th><td>1</td></tr>'
+            '<tr><td>x</td></tr>'
+            '</table></body></html>',
+            encoding='utf-8'
+        )
+        HTMLConverter().convert(str(html_file), str(tmp_path / "table.docx"))
+        table = Document(str(tmp_path / "table.docx")).tables[0]
+        
+        assert [(text, bold) for text, bold, _ in _cells(table)] == [
+            ('H1', True), ('H2', True), ('Row', True), ('1', False), ('x', False), ('', False)
+        ]
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
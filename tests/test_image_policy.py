@@ -0,0 +1,133 @@
+"""
+Tests for the output image policy
+"""
+import base64
+import io
+
+import pytest
+import fitz  # PyMuPDF
+from docx import Document
+from PIL import Image
+
+from converters.html_converter import HTMLConverter
+from converters.markdown_converter import MarkdownConverter
+from converters.pdf_converter import PDFConverter
+from utils.image_policy import ImagePolicy, read_image_source, display_width_inches
+
+
+def _photo_png(width=1200, height=800):
+    """Noisy color image saved as PNG (a photo by color count)"""
+    image = Image.merge('RGB', [Image.effect_noise((width, height), sigma) for sigma in (20, 40, 60)])
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _chart_png(width=400, height=300):
+    """Flat-color image saved as PNG (a chart or diagram)"""
+    image = Image.new('RGB', (width, height), 'white')
+    image.paste((30, 90, 200), (50, 50, 150, 250))
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class TestImagePolicy:
+    """Test downsampling and recompression decisions"""
+    
+    def test_large_photo_is_downsampled_to_jpeg(self):
+        """Test a 1200 px photo shown 5 inches wide becomes a 5 * max_dpi JPEG"""
+        policy = ImagePolicy(max_dpi=100, jpeg_quality=80)
+        data = _photo_png()
+        result = policy.apply(data, 5.0)
+        
+        image = Image.open(io.BytesIO(result))
+        assert image.format == 'JPEG'
+        assert image.size == (500, 333)
+        assert policy.bytes_saved == len(data) - len(result) > 0
+    
+    def test_small_images_keep_their_format(self):
+        """Test charts stay lossless and untouched JPEGs are not re-encoded"""
+        policy = ImagePolicy(max_dpi=150)
+        chart = _chart_png()
+        assert Image.open(io.BytesIO(policy.apply(chart, 5.0))).format == 'PNG'
+        
+        buffer = io.BytesIO()
+        Image.new('RGB', (300, 200), 'gray').save(buffer, 'JPEG')
+        assert policy.apply(buffer.getvalue(), 5.0) == buffer.getvalue()
+        assert policy.bytes_saved >= 0
+    
+    def test_repeated_image_is_processed_once(self):
+        """Test byte counters count each distinct image once"""
+        policy = ImagePolicy(max_dpi=150)
+        data = _photo_png(800, 500)
+        first = policy.apply(data, 5.0)
+        
+        assert policy.apply(data, 5.0) is first
+        assert policy.bytes_in == len(data)
+    
+    def test_options(self):
+        """Test per-request settings and switching the policy off"""
+        policy = ImagePolicy.from_options({'image_max_dpi': 96, 'image_quality': 60})
+        assert (policy.max_dpi, policy.jpeg_quality) == (96, 60)
+        
+        data = _photo_png(800, 500)
+        disabled = ImagePolicy.from_options({'optimize_images': False})
+        assert disabled.apply(data, 5.0) == data
+        assert disabled.bytes_saved == 0
+    
+    def test_read_image_source(self, tmp_path):
+        """Test data URIs and relative paths are read, remote URLs are not"""
+        data = _chart_png(20, 10)
+        (tmp_path / "chart.png").write_bytes(data)
+        uri = 'data:image/png;base64,' + base64.b64encode(data).decode()
+        
+        assert read_image_source(uri, tmp_path) == data
+        assert read_image_source('chart.png', tmp_path) == data
+        assert read_image_source('https://example.com/a.png', tmp_path) is None
+        assert read_image_source('missing.png', tmp_path) is None
+        assert display_width_inches(data) == pytest.approx(20 / 96)
+
+
+class TestDocxImages:
+    """Test the policy in the DOCX outputs"""
+    
+    def test_pdf_to_docx(self, tmp_path):
+        """Test PDF images are shrunk and the savings reported"""
+        pdf = str(tmp_path / "photo.pdf")
+        doc = fitz.open()
+        doc.new_page().insert_image(fitz.Rect(72, 72, 432, 312), stream=_photo_png())
+        doc.save(pdf)
+        doc.close()
+        
+        converter = PDFConverter()
+        optimized = converter.convert(pdf, str(tmp_path / "optimized.docx"), workers=1)
+        original = converter.convert(pdf, str(tmp_path / "original.docx"), workers=1, optimize_images=False)
+        
+        assert optimized.metadata['image_bytes_saved'] > 0
+        assert original.metadata['image_bytes_saved'] == 0
+        assert (tmp_path / "optimized.docx").stat().st_size < (tmp_path / "original.docx").stat().st_size
+    
+    def test_markdown_and_html_to_docx(self, tmp_path):
+        """Test local and inline images are embedded"""
+        (tmp_path / "photo.png").write_bytes(_photo_png(800, 500))
+        uri = 'data:image/png;base64,' + base64.b64encode(_chart_png()).decode()
+        
+        md_file = tmp_path / "doc.md"
+        md_file.write_text("# Title\n\n![A photo](photo.png)\n\nText.\n", encoding='utf-8')
+        html_file = tmp_path / "doc.html"
+        html_file.write_text(f'<html><body><p>Text <img src="{uri}"></p><img src="photo.png"></body></html>',
+                             encoding='utf-8')
+        
+        md_result = MarkdownConverter().convert(str(md_file), str(tmp_path / "md.docx"))
+        html_result = HTMLConverter().convert(str(html_file), str(tmp_path / "html.docx"))
+        
+        assert len(Document(str(tmp_path / "md.docx")).inline_shapes) == 1
+        assert len(Document(str(tmp_path / "html.docx")).inline_shapes) == 2
+        assert md_result.metadata['image_bytes_saved'] > 0
+        assert html_result.metadata['image_bytes_saved'] > 0
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
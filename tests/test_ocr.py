@@ -0,0 +1,492 @@
+"""
+Tests for OCR helpers
+"""
+import os
+
+import pytest
+import fitz  # PyMuPDF
+import pytesseract
+from docx import Document
+from PIL import Image
+
+from ai.ocr_pool import OCRPool
+from ai.ocr_result import OCRResult, run_ocr
+from ai.ocr_backends import TesserocrBackend, get_ocr_backend, parse_tesseract_config
+from ai.ocr_engine import OCREngine
+from ai.page_raster import iter_page_images, render_page
+from ai.raster_cache import RasterCache
+from utils.disk_cache import DiskLRUCache
+from converters.pdf_converter import PDFConverter
+
+
+@pytest.fixture
+def scanned_pdf(tmp_path):
+    """PDF with one line of text per page"""
+    path = tmp_path / "scanned.pdf"
+    doc = fitz.open()
+    for page_num in range(5):
+        page = doc.new_page(width=200, height=100)
+        page.insert_text((20, 50), f"Page {page_num + 1}", fontsize=14)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+SAMPLE_TSV = "\n".join([
+    TSV_HEADER,
+    "1\t1\t0\t0\t0\t0\t0\t0\t800\t600\t-1\t",
+    "2\t1\t1\t0\t0\t0\t10\t10\t300\t60\t-1\t",
+    "5\t1\t1\t1\t1\t1\t10\t10\t50\t20\t96.5\tHello",
+    "5\t1\t1\t1\t1\t2\t70\t10\t50\t20\t91.5\tworld",
+    "5\t1\t1\t1\t2\t1\t10\t40\t40\t20\t90\tnext",
+    "5\t1\t1\t1\t2\t2\t60\t40\t10\t20\t-1\t ",
+    "5\t1\t1\t2\t1\t1\t10\t80\t40\t20\t80\tSecond",
+    "5\t1\t1\t2\t1\t2\t250\t80\t60\t20\t70\tcolumn",
+])
+
+
+@pytest.fixture(autouse=True)
+def isolated_ocr_cache(tmp_path, monkeypatch):
+    """Keep OCR and raster cache entries of each test in its own directory"""
+    monkeypatch.setattr('ai.ocr_cache.OCR_CACHE_DIR', tmp_path / "ocr_cache")
+    monkeypatch.setattr('ai.ocr_cache._cache', None)
+    monkeypatch.setattr('ai.raster_cache.RASTER_CACHE_DIR', tmp_path / "raster_cache")
+    monkeypatch.setattr('ai.raster_cache._cache', None)
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Record the pages actually rasterized (not served by the raster cache)"""
+    import ai.page_raster as page_raster
+    rendered = []
+    original = page_raster.render_page
+    
+    def counting_render(page, **kwargs):
+        rendered.append(page.number)
+        return original(page, **kwargs)
+    
+    monkeypatch.setattr(page_raster, 'render_page', counting_render)
+    return rendered
+
+
+@pytest.fixture
+def raster_cache(tmp_path, monkeypatch):
+    """Raster cache that stores every page, however fast it rendered"""
+    cache = RasterCache(tmp_path / "raster", min_render_ms=0)
+    monkeypatch.setattr('ai.raster_cache._cache', cache)
+    monkeypatch.setattr('ai.raster_cache._cache_pid', os.getpid())
+    return cache
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """Replace Tesseract with a stub that reports the rendered image size"""
+    def image_to_data(img, lang='eng', config=''):
+        return "\n".join([
+            TSV_HEADER,
+            f"5\t1\t1\t1\t1\t1\t0\t0\t10\t10\t90\t{img.width}x{img.height}",
+            f"5\t1\t1\t1\t1\t2\t20\t0\t10\t10\t80\t{lang}",
+        ])
+    
+    monkeypatch.setattr(pytesseract, 'image_to_data', image_to_data)
+    monkeypatch.setattr('ai.ocr_backends.OCR_BACKEND', 'pytesseract')
+
+
+class TestOCRResult:
+    """Test OCRResult class"""
+    
+    def test_text_is_rebuilt_from_layout(self):
+        """Test lines and paragraphs are rebuilt from TSV rows"""
+        result = OCRResult.from_tsv(SAMPLE_TSV)
+        
+        assert result.text == "Hello world\nnext\n\nSecond column\n"
+        assert result.word_count == 5
+    
+    def test_confidence_and_boxes(self):
+        """Test per-word confidence and bounding boxes"""
+        result = OCRResult.from_tsv(SAMPLE_TSV)
+        
+        assert result.words[0].bbox == (10, 10, 50, 20)
+        assert result.words[1].confidence == 91.5
+        assert result.confidence == pytest.approx((96.5 + 91.5 + 90 + 80 + 70) / 5)
+    
+    def test_preserve_spaces(self):
+        """Test wide gaps become space runs when preserving layout"""
+        result = OCRResult.from_tsv(SAMPLE_TSV, preserve_spaces=True)
+        
+        assert "Hello world" in result.text
+        assert "Second" + " " * 5 in result.text
+    
+    def test_empty_output(self):
+        """Test an image without text"""
+        result = OCRResult.from_tsv(TSV_HEADER)
+        
+        assert result.text == ''
+        assert result.confidence == 0
+    
+    def test_run_ocr_single_pass(self, monkeypatch):
+        """Test run_ocr calls Tesseract once"""
+        calls = []
+        
+        def image_to_data(img, lang='eng', config=''):
+            calls.append(config)
+            return SAMPLE_TSV
+        
+        monkeypatch.setattr(pytesseract, 'image_to_data', image_to_data)
+        result = run_ocr(Image.new('L', (10, 10)), lang='eng', config='--psm 6 -c preserve_interword_spaces=1',
+                         backend='pytesseract')
+        
+        assert len(calls) == 1
+        assert result.preserve_spaces
+
+
+class TestOCRCache:
+    """Test OCR result caching"""
+    
+    def test_second_run_skips_tesseract(self, monkeypatch):
+        """Test the same image is only recognized once"""
+        calls = []
+        
+        def image_to_data(img, lang='eng', config=''):
+            calls.append(config)
+            return SAMPLE_TSV
+        
+        monkeypatch.setattr(pytesseract, 'image_to_data', image_to_data)
+        image = Image.new('L', (40, 20), 255)
+        
+        first = run_ocr(image, lang='eng', config='--psm 6', backend='pytesseract', dpi=144)
+        second = run_ocr(image, lang='eng', config='--psm 6', backend='pytesseract', dpi=144)
+        
+        assert len(calls) == 1
+        assert not first.cached and second.cached
+        assert second.text == first.text
+        
+        # Anything that changes the OCR output is part of the key
+        run_ocr(image, lang='tur', config='--psm 6', backend='pytesseract', dpi=144)
+        run_ocr(image, lang='eng', config='--psm 4', backend='pytesseract', dpi=144)
+        run_ocr(image, lang='eng', config='--psm 6', backend='pytesseract', dpi=216)
+        run_ocr(Image.new('L', (40, 20), 0), lang='eng', config='--psm 6', backend='pytesseract', dpi=144)
+        assert len(calls) == 5
+    
+    def test_cache_can_be_bypassed(self, monkeypatch):
+        """Test use_cache=False always runs Tesseract"""
+        calls = []
+        
+        def image_to_data(img, lang='eng', config=''):
+            calls.append(config)
+            return SAMPLE_TSV
+        
+        monkeypatch.setattr(pytesseract, 'image_to_data', image_to_data)
+        image = Image.new('L', (40, 20), 255)
+        
+        run_ocr(image, backend='pytesseract', use_cache=False)
+        run_ocr(image, backend='pytesseract', use_cache=False)
+        assert len(calls) == 2
+    
+    def test_disk_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted first"""
+        import os
+        cache = DiskLRUCache(tmp_path / "lru", max_bytes=250)
+        
+        for i, key in enumerate(['aa1', 'bb2', 'cc3']):
+            cache.set(key, b'x' * 100 if key != 'cc3' else b'y' * 10)
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        
+        # Reading 'aa1' makes it the most recently used entry
+        assert cache.get('aa1') == b'x' * 100
+        cache.set('dd4', b'z' * 100)
+        
+        assert 'aa1' in cache
+        assert 'bb2' not in cache
+        assert cache.get('bb2') is None
+        
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['evictions'] >= 1
+        assert stats['size_bytes'] <= 250
+
+
+class TestOCRBackends:
+    """Test OCR backend selection"""
+    
+    def test_parse_config(self):
+        """Test pytesseract style config parsing"""
+        psm, oem, variables = parse_tesseract_config('--oem 1 --psm 6 -c preserve_interword_spaces=1')
+        
+        assert psm == 6
+        assert oem == 1
+        assert variables == (('preserve_interword_spaces', '1'),)
+        assert parse_tesseract_config('') == (None, None, ())
+    
+    def test_backends_are_cached(self):
+        """Test the same backend instance is reused (engines stay warm)"""
+        assert get_ocr_backend('pytesseract') is get_ocr_backend('pytesseract')
+        assert get_ocr_backend('unknown').name == 'pytesseract'
+    
+    def test_auto_prefers_tesserocr(self):
+        """Test auto selection"""
+        backend = get_ocr_backend('auto')
+        
+        if TesserocrBackend().is_available():
+            assert backend.name == 'tesserocr'
+        else:
+            assert backend.name == 'pytesseract'
+    
+    def test_tesserocr_matches_layout(self, scanned_pdf):
+        """Test tesserocr output goes through the same TSV parser"""
+        backend = get_ocr_backend('tesserocr')
+        if not backend.is_available() or not backend.supports_language('eng'):
+            pytest.skip("tesserocr or English language data not installed")
+        
+        doc = fitz.open(scanned_pdf)
+        pix = doc[2].get_pixmap(matrix=fitz.Matrix(3, 3))
+        doc.close()
+        image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        
+        result = backend.ocr(image, lang='eng', config='--psm 6')
+        
+        assert result.text.strip() == "Page 3"
+        assert result.confidence > 50
+        assert len(backend._engines) == 1
+
+
+class TestPageRaster:
+    """Test page raster service"""
+    
+    def test_pages_are_rendered_lazily(self, scanned_pdf, render_calls):
+        """Test pages are rendered only when consumed"""
+        rendered = render_calls
+        pages = iter_page_images(scanned_pdf, dpi=144)
+        
+        first = next(pages)
+        assert rendered == [0]
+        assert first.image.mode == 'L'
+        assert first.image.size == (400, 200)
+        
+        assert [raster.page_num for raster in pages] == [1, 2, 3, 4]
+        assert rendered == [0, 1, 2, 3, 4]
+    
+    def test_zero_copy_image_matches_pixmap(self, scanned_pdf):
+        """Test the buffer-backed image has the pixmap's pixels"""
+        doc = fitz.open(scanned_pdf)
+        page = doc[0]
+        
+        image = render_page(page, zoom=1.37)
+        pix = page.get_pixmap(matrix=fitz.Matrix(1.37, 1.37))
+        expected = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        doc.close()
+        
+        assert image.mode == 'RGB'
+        assert image.tobytes() == expected.tobytes()
+    
+    def test_raster_cache_skips_rendering(self, scanned_pdf, render_calls, raster_cache):
+        """Test pages rendered once are loaded from the cache with the same pixels"""
+        first = [raster.image.tobytes() for raster in iter_page_images(scanned_pdf, dpi=144)]
+        second = [raster.image.tobytes() for raster in iter_page_images(scanned_pdf, dpi=144)]
+        
+        assert render_calls == [0, 1, 2, 3, 4]
+        assert second == first
+        assert raster_cache.hits == 5
+        
+        # Another resolution or color mode is a different entry
+        next(iter_page_images(scanned_pdf, dpi=72))
+        next(iter_page_images(scanned_pdf, dpi=144, grayscale=False))
+        assert render_calls == [0, 1, 2, 3, 4, 0, 0]
+    
+    def test_raster_cache_is_keyed_by_content(self, scanned_pdf, render_calls, raster_cache):
+        """Test a changed file at the same path is rendered again"""
+        next(iter_page_images(scanned_pdf))
+        
+        doc = fitz.open(scanned_pdf)
+        doc[0].insert_text((20, 80), "Edited", fontsize=14)
+        doc.saveIncr()
+        doc.close()
+        
+        next(iter_page_images(scanned_pdf))
+        assert render_calls == [0, 0]
+    
+    def test_cheap_pages_are_not_stored(self, scanned_pdf, render_calls, tmp_path, monkeypatch):
+        """Test pages faster to render than min_render_ms stay out of the cache"""
+        cache = RasterCache(tmp_path / "raster", min_render_ms=10 ** 6)
+        monkeypatch.setattr('ai.raster_cache._cache', cache)
+        monkeypatch.setattr('ai.raster_cache._cache_pid', os.getpid())
+        
+        list(iter_page_images(scanned_pdf))
+        list(iter_page_images(scanned_pdf))
+        
+        assert len(render_calls) == 10
+        assert cache.stats()['entries'] == 0
+    
+    def test_ocr_engine_uses_raster_service(self, scanned_pdf, fake_tesseract):
+        """Test OCREngine renders pages at the requested DPI"""
+        result = OCREngine(language='eng').extract_text_from_pdf(scanned_pdf, dpi=72)
+        
+        assert result['success']
+        assert result['page_count'] == 5
+        assert result['pages'][0]['text'] == "200x100 eng\n"
+        assert result['confidence'] == 85
+    
+    def test_ocr_engine_page_selection(self, scanned_pdf, fake_tesseract):
+        """Test OCREngine only renders the selected pages"""
+        result = OCREngine(language='eng').extract_text_from_pdf(scanned_pdf, dpi=72, pages='2-3')
+        
+        assert result['success']
+        assert [page['page'] for page in result['pages']] == [2, 3]
+        assert result['page_count'] == 5
+        assert result['pages_processed'] == 2
+        assert result['confidence'] == 85
+
+
+class TestOCRPool:
+    """Test OCRPool class"""
+    
+    def test_serial_pool_yields_pages_in_order(self, scanned_pdf, fake_tesseract):
+        """Test in-process OCR of selected pages"""
+        with OCRPool(workers=1) as pool:
+            results = list(pool.ocr_pages(scanned_pdf, [3, 0, 1], zoom=2, lang='tur'))
+        
+        assert [r['page'] for r in results] == [3, 0, 1]
+        assert all(r['error'] is None for r in results)
+        assert results[0]['text'] == "400x200 tur\n"
+        assert results[0]['confidence'] == 85
+    
+    def test_pool_reads_through_raster_cache(self, scanned_pdf, fake_tesseract, render_calls, raster_cache):
+        """Test OCR of the same pages at the same zoom renders them once"""
+        for _ in range(2):
+            with OCRPool(workers=1) as pool:
+                results = list(pool.ocr_pages(scanned_pdf, [0, 1], zoom=3))
+            assert [r['text'] for r in results] == ["600x300 eng\n"] * 2
+        
+        assert render_calls == [0, 1]
+    
+    def test_parallel_pool_keeps_page_order(self, scanned_pdf):
+        """Test results are reassembled in page order with a small in-flight window"""
+        with OCRPool(workers=2, max_in_flight=2) as pool:
+            results = list(pool.ocr_pages(scanned_pdf, range(5)))
+        
+        assert [r['page'] for r in results] == list(range(5))
+    
+    def test_page_errors_are_reported(self, scanned_pdf):
+        """Test a failing page does not abort the whole run"""
+        with OCRPool(workers=1) as pool:
+            results = list(pool.ocr_pages(scanned_pdf, [0, 99]))
+        
+        assert results[1]['page'] == 99
+        assert results[1]['error']
+        assert results[1]['text'] == ''
+    
+    def test_worker_count(self):
+        """Test worker resolution"""
+        assert OCRPool(workers=3).workers == 3
+        assert OCRPool(workers=3).max_in_flight == 6
+        assert OCRPool(workers=0).workers >= 1
+
+
+class TestPDFOCRConversion:
+    """Test OCR-based PDF conversions"""
+    
+    def test_html_ocr_uses_pool(self, scanned_pdf, tmp_path, fake_tesseract):
+        """Test every page ends up in the output in order"""
+        converter = PDFConverter()
+        result = converter.convert(scanned_pdf, str(tmp_path / "out.html"), use_ocr=True, ocr_workers=1)
+        
+        assert result.success
+        assert result.metadata['pages'] == 5
+        
+        content = (tmp_path / "out.html").read_text(encoding='utf-8')
+        assert content.count('<p>400x200 eng</p>') == 5
+        positions = [content.index(f'<div class="page-header">Page {n}</div>') for n in range(1, 6)]
+        assert positions == sorted(positions)
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path):
+    """PDF with two text pages around an image-only (scanned) page"""
+    source = fitz.open()
+    scan = source.new_page(width=200, height=100)
+    scan.insert_text((20, 50), "Scanned", fontsize=14)
+    pix = scan.get_pixmap(matrix=fitz.Matrix(2, 2))
+    
+    path = tmp_path / "mixed.pdf"
+    doc = fitz.open()
+    for page_num in range(3):
+        page = doc.new_page(width=200, height=100)
+        if page_num == 1:
+            page.insert_image(page.rect, pixmap=pix)
+        else:
+            page.insert_text((20, 50), f"Text page {page_num + 1}", fontsize=14)
+    doc.save(str(path))
+    doc.close()
+    source.close()
+    return str(path)
+
+
+class TestHybridOCRRouting:
+    """Test per-page routing between the text layer and OCR"""
+    
+    def test_image_page_is_routed_to_ocr(self, mixed_pdf):
+        """Test only the page without a text layer is OCR'd"""
+        routes = PDFConverter().route_pages(mixed_pdf)
+        
+        assert [r['route'] for r in routes] == ['text', 'ocr', 'text']
+        assert routes[1]['image_coverage'] == 1.0
+        assert routes[0]['image_coverage'] == 0.0
+    
+    def test_auto_merges_pages_in_order(self, mixed_pdf, tmp_path, fake_tesseract):
+        """Test OCR and text-layer pages are merged in page order"""
+        converter = PDFConverter()
+        result = converter.convert(mixed_pdf, str(tmp_path / "out.md"), use_ocr='auto')
+        
+        assert result.success
+        assert result.metadata['ocr_pages'] == 1
+        assert [r['page'] for r in result.metadata['page_routes']] == [0, 1, 2]
+        
+        content = (tmp_path / "out.md").read_text(encoding='utf-8')
+        positions = [content.index("Text page 1"), content.index("400x200 eng"), content.index("Text page 3")]
+        assert positions == sorted(positions)
+    
+    def test_auto_uses_full_ocr_for_scans(self, scanned_pdf, tmp_path, fake_tesseract, monkeypatch):
+        """Test a document where every page needs OCR takes the OCR path"""
+        converter = PDFConverter()
+        monkeypatch.setattr(converter, '_score_page', lambda page: {'page': page.number, 'route': 'ocr'})
+        
+        result = converter.convert(scanned_pdf, str(tmp_path / "out.html"), use_ocr='auto', ocr_workers=1)
+        
+        assert result.success
+        assert result.metadata['ocr_pages'] == 5
+        content = (tmp_path / "out.html").read_text(encoding='utf-8')
+        assert content.count('<p>400x200 eng</p>') == 5
+    
+    def test_auto_routes_selected_pages_only(self, mixed_pdf, tmp_path, fake_tesseract):
+        """Test only the selected pages are scored and converted"""
+        result = PDFConverter().convert(mixed_pdf, str(tmp_path / "out.md"), use_ocr='auto', pages='2-3')
+        
+        assert result.success
+        assert [r['page'] for r in result.metadata['page_routes']] == [1, 2]
+        content = (tmp_path / "out.md").read_text(encoding='utf-8')
+        assert "Text page 1" not in content
+        assert "400x200 eng" in content and "Text page 3" in content
+    
+    @pytest.mark.parametrize('ext', ['md', 'html', 'docx'])
+    def test_ocr_page_selection(self, scanned_pdf, tmp_path, fake_tesseract, ext):
+        """Test the OCR conversion paths honor the pages option"""
+        output = tmp_path / f"out.{ext}"
+        result = PDFConverter().convert(scanned_pdf, str(output), use_ocr=True, enhance_math=False,
+                                        pages='4-5', ocr_workers=1)
+        
+        assert result.success
+        assert result.metadata['pages_converted'] == 2
+        if ext == 'docx':
+            content = '\n'.join(p.text for p in Document(str(output)).paragraphs)
+        else:
+            content = output.read_text(encoding='utf-8')
+        assert content.count('400x200 eng') == 2
+        assert 'Page 4' in content and 'Page 3' not in content
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
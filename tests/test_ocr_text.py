@@ -0,0 +1,116 @@
+"""
+Tests for the shared OCR text normalization
+"""
+import random
+import re
+
+import pytest
+
+from utils.ocr_text import join_ocr_paragraphs, strip_ocr_noise, normalize_whitespace
+
+
+def legacy_join_ocr_paragraphs(text):
+    """Reference: PDFConverter._clean_ocr_text before the shared module"""
+    if not text:
+        return ''
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = text.replace('|', 'I')
+    lines = text.split('\n')
+    cleaned_lines = []
+    current_paragraph = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            if current_paragraph:
+                cleaned_lines.append(' '.join(current_paragraph))
+                current_paragraph = []
+            cleaned_lines.append('')
+        else:
+            current_paragraph.append(stripped)
+    if current_paragraph:
+        cleaned_lines.append(' '.join(current_paragraph))
+    return '\n\n'.join([l for l in cleaned_lines if l or (cleaned_lines.index(l) > 0 and cleaned_lines[cleaned_lines.index(l)-1])])
+
+
+def legacy_strip_ocr_noise(text):
+    """Reference: LLMPostProcessor._pre_clean_ocr_text before the shared module"""
+    text = re.sub(r'===\s*Page\s*\d+\s*===', '', text)
+    noise_patterns = [
+        r'November\s+\d+,\s+\d+.*?(?=\n|$)',
+        r'Seite\s+\d+',
+        r'H\s*L\s*R\s*\|?\s*[sS]',
+        r'SSS+',
+        r'^\s*24\s*$',
+        r'\d{1,2}/\d{1,2}/\d{4}',
+        r'Solving the 2d Poisson Equation using the FEM and a CG Method',
+    ]
+    for pattern in noise_patterns:
+        text = re.sub(pattern, '', text, flags=re.MULTILINE | re.IGNORECASE)
+    text = re.sub(r'\n{4,}', '\n\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    lines = text.split('\n')
+    cleaned_lines = []
+    for line in lines:
+        stripped = line.strip()
+        if len(stripped) > 3 or stripped == '':
+            if not re.match(r'^[\|\-=~\s]+$', stripped):
+                cleaned_lines.append(line)
+    return '\n'.join(cleaned_lines)
+
+
+def legacy_normalize_whitespace(text):
+    """Reference: MathOCRProcessor._clean_whitespace before the shared module"""
+    text = re.sub(r' {2,}', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    lines = [line.strip() for line in text.split('\n')]
+    return '\n'.join(lines)
+
+
+# Pieces OCR output is made of, including every noise pattern and the
+# characters IGNORECASE folds onto ASCII letters
+PIECES = [
+    'word', 'longer words here', ' ', '  ', '\t', '\n', '\n', '\n\n', '\n\n\n\n', ' \n ', '\x0c',
+    '|', '-', '=', '~', '| -- |', '24', 'SSS', 'sſs', 'Seite 4', 'Seıte 5', 'SEİTE 6',
+    'November 3, 2020 draft', '12/3/2020', '=== Page 3 ===', 'HLR s', 'H L R | S',
+    'Solving the 2d Poisson Equation using the FEM and a CG Method',
+]
+
+
+def random_texts(count, seed=0):
+    """Random OCR-like texts"""
+    rng = random.Random(seed)
+    return [''.join(rng.choice(PIECES) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+PAIRS = [
+    (join_ocr_paragraphs, legacy_join_ocr_paragraphs),
+    (strip_ocr_noise, legacy_strip_ocr_noise),
+    (normalize_whitespace, legacy_normalize_whitespace),
+]
+
+
+class TestOCRTextParity:
+    """Test the shared passes give the output of the code they replace"""
+    
+    @pytest.mark.parametrize('new, old', PAIRS, ids=['paragraphs', 'noise', 'whitespace'])
+    def test_random_texts(self, new, old):
+        """Test parity on random mixes of text, blank lines and noise"""
+        for text in random_texts(3000):
+            assert new(text) == old(text), repr(text)
+    
+    def test_paragraphs(self):
+        """Test paragraph joining, including text that starts with a blank line"""
+        assert join_ocr_paragraphs("a\nb |\n\nc") == "a b I\n\n\n\nc"
+        assert join_ocr_paragraphs("\na\nb\n\nc") == "a b\n\nc"
+        assert join_ocr_paragraphs("") == ""
+    
+    def test_noise(self):
+        """Test headers, footers and rule lines are removed"""
+        text = "=== Page 1 ===\nSeite 3\nReal   content line\n|-|-|\n  24  \nok\nMore text 1/2/2020 here"
+        assert strip_ocr_noise(text) == legacy_strip_ocr_noise(text)
+        assert strip_ocr_noise(text) == "\n\nReal content line\n\nMore text here"
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
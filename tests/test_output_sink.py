@@ -0,0 +1,86 @@
+"""
+Tests for streaming output sinks
+"""
+import pytest
+
+from converters.pdf_converter import PDFConverter
+from utils.output_sink import TextSink
+
+from test_pdf_converter import _make_pdf
+
+
+class TestTextSink:
+    """Test incremental writing and atomic publishing"""
+    
+    def test_commit_replaces_target(self, tmp_path):
+        """Test output appears only on commit and no temporary file is left"""
+        target = tmp_path / "out.md"
+        target.write_text("old", encoding='utf-8')
+        
+        with TextSink(str(target)) as sink:
+            sink.write("new ")
+            sink.flush()
+            assert target.read_text(encoding='utf-8') == "old"
+            sink.write("text")
+        
+        assert target.read_text(encoding='utf-8') == "new text"
+        assert sink.chars_written == 8
+        assert [p.name for p in tmp_path.iterdir()] == ["out.md"]
+    
+    def test_exception_aborts(self, tmp_path):
+        """Test a failed conversion leaves neither output nor temporary file"""
+        with pytest.raises(RuntimeError):
+            with TextSink(str(tmp_path / "out.md")) as sink:
+                sink.write("partial")
+                raise RuntimeError("conversion failed")
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_write_parts_separator(self, tmp_path):
+        """Test parts written in several calls are joined like one separator.join()"""
+        target = tmp_path / "out.html"
+        parts = ['<html>', '<body>', '', '</body>', '</html>']
+        with TextSink(str(target), encoding='utf-8-sig', separator='\n') as sink:
+            sink.write_parts(parts[:2])
+            sink.write_parts([])
+            sink.write_parts(parts[2:])
+        
+        assert target.read_bytes() == b'\xef\xbb\xbf' + '\n'.join(parts).encode('utf-8')
+
+
+class TestStreamingConversion:
+    """Test page-by-page PDF output matches whole-document processing"""
+    
+    def test_markdown_matches_whole_document_cleanup(self, tmp_path):
+        """Test per-page cleaning gives the same Markdown as cleaning the joined pages"""
+        pdf = _make_pdf(tmp_path / "sample.pdf", num_pages=4)
+        converter = PDFConverter()
+        result = converter.convert(pdf, str(tmp_path / "out.md"), workers=1)
+        assert result.success
+        
+        fragments = converter._document_fragments(pdf, 'markdown', {'workers': 1})
+        expected = converter._clean_markdown(''.join(f['content'] for f in fragments), {})
+        assert (tmp_path / "out.md").read_text(encoding='utf-8-sig') == expected
+    
+    def test_failed_conversion_leaves_no_file(self, tmp_path, monkeypatch):
+        """Test an error on a later page does not leave a truncated output"""
+        pdf = _make_pdf(tmp_path / "sample.pdf", num_pages=3)
+        converter = PDFConverter()
+        original = converter._document_fragments
+        
+        def failing_fragments(*args, **kwargs):
+            for fragment in original(*args, **kwargs):
+                if fragment['page'] == 2:
+                    raise RuntimeError("page failed")
+                yield fragment
+        
+        monkeypatch.setattr(converter, '_document_fragments', failing_fragments)
+        result = converter.convert(pdf, str(tmp_path / "out.html"), workers=1)
+        
+        assert not result.success
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["sample.pdf"]
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
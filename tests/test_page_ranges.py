@@ -0,0 +1,99 @@
+"""
+Tests for page selections and partial PDF conversion
+"""
+import pytest
+from docx import Document
+
+from converters.pdf_converter import PDFConverter
+from converters.universal import UniversalConverter
+from utils.page_ranges import parse_page_ranges, format_page_ranges
+
+from test_pdf_converter import _make_pdf
+
+
+class TestParsePageRanges:
+    """Test parsing and formatting of page selections"""
+    
+    @pytest.mark.parametrize('spec, expected', [
+        (None, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]),
+        ('1-5,10', [0, 1, 2, 3, 4, 9]),
+        (' 10 , 2-3, 3 ', [1, 2, 9]),
+        ('11-', [10, 11]),
+        ('-2', [0, 1]),
+        (4, [3]),
+        ([12, 1], [0, 11]),
+        ('10-40', [9, 10, 11]),
+    ])
+    def test_parse(self, spec, expected):
+        """Test ranges, open ends and clamping to the document"""
+        assert parse_page_ranges(spec, 12) == expected
+    
+    @pytest.mark.parametrize('spec', ['0', '5-3', 'abc', '1-2-3', '1;2', '20-30'])
+    def test_invalid(self, spec):
+        """Test malformed selections and selections outside the document are rejected"""
+        with pytest.raises(ValueError):
+            parse_page_ranges(spec, 12)
+    
+    def test_format_round_trip(self):
+        """Test formatted selections read back to the same pages"""
+        pages = [0, 1, 2, 3, 4, 9, 11]
+        assert format_page_ranges(pages) == '1-5,10,12'
+        assert parse_page_ranges(format_page_ranges(pages), 12) == pages
+
+
+class TestPartialConversion:
+    """Test the pages option in every text-layer output"""
+    
+    @pytest.fixture
+    def long_pdf(self, tmp_path):
+        return _make_pdf(tmp_path / "long.pdf", num_pages=6)
+    
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_markdown_and_html(self, long_pdf, tmp_path, workers):
+        """Test only the selected pages are rendered, in page order"""
+        converter = PDFConverter()
+        md = converter.convert(long_pdf, str(tmp_path / "out.md"), pages='5,2-3', workers=workers)
+        html = converter.convert(long_pdf, str(tmp_path / "out.html"), pages='5,2-3', workers=workers)
+        
+        assert md.success and html.success
+        assert md.metadata['pages_converted'] == 3
+        assert md.metadata['page_ranges'] == '2-3,5'
+        assert md.metadata['tables'] == 3
+        
+        for name in ("out.md", "out.html"):
+            content = (tmp_path / name).read_text(encoding='utf-8-sig')
+            assert "Section 1" not in content and "Section 4" not in content
+            positions = [content.index(f"Section {n}") for n in (2, 3, 5)]
+            assert positions == sorted(positions)
+    
+    def test_docx_has_no_trailing_page_break(self, long_pdf, tmp_path):
+        """Test a selection ending before the last page gets breaks only between pages"""
+        result = PDFConverter().convert(long_pdf, str(tmp_path / "out.docx"), pages='1-2', workers=1)
+        
+        assert result.success
+        xml = Document(str(tmp_path / "out.docx")).element.xml
+        assert xml.count('w:type="page"') == 1
+    
+    def test_convert_many_extracts_selected_pages(self, long_pdf, tmp_path):
+        """Test the shared document IR holds only the selected pages"""
+        converter = PDFConverter()
+        ir = converter.extract_document(long_pdf, workers=1, pages='1-2')
+        assert [page.number for page in ir.pages] == [0, 1]
+        assert ir.page_count == 6
+        
+        results = UniversalConverter().convert_many(long_pdf, ['markdown', 'html'], str(tmp_path), pages='1-2')
+        assert all(result.success for result in results.values())
+        assert "Section 3" not in (tmp_path / "long.md").read_text(encoding='utf-8-sig')
+    
+    def test_invalid_selection_is_reported(self, long_pdf, tmp_path):
+        """Test a bad selection fails the conversion without writing output"""
+        result = PDFConverter().convert(long_pdf, str(tmp_path / "out.md"), pages='9-12')
+        
+        assert not result.success
+        assert "No pages selected" in result.error
+        assert not (tmp_path / "out.md").exists()
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
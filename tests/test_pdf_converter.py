@@ -0,0 +1,307 @@
+"""
+Tests for PDF conversion internals
+"""
+import pytest
+import fitz  # PyMuPDF
+
+import converters.pdf_converter as pdf_converter_module
+from converters.document_ir import DocumentIR
+from converters.pdf_converter import PDFConverter
+from converters.pdf_session import PDFDocumentSession
+from converters.universal import UniversalConverter
+
+
+def _make_pdf(path, num_pages=3, with_table=True):
+    """Create a small PDF with a heading, text and (optionally) a ruled table per page"""
+    doc = fitz.open()
+    for page_num in range(num_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {page_num + 1}", fontsize=20)
+        page.insert_text((72, 110), f"Body text on page {page_num + 1}.", fontsize=11)
+        if with_table:
+            x0, y0 = 72, 150
+            for r in range(4):
+                page.draw_line((x0, y0 + r * 20), (x0 + 240, y0 + r * 20))
+            for c in range(3):
+                page.draw_line((x0 + c * 120, y0), (x0 + c * 120, y0 + 60))
+            for r in range(3):
+                for c in range(2):
+                    page.insert_text((x0 + c * 120 + 5, y0 + r * 20 + 14), f"R{r}C{c}", fontsize=10)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _make_tight_pdf(path):
+    """Create a 16:9 slide whose words are placed 0.1 em apart (too tight for the text layer to get spaces)"""
+    doc = fitz.open()
+    page = doc.new_page(width=960, height=540)
+    font = fitz.Font("helv")
+    fontsize = 20
+    for row in range(12):
+        x = 40
+        for word in ["Boundary", "Conditions", "Of", "The", "Model"]:
+            page.insert_text((x, 40 + row * 38), word, fontsize=fontsize, fontname="helv")
+            x += font.text_length(word, fontsize=fontsize) + 0.1 * fontsize
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _make_logo_pdf(path, num_pages=3):
+    """Create a PDF that shows the same image (one xref) on every page"""
+    logo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 20), False)
+    logo.set_rect(logo.irect, (200, 30, 30))
+    doc = fitz.open()
+    xref = 0
+    for page_num in range(num_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_num + 1} text", fontsize=11)
+        xref = page.insert_image(fitz.Rect(72, 100, 152, 140), pixmap=logo, xref=xref)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    return _make_pdf(tmp_path / "sample.pdf")
+
+
+class TestPDFDocumentSession:
+    """Test PDFDocumentSession class"""
+    
+    def test_page_count(self, sample_pdf):
+        """Test page count and page access"""
+        with PDFDocumentSession(sample_pdf) as session:
+            assert session.page_count == 3
+            assert "Section 2" in session.page(1).get_text()
+    
+    def test_tables_are_cached(self, sample_pdf):
+        """Test that the table finder runs once per page"""
+        with PDFDocumentSession(sample_pdf) as session:
+            first = session.get_tables(0)
+            second = session.get_tables(0)
+            
+            assert first is second
+            assert len(first) == 1
+            assert first[0]['rows'][0] == ['R0C0', 'R0C1']
+    
+    def test_table_precheck(self, sample_pdf, tmp_path):
+        """Test that only pages with ruling lines are table candidates"""
+        prose_pdf = _make_pdf(tmp_path / "prose.pdf", with_table=False)
+        
+        boxed_pdf = str(tmp_path / "boxed.pdf")
+        doc = fitz.open()
+        page = doc.new_page()
+        for r in range(2):
+            for c in range(2):
+                page.draw_rect(fitz.Rect(72 + c * 100, 72 + r * 20, 172 + c * 100, 92 + r * 20))
+                page.insert_text((77 + c * 100, 86 + r * 20), f"B{r}{c}", fontsize=10)
+        page.draw_line((72, 300), (500, 300))  # a lone rule is no table
+        doc.new_page().draw_line((72, 300), (500, 300))
+        doc.save(boxed_pdf)
+        doc.close()
+        
+        with PDFDocumentSession(sample_pdf) as session:
+            assert session.may_contain_tables(0)
+        with PDFDocumentSession(prose_pdf) as session:
+            assert not session.may_contain_tables(0)
+        with PDFDocumentSession(boxed_pdf) as session:
+            assert session.may_contain_tables(0)
+            assert session.get_tables(0)[0]['rows'] == [['B00', 'B01'], ['B10', 'B11']]
+            assert not session.may_contain_tables(1)
+    
+    def test_close_releases_handles(self, sample_pdf):
+        """Test closing the session"""
+        session = PDFDocumentSession(sample_pdf)
+        session.get_tables(0)
+        session.close()
+        
+        assert session.doc is None
+        # Closing twice is harmless
+        session.close()
+
+
+class TestPDFConverter:
+    """Test PDF text-layer conversions"""
+    
+    def test_markdown_counts_tables_on_all_pages(self, sample_pdf, tmp_path):
+        """Test table count metadata covers every page"""
+        converter = PDFConverter()
+        result = converter.convert(sample_pdf, str(tmp_path / "out.md"))
+        
+        assert result.success
+        assert result.metadata['pages'] == 3
+        assert result.metadata['tables'] == 3
+        
+        content = (tmp_path / "out.md").read_text(encoding='utf-8-sig')
+        assert "| R0C0 | R0C1 |" in content
+    
+    
+    @pytest.mark.parametrize('ext', ['md', 'html', 'docx'])
+    def test_parallel_pages_match_serial(self, sample_pdf, tmp_path, ext):
+        """Test page-parallel mode produces the same output as serial mode"""
+        converter = PDFConverter()
+        serial = converter.convert(sample_pdf, str(tmp_path / f"serial.{ext}"), workers=1)
+        parallel = converter.convert(sample_pdf, str(tmp_path / f"parallel.{ext}"), workers=2)
+        
+        assert serial.success and parallel.success
+        assert serial.metadata == parallel.metadata
+        if ext != 'docx':
+            assert (tmp_path / f"serial.{ext}").read_bytes() == (tmp_path / f"parallel.{ext}").read_bytes()
+    
+    def test_chunk_pages(self):
+        """Test contiguous page chunking covers every page once"""
+        chunks = PDFConverter._chunk_pages(10, 2)
+        
+        assert [p for chunk in chunks for p in chunk] == list(range(10))
+        assert PDFConverter._resolve_workers(8, 3) == 3
+        assert PDFConverter._resolve_workers(1, 3) == 1
+
+
+class TestDocumentIR:
+    """Test extraction into the document IR and multi-format rendering"""
+    
+    def test_extract_document(self, sample_pdf):
+        """Test pages, styled spans and tables end up in the IR"""
+        document_ir = PDFConverter().extract_document(sample_pdf, workers=1)
+        
+        assert document_ir.page_count == 3
+        page = document_ir.pages[1]
+        spans = [span for block in page.blocks for line in block.lines for span in line.spans]
+        assert spans[0].text == "Section 2"
+        assert spans[0].size == 20
+        assert page.tables[0].rows[0] == ['R0C0', 'R0C1']
+        assert "Body text on page 2." in page.layout_text
+    
+    def test_json_round_trip(self, sample_pdf):
+        """Test the IR survives serialization"""
+        document_ir = PDFConverter().extract_document(sample_pdf, workers=1)
+        restored = DocumentIR.from_json(document_ir.to_json())
+        
+        assert restored == document_ir
+        assert restored.pages[0].blocks[0].lines[0].spans[0].text == "Section 1"
+        assert restored.pages[0].tables[0].bbox == document_ir.pages[0].tables[0].bbox
+    
+    def test_convert_many_extracts_once(self, sample_pdf, tmp_path, monkeypatch):
+        """Test every format is rendered from one extraction and matches single conversions"""
+        converter = PDFConverter()
+        for ext in ['md', 'html']:
+            converter.convert(sample_pdf, str(tmp_path / f"single.{ext}"))
+        
+        calls = []
+        original = pdf_converter_module.extract_page
+        monkeypatch.setattr(pdf_converter_module, 'extract_page',
+                            lambda session, page_num, **kwargs: calls.append(page_num) or original(session, page_num, **kwargs))
+        
+        results = converter.convert_many(sample_pdf, {
+            'markdown': str(tmp_path / "many.md"),
+            'html': str(tmp_path / "many.html"),
+            'docx': str(tmp_path / "many.docx"),
+        }, workers=1)
+        
+        assert all(result.success for result in results.values())
+        assert sorted(calls) == [0, 1, 2]
+        assert results['markdown'].metadata['tables'] == 3
+        for ext in ['md', 'html']:
+            assert (tmp_path / f"many.{ext}").read_bytes() == (tmp_path / f"single.{ext}").read_bytes()
+    
+    def test_images_are_read_lazily_once(self, tmp_path, monkeypatch):
+        """Test images are placed by xref and each xref is read once for DOCX"""
+        from docx import Document
+        
+        pdf = _make_logo_pdf(tmp_path / "logo.pdf")
+        document_ir = PDFConverter().extract_document(pdf, workers=1)
+        images = [block for page in document_ir.pages for block in page.blocks if block.type == 'image']
+        
+        assert len(images) == 3
+        assert len({image.xref for image in images}) == 1
+        assert document_ir.pages[0].blocks[0].type == 'text'
+        
+        reads = []
+        original = fitz.Document.extract_image
+        monkeypatch.setattr(fitz.Document, 'extract_image',
+                            lambda doc, xref: reads.append(xref) or original(doc, xref))
+        
+        result = PDFConverter().convert(pdf, str(tmp_path / "logo.docx"), workers=1)
+        docx = Document(str(tmp_path / "logo.docx"))
+        
+        assert result.success
+        assert reads == [images[0].xref]
+        assert len(docx.inline_shapes) == 3
+        assert len([rel for rel in docx.part.rels.values() if 'image' in rel.reltype]) == 1
+    
+    def test_table_pages_skipped(self, sample_pdf, tmp_path):
+        """Test pages without ruling lines skip the table finder and are counted"""
+        prose_pdf = _make_pdf(tmp_path / "prose.pdf", with_table=False)
+        converter = PDFConverter()
+        
+        document_ir = converter.extract_document(prose_pdf, workers=1)
+        assert all(page.tables_skipped and not page.tables for page in document_ir.pages)
+        
+        result = converter.convert(prose_pdf, str(tmp_path / "prose.md"), workers=1)
+        assert result.metadata['table_pages_skipped'] == 3
+        
+        result = converter.convert(sample_pdf, str(tmp_path / "sample.md"), workers=1)
+        assert result.metadata['table_pages_skipped'] == 0
+        assert result.metadata['tables'] == 3
+    
+    def test_universal_convert_many(self, sample_pdf, tmp_path):
+        """Test the multi-target API of UniversalConverter"""
+        results = UniversalConverter().convert_many(sample_pdf, ['markdown', 'html', 'docx'], output_dir=str(tmp_path))
+        
+        assert all(result.success for result in results.values())
+        assert (tmp_path / "sample.md").exists()
+        assert (tmp_path / "sample.html").exists()
+        assert (tmp_path / "sample.docx").exists()
+
+
+
+class TestGeometryExtraction:
+    """Test word spacing rebuilt from glyph positions"""
+    
+    def test_geometry_inserts_word_gaps(self, tmp_path):
+        """Test tightly set words are separated only in geometry mode"""
+        pdf = _make_tight_pdf(tmp_path / "tight.pdf")
+        converter = PDFConverter()
+        
+        text = converter.extract_document(pdf, workers=1).pages[0].blocks[0].lines[0].spans[0].text
+        geometry = converter.extract_document(pdf, workers=1, extraction='geometry').pages[0]
+        
+        assert text == "BoundaryConditionsOfTheModel"
+        assert geometry.blocks[0].lines[0].spans[0].text == "Boundary Conditions Of The Model"
+        assert geometry.layout_text.startswith("Boundary Conditions Of The Model\n")
+    
+    def test_geometry_keeps_normal_text(self, sample_pdf):
+        """Test text that already has its spaces comes out unchanged"""
+        converter = PDFConverter()
+        text = converter.extract_document(sample_pdf, workers=1)
+        geometry = converter.extract_document(sample_pdf, workers=1, extraction='geometry')
+        
+        assert [p.blocks for p in geometry.pages] == [p.blocks for p in text.pages]
+    
+    def test_detect_suggests_geometry(self, tmp_path):
+        """Test the OCR detector prefers geometry extraction when it fixes the spacing"""
+        pdf = _make_tight_pdf(tmp_path / "tight.pdf")
+        result = PDFConverter().detect_if_ocr_needed(pdf)
+        
+        assert result['mode'] == 'geometry'
+        assert result['recommended'] is False
+    
+    def test_convert_with_geometry(self, tmp_path):
+        """Test the extraction option reaches the renderers and is validated"""
+        pdf = _make_tight_pdf(tmp_path / "tight.pdf")
+        converter = PDFConverter()
+        
+        result = converter.convert(pdf, str(tmp_path / "tight.md"), extraction='geometry', workers=1)
+        assert result.success
+        assert "Boundary Conditions Of The Model" in (tmp_path / "tight.md").read_text(encoding='utf-8')
+        
+        result = converter.convert(pdf, str(tmp_path / "bad.md"), extraction='magic')
+        assert not result.success
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,353 @@
+"""
+Tests for the image pipeline (decoded image context, table detection)
+"""
+import cv2
+import numpy as np
+import pytest
+import pytesseract
+from PIL import Image
+
+from ai.image_context import ImageContext
+from ai.table_detector import TableDetector
+from converters.image_converter import ImageConverter
+
+
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+
+@pytest.fixture(autouse=True)
+def isolated_ocr_cache(tmp_path, monkeypatch):
+    """Keep OCR cache entries of each test in its own directory"""
+    monkeypatch.setattr('ai.ocr_cache.OCR_CACHE_DIR', tmp_path / "ocr_cache")
+    monkeypatch.setattr('ai.ocr_cache._cache', None)
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """Replace Tesseract with a stub that reports the image size"""
+    def image_to_data(img, lang='eng', config=''):
+        return "\n".join([
+            TSV_HEADER,
+            f"5\t1\t1\t1\t1\t1\t0\t0\t10\t10\t90\t{img.width}x{img.height}",
+        ])
+    
+    monkeypatch.setattr(pytesseract, 'image_to_data', image_to_data)
+    monkeypatch.setattr('ai.ocr_backends.OCR_BACKEND', 'pytesseract')
+
+
+@pytest.fixture
+def photo(tmp_path):
+    """Noisy RGB image without ruled lines"""
+    rng = np.random.default_rng(0)
+    pixels = (rng.random((120, 200, 3)) * 255).astype(np.uint8)
+    path = tmp_path / "photo.png"
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+@pytest.fixture
+def page(tmp_path):
+    """White page with a few text-sized blocks and no ruled lines"""
+    pixels = np.full((120, 200), 255, np.uint8)
+    for x in range(20, 180, 30):
+        pixels[50:62, x:x + 20] = 0
+    path = tmp_path / "page.png"
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+@pytest.fixture
+def grid(tmp_path):
+    """White page with a ruled 4x3 table"""
+    pixels = np.full((400, 600), 255, np.uint8)
+    for y in range(50, 351, 75):
+        cv2.line(pixels, (50, y), (550, y), 0, 2)
+    for x in range(50, 551, 125):
+        cv2.line(pixels, (x, 50), (x, 350), 0, 2)
+    path = tmp_path / "grid.png"
+    cv2.imwrite(str(path), pixels)
+    return path
+
+
+def legacy_enhance(gray):
+    """Reference: table enhancement before preprocessing profiles"""
+    thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
+    angle = cv2.minAreaRect(np.column_stack(np.where(thresh > 0)))[-1]
+    angle = -(90 + angle) if angle < -45 else -angle
+    if 0.5 < abs(angle) < 5:
+        (h, w) = gray.shape
+        M = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
+        gray = cv2.warpAffine(gray, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
+    denoised = cv2.fastNlMeansDenoising(cv2.equalizeHist(gray), h=10)
+    return cv2.filter2D(denoised, -1, np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]]))
+
+
+def rotated(path, angle):
+    """Grayscale pixels of an image rotated by angle degrees"""
+    gray = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+    (h, w) = gray.shape
+    M = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    return cv2.warpAffine(gray, M, (w, h), borderValue=255)
+
+
+class TestImageContext:
+    """Test ImageContext class"""
+    
+    @pytest.mark.parametrize('mode,suffix,orientation', [
+        ('RGB', '.png', 1),
+        ('RGBA', '.png', 1),
+        ('P', '.png', 1),
+        ('L', '.jpg', 1),
+        ('RGB', '.jpg', 6),
+    ])
+    def test_gray_matches_opencv(self, photo, tmp_path, mode, suffix, orientation):
+        """Test the shared grayscale buffer equals cv2.imread + cvtColor"""
+        path = tmp_path / f"image{suffix}"
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        Image.open(photo).convert(mode if suffix == '.png' else mode.replace('A', '')).save(path, exif=exif)
+        
+        expected = cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2GRAY)
+        assert np.array_equal(ImageContext.load(path).gray, expected)
+    
+    def test_gray_is_computed_once(self, photo):
+        """Test the grayscale conversion is shared and read-only"""
+        context = ImageContext.load(photo)
+        assert context.gray is context.gray
+        assert not context.gray.flags.writeable
+        assert ImageContext.of(context) is context
+    
+    def test_detector_accepts_context(self, grid):
+        """Test table detection gives the same regions for a path or a context"""
+        detector = TableDetector()
+        tables = detector.detect_tables(str(grid))
+        
+        assert len(tables) == 1
+        assert detector.detect_tables(ImageContext.load(grid)) == tables
+    
+    def test_conversion_decodes_once(self, page, tmp_path, fake_tesseract, monkeypatch):
+        """Test layout analysis, table detection and OCR share one decoded image"""
+        opened = []
+        original_open = Image.open
+        
+        def counting_open(fp, *args, **kwargs):
+            opened.append(fp)
+            return original_open(fp, *args, **kwargs)
+        
+        def no_imread(*args, **kwargs):
+            raise AssertionError("image decoded again")
+        
+        monkeypatch.setattr(Image, 'open', counting_open)
+        monkeypatch.setattr(cv2, 'imread', no_imread)
+        
+        output = tmp_path / "page.md"
+        result = ImageConverter().convert(str(page), str(output))
+        
+        assert result.success
+        assert opened == [str(page)]
+        assert "200x120" in output.read_text(encoding='utf-8')
+
+
+
+class TestTableEnhancement:
+    """Test in-memory table image enhancement"""
+    
+    def test_enhanced_image_stays_in_memory(self, grid, tmp_path, monkeypatch):
+        """Test enhancement returns pixels and writes no files"""
+        monkeypatch.chdir(tmp_path)
+        before = sorted(tmp_path.iterdir())
+        
+        enhanced = TableDetector().enhance_table_image(ImageContext.load(grid))
+        
+        assert enhanced.shape == (400, 600) and enhanced.dtype == np.uint8
+        assert sorted(tmp_path.iterdir()) == before
+    
+    def test_debug_copies_have_unique_names(self, grid, tmp_path, monkeypatch):
+        """Test debug dumps go to DEBUG_IMAGE_DIR without overwriting each other"""
+        monkeypatch.setattr('ai.table_detector.DEBUG_IMAGES', True)
+        monkeypatch.setattr('ai.table_detector.DEBUG_IMAGE_DIR', tmp_path / "debug")
+        detector = TableDetector()
+        
+        enhanced = detector.enhance_table_image(str(grid))
+        detector.enhance_table_image(str(grid))
+        
+        dumps = sorted((tmp_path / "debug").glob("grid_*_enhanced.png"))
+        assert len(dumps) == 2
+        assert np.array_equal(cv2.imread(str(dumps[0]), cv2.IMREAD_GRAYSCALE), enhanced)
+    
+    def test_ocr_reads_enhanced_pixels(self, grid, tmp_path, fake_tesseract, monkeypatch):
+        """Test a table image is enhanced and OCR'd without a disk round trip"""
+        monkeypatch.chdir(tmp_path)
+        recognized = []
+        original = pytesseract.image_to_data
+        
+        def recording_image_to_data(img, lang='eng', config=''):
+            recognized.append(np.asarray(img))
+            return original(img, lang=lang, config=config)
+        
+        monkeypatch.setattr(pytesseract, 'image_to_data', recording_image_to_data)
+        
+        output = tmp_path / "grid.md"
+        result = ImageConverter().convert(str(grid), str(output))
+        
+        assert result.success
+        assert not list(tmp_path.glob("*_enhanced.png"))
+        assert np.array_equal(recognized[0], TableDetector().enhance_table_image(str(grid)))
+
+
+class TestPreprocessingProfiles:
+    """Test fast and quality table preprocessing"""
+    
+    @pytest.mark.parametrize('angle', [0, 2, -3])
+    def test_quality_profile_is_unchanged(self, grid, angle):
+        """Test the quality profile reproduces the original enhancement exactly"""
+        gray = rotated(grid, angle)
+        enhanced = TableDetector(profile='quality').enhance_table_image(gray)
+        
+        assert np.array_equal(enhanced, legacy_enhance(gray))
+    
+    def test_fast_profile_finds_the_same_skew(self, grid, monkeypatch):
+        """Test the skew estimated on a downscaled copy matches full resolution"""
+        angles = []
+        original = cv2.getRotationMatrix2D
+        
+        def recording_rotation_matrix(center, angle, scale):
+            angles.append(angle)
+            return original(center, angle, scale)
+        
+        gray = cv2.resize(rotated(grid, 2), None, fx=4, fy=4)
+        monkeypatch.setattr(cv2, 'getRotationMatrix2D', recording_rotation_matrix)
+        detector = TableDetector()
+        detector._deskew_image(gray)
+        detector._deskew_image(gray, sample_size=600)
+        
+        assert len(angles) == 2
+        assert angles[1] == pytest.approx(angles[0], abs=0.05)
+        assert angles[0] == pytest.approx(-2, abs=0.05)
+    
+    def test_profile_selection(self, grid, monkeypatch):
+        """Test the fast profile skips non-local means and unknown names fall back"""
+        def no_nlmeans(*args, **kwargs):
+            raise AssertionError("non-local means used")
+        
+        monkeypatch.setattr(cv2, 'fastNlMeansDenoising', no_nlmeans)
+        
+        assert TableDetector(profile='fast').enhance_table_image(str(grid)).shape == (400, 600)
+        assert TableDetector(profile='fastest').profile == 'quality'
+        assert TableDetector(profile='fast').enhance_table_image(str(grid), profile='quality') is None
+
+
+class TestTableDetection:
+    """Test table detection on a downscaled pyramid level"""
+    
+    def test_regions_are_mapped_to_full_resolution(self, grid):
+        """Test regions found on the pyramid level match full-resolution detection"""
+        gray = cv2.resize(cv2.imread(str(grid), cv2.IMREAD_GRAYSCALE), None, fx=4, fy=4)
+        detector = TableDetector()
+        
+        full = detector.detect_tables(gray, max_side=0)
+        fast = detector.detect_tables(gray, max_side=1200)
+        
+        assert len(full) == len(fast) == 1
+        for key in ('x', 'y', 'width', 'height'):
+            assert fast[0][key] == pytest.approx(full[0][key], abs=8)
+        assert fast[0]['area'] == pytest.approx(full[0]['area'], rel=0.01)
+    
+    def test_text_without_rules_skips_line_detection(self, monkeypatch):
+        """Test images without long runs return before the morphology passes"""
+        text = np.full((900, 1200), 255, np.uint8)
+        for i in range(15):
+            cv2.putText(text, "Lorem ipsum dolor sit amet, consectetur", (40, 60 + i * 55),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1.2, 0, 2)
+        
+        def no_erode(*args, **kwargs):
+            raise AssertionError("line detection ran")
+        
+        monkeypatch.setattr(cv2, 'erode', no_erode)
+        assert TableDetector().detect_tables(text) == []
+    
+    def test_longest_run(self):
+        """Test run lengths are measured per row"""
+        rows = np.array([
+            [1, 1, 0, 1, 1, 1],
+            [0, 1, 1, 1, 1, 0],
+            [1, 0, 0, 0, 0, 1],
+        ], np.uint8)
+        
+        assert TableDetector._longest_run(rows) == 4
+        assert TableDetector._longest_run(rows[2:]) == 1
+        assert TableDetector._longest_run(np.zeros((2, 3), np.uint8)) == 0
+
+
+def legacy_boundaries(projection, min_gap=10):
+    """Reference: row/column finding before the vectorized boundary search"""
+    threshold = np.max(projection) * 0.5
+    boundaries = []
+    for i, value in enumerate(projection):
+        if value > threshold:
+            if not boundaries or i - boundaries[-1] > min_gap:
+                boundaries.append(i)
+    return boundaries
+
+
+@pytest.fixture
+def ledger():
+    """White page with a ruled 40x10 table of 80x30 cells starting at (50, 50)"""
+    pixels = np.full((1300, 900), 255, np.uint8)
+    for i in range(41):
+        cv2.line(pixels, (50, 50 + 30 * i), (850, 50 + 30 * i), 0, 2)
+    for j in range(11):
+        cv2.line(pixels, (50 + 80 * j, 50), (50 + 80 * j, 1250), 0, 2)
+    return pixels
+
+
+class TestTableCells:
+    """Test table structure extraction and one-pass cell OCR"""
+    
+    @pytest.mark.parametrize('seed', range(5))
+    def test_boundaries_match_reference(self, seed):
+        """Test the vectorized boundary search keeps the same lines as the old loop"""
+        rng = np.random.default_rng(seed)
+        projection = rng.integers(0, 100, 500) * (rng.random(500) < 0.2)
+        
+        assert TableDetector._find_boundaries(projection) == legacy_boundaries(projection)
+        assert TableDetector._find_boundaries(projection, min_gap=3) == legacy_boundaries(projection, 3)
+    
+    def test_cells_are_read_in_one_pass(self, ledger, monkeypatch):
+        """Test all 400 cells are filled from a single Tesseract call"""
+        detector = TableDetector()
+        region = detector.detect_tables(ledger)[0]
+        calls = []
+        
+        def image_to_data(img, lang='eng', config=''):
+            calls.append(config)
+            lines = [TSV_HEADER]
+            for i in range(40):
+                for j in range(10):
+                    left = 50 + 80 * j + 30 - region['x']
+                    top = 50 + 30 * i + 10 - region['y']
+                    lines.append(f"5\t1\t1\t1\t{i + 1}\t{j + 1}\t{left}\t{top}\t20\t10\t90\tr{i}c{j}")
+            # A ruled line read as text
+            lines.append(f"5\t1\t1\t1\t1\t11\t{80 - region['x']}\t0\t2\t30\t40\t|")
+            return "\n".join(lines)
+        
+        monkeypatch.setattr(pytesseract, 'image_to_data', image_to_data)
+        monkeypatch.setattr('ai.ocr_backends.OCR_BACKEND', 'pytesseract')
+        
+        table = detector.extract_table_cells(ledger, region)
+        
+        assert len(calls) == 1
+        assert table['grid'] == [[f"r{i}c{j}" for j in range(10)] for i in range(40)]
+        assert table['cells'][13]['text'] == "r1c3"
+    
+    def test_converter_uses_cell_grid(self, grid, tmp_path, fake_tesseract):
+        """Test the table_cells option renders the ruled table from its grid"""
+        output = tmp_path / "grid.md"
+        result = ImageConverter().convert(str(grid), str(output), table_cells=True)
+        
+        assert result.success
+        assert "| --- | --- | --- | --- |" in output.read_text(encoding='utf-8')
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,69 @@
+"""
+Tests for lexicon-based word segmentation
+"""
+import pytest
+
+from utils.word_segmenter import WordSegmenter, detect_language, get_segmenter, segment_words
+from converters.pdf_converter import PDFConverter
+
+
+class TestWordSegmenter:
+    """Test WordSegmenter class"""
+    
+    def test_splits_run_together_words(self):
+        """Test English concatenations are split"""
+        segmenter = get_segmenter('en')
+        
+        assert segmenter.split("boundaryconditions") == ['boundary', 'conditions']
+        assert segmenter.split("thefiniteelementmethod") == ['the', 'finite', 'element', 'method']
+        assert segmenter.split("ABSTRACTINTRODUCTION") == ['ABSTRACT', 'INTRODUCTION']
+        assert segmenter.split("Poissonequation") == ['Poisson', 'equation']
+    
+    def test_known_and_unknown_words_are_kept(self):
+        """Test lexicon words, names and derived words are left alone"""
+        segmenter = get_segmenter('en')
+        
+        for word in ['another', 'conditions', 'Galerkin', 'Laplacian', 'syntactically', 'subdomain', 'iPhone']:
+            assert segmenter.split(word) == [word]
+    
+    def test_turkish(self):
+        """Test Turkish lexicon and casing"""
+        segmenter = get_segmenter('tr')
+        
+        assert segmenter.split("sınırkoşulları") == ['sınır', 'koşulları']
+        assert segmenter.split("denklemininçözümü") == ['denkleminin', 'çözümü']
+        assert segmenter.split("kullanılmaktadır") == ['kullanılmaktadır']
+    
+    def test_custom_lexicon(self):
+        """Test frequency order decides between splits"""
+        segmenter = WordSegmenter('en', words=['a', 'cat', 'scat', 'sat', 'cats', 'at'])
+        
+        assert segmenter.split("catsat") == ['cat', 'sat']
+    
+    def test_segment_text(self):
+        """Test text segmentation keeps punctuation, URLs and identifiers"""
+        text = "Theheatequation, see https://example.com/heatsource or heat_source."
+        
+        assert segment_words(text) == "The heat equation, see https://example.com/heatsource or heat_source."
+        assert segment_words('') == ''
+    
+    def test_detect_language(self):
+        """Test lexicon selection"""
+        assert detect_language("Sonlu elemanlar yöntemi ile çözüm") == 'tr'
+        assert detect_language("Finite element method (Schrödinger equation)") == 'en'
+
+
+class TestConcatenatedTextFix:
+    """Test PDFConverter._fix_concatenated_text"""
+    
+    def test_does_not_break_words(self):
+        """Test ordinary words are no longer cut at common words"""
+        converter = PDFConverter()
+        
+        assert converter._fix_concatenated_text("another condition within") == "another condition within"
+        assert converter._fix_concatenated_text("usingthe methodof") == "using the method of"
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,81 @@
+"""
+Tests for word spacing repair
+"""
+import random
+import re
+from pathlib import Path
+
+import pytest
+import fitz  # PyMuPDF
+
+from utils.word_spacing import fix_word_spacing
+
+
+def legacy_fix_word_spacing(text: str) -> str:
+    """Reference: the original pass-per-pattern implementation"""
+    if not text:
+        return ''
+    
+    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+    text = re.sub(r'([.])([A-Z])', r'\1 \2', text)
+    text = re.sub(r'([,:;!?])([A-Za-z])', r'\1 \2', text)
+    text = re.sub(r'([\)\]])([A-Za-z])', r'\1 \2', text)
+    text = re.sub(r'([a-zA-Z])([\(\[])', r'\1 \2', text)
+    
+    word_boundaries = [(r'([a-z])(the)([A-Z])', r'\1 \2 \3')]
+    for word in ['and', 'for', 'with', 'from', 'that', 'this', 'such', 'given', 'find',
+                 'using', 'where', 'which', 'each', 'also', 'into', 'over', 'then', 'when']:
+        word_boundaries.append((rf'([a-z])({word})([a-z])', r'\1 \2 \3'))
+    for word in ['on', 'in', 'of', 'to', 'is', 'by', 'as']:
+        word_boundaries.append((rf'{word}([A-Z])', rf'{word} \1'))
+    
+    for pattern, replacement in word_boundaries:
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    
+    return re.sub(r' +', ' ', text)
+
+
+def _corpus_blocks():
+    """Text blocks of the PDFs shipped with the repository"""
+    blocks = []
+    for path in sorted(Path(__file__).resolve().parent.parent.glob('*.pdf')):
+        with fitz.open(str(path)) as doc:
+            for page in doc:
+                blocks.extend(block[4] for block in page.get_text("blocks"))
+    return blocks
+
+
+class TestWordSpacing:
+    """Test fix_word_spacing"""
+    
+    def test_examples(self):
+        """Test the kinds of repairs"""
+        assert fix_word_spacing("someText") == "some Text"
+        assert fix_word_spacing("end.Next") == "end. Next"
+        assert fix_word_spacing("a,b (x)y") == "a, b (x) y"
+        assert fix_word_spacing("textfromsource") == "text from source"
+        assert fix_word_spacing("  two   spaces ") == " two spaces "
+        assert fix_word_spacing("") == ''
+    
+    def test_matches_legacy_on_corpus(self):
+        """Test identical output on the text blocks of the bundled PDFs"""
+        blocks = _corpus_blocks()
+        assert blocks
+        for block in blocks:
+            assert fix_word_spacing(block) == legacy_fix_word_spacing(block)
+    
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_legacy_on_random_text(self, seed):
+        """Test identical output on random text rich in trigger characters"""
+        rng = random.Random(seed)
+        alphabet = list("abcdefghiklnorstwAEINOST.,:;!?()[]  -ıİſKçğş") + [
+            'the', 'and', 'ON', 'In', 'ofA', 'Is', 'by', 'as', 'with', 'WHEN', 'into', 'over', 'ıs', 'İn'
+        ]
+        for _ in range(400):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 60)))
+            assert fix_word_spacing(text) == legacy_fix_word_spacing(text), text
+
+
+# Run tests
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,188 @@
+"""
+Disk-backed LRU cache - content-addressed blobs with a size cap
+"""
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+from utils.logger import logger
+
+
+class DiskLRUCache:
+    """
+    Size-capped key/value store on disk
+    
+    Entries are files named after their key. Reading an entry touches its
+    modification time, so eviction (oldest mtime first) removes the least
+    recently used entries. Writes are atomic (temp file + rename), so several
+    processes can share one cache directory.
+    
+    Features:
+    - Size cap with LRU eviction
+    - Hit/miss/eviction counters (per process)
+    - Content-addressed keys via make_key()
+    """
+    
+    def __init__(self, directory: str, max_bytes: int, suffix: str = '.bin'):
+        """
+        Initialize cache
+        
+        Args:
+            directory: Cache directory (created on first write)
+            max_bytes: Maximum total size of cached entries
+            suffix: File extension of cache entries
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Build a key from content
+        
+        Args:
+            *parts: bytes or str values
+        
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode('utf-8')
+            digest.update(len(part).to_bytes(8, 'little'))
+            digest.update(part)
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """Entry path (two-level fan-out keeps directories small)"""
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read an entry
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached bytes, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        
+        try:
+            # Mark as recently used
+            os.utime(path, None)
+        except OSError:
+            pass
+        
+        self.hits += 1
+        return data
+    
+    def set(self, key: str, data: bytes):
+        """
+        Write an entry, evicting old entries if the cache is over its size cap
+        
+        Args:
+            key: Cache key
+            data: Value
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write cache entry {key}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(data)
+            
+            if self._size > self.max_bytes:
+                self._evict()
+    
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+    
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List entries as (mtime, size, path)"""
+        entries = []
+        if not self.directory.exists():
+            return entries
+        
+        for path in self.directory.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def _evict(self):
+        """Remove least recently used entries until the cache is below 90% of its cap"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+                self.evictions += 1
+            except OSError:
+                pass
+        
+        self._size = total
+        logger.debug(f"Cache {self.directory} evicted down to {total} bytes")
+    
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with hits, misses, evictions, entries and size_bytes
+        """
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'size_bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes
+        }
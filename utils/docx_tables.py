@@ -0,0 +1,84 @@
+"""
+DOCX table builder - writes whole python-docx tables in one pass
+"""
+import re
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import RGBColor
+
+# Characters that are not allowed in XML 1.0 (python-docx rejects them too)
+_INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f￾￿]')
+
+# Line breaks and tabs inside a cell, as python-docx writes them for cell.text
+_CELL_BREAKS = re.compile(r'(\r\n|[\r\n\t])')
+
+
+def _run_content_xml(text: str) -> str:
+    """<w:t>, <w:br/> and <w:tab/> elements of one cell text"""
+    parts = []
+    for piece in _CELL_BREAKS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r', '\r\n'):
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+def add_table(doc, rows: Sequence[Sequence[Optional[str]]], style: Optional[str] = 'Table Grid',
+              header_rows: int = 0, header_color: Optional[RGBColor] = None,
+              header_cells: Iterable[Tuple[int, int]] = ()):
+    """
+    Append a table filled with text to a document
+    
+    Filling cells through table.rows[i].cells[j].text rebuilds python-docx's
+    row and cell proxies on every access; here the row XML of the whole table
+    is built as one string and parsed once. The result is the same as
+    setting cell.text (line breaks and tabs included) on an add_table() table.
+    
+    Args:
+        doc: python-docx Document (or anything with add_table, e.g. a cell)
+        rows: Cell texts per row; None is an empty cell, short rows are padded
+        style: Table style name (None keeps the default)
+        header_rows: Number of leading rows written bold (and in header_color)
+        header_color: Text color of header cells
+        header_cells: Further (row, column) cells styled as header (e.g. <th>)
+    
+    Returns:
+        python-docx Table
+    """
+    num_cols = max((len(row) for row in rows), default=0)
+    table = doc.add_table(rows=0, cols=max(num_cols, 1))
+    if style:
+        table.style = style
+    
+    # Column widths in twips, as add_table() gives each cell
+    widths = [grid_col.get(qn('w:w')) for grid_col in table._tbl.tblGrid.gridCol_lst]
+    header: Set[Tuple[int, int]] = set(header_cells)
+    
+    header_props = '<w:b/>'
+    if header_color is not None:
+        header_props += f'<w:color w:val="{header_color}"/>'
+    
+    xml: List[str] = [f'<w:tbl {nsdecls("w")}>']
+    for i, row in enumerate(rows):
+        xml.append('<w:tr>')
+        for j in range(num_cols):
+            cell = row[j] if j < len(row) else None
+            text = _INVALID_XML_CHARS.sub('', str(cell).strip()) if cell is not None else ''
+            
+            xml.append(f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{widths[j]}"/></w:tcPr><w:p>')
+            if text:
+                props = f'<w:rPr>{header_props}</w:rPr>' if i < header_rows or (i, j) in header else ''
+                xml.append(f'<w:r>{props}{_run_content_xml(text)}</w:r>')
+            xml.append('</w:p></w:tc>')
+        xml.append('</w:tr>')
+    xml.append('</w:tbl>')
+    
+    table._tbl.extend(list(parse_xml(''.join(xml))))
+    return table
@@ -0,0 +1,185 @@
+"""
+Output image policy - downsamples and recompresses images embedded in DOCX output
+"""
+import base64
+import hashlib
+import io
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import unquote
+
+from PIL import Image
+
+from config import IMAGE_MAX_DPI, IMAGE_JPEG_QUALITY
+from utils.logger import logger
+
+# Images with more distinct colors than this (in a small thumbnail) are photos
+PHOTO_MIN_COLORS = 256
+
+# Pixel density assumed for images without a print size (HTML/Markdown sources)
+SCREEN_DPI = 96
+
+
+class ImagePolicy:
+    """
+    Shrinks images to the resolution they are displayed at
+    
+    An image shown 5 inches wide never needs more than 5 * max_dpi pixels
+    across; larger images are downsampled. Photos stored as PNG are
+    re-encoded as JPEG, drawings and images with transparency stay PNG.
+    Images that are already small enough keep their original bytes unless
+    recompression makes them smaller, so nothing is degraded for no gain.
+    
+    Features:
+    - Per-request settings (see from_options)
+    - Each distinct image is processed once (logos repeated on every page)
+    - Byte counters for the result metadata (bytes_saved)
+    """
+    
+    def __init__(self, max_dpi: int = IMAGE_MAX_DPI, jpeg_quality: int = IMAGE_JPEG_QUALITY,
+                 photo_to_jpeg: bool = True, enabled: bool = True):
+        """
+        Initialize policy
+        
+        Args:
+            max_dpi: Maximum effective resolution at the display size (0 = no downsampling)
+            jpeg_quality: Quality of re-encoded JPEGs (1-95)
+            photo_to_jpeg: Re-encode photos stored as PNG as JPEG
+            enabled: False passes every image through unchanged
+        """
+        self.max_dpi = max_dpi
+        self.jpeg_quality = jpeg_quality
+        self.photo_to_jpeg = photo_to_jpeg
+        self.enabled = enabled
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._processed: Dict[Tuple[bytes, float], bytes] = {}
+    
+    @classmethod
+    def from_options(cls, options: Dict[str, Any]) -> 'ImagePolicy':
+        """
+        Build the policy of a conversion request
+        
+        Args:
+            options: Conversion options; reads 'optimize_images' (bool),
+                     'image_max_dpi', 'image_quality' and 'image_photo_to_jpeg'
+        
+        Returns:
+            ImagePolicy
+        """
+        return cls(
+            max_dpi=options.get('image_max_dpi', IMAGE_MAX_DPI),
+            jpeg_quality=options.get('image_quality', IMAGE_JPEG_QUALITY),
+            photo_to_jpeg=options.get('image_photo_to_jpeg', True),
+            enabled=options.get('optimize_images', True)
+        )
+    
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes saved over the original images so far"""
+        return self.bytes_in - self.bytes_out
+    
+    def apply(self, data: bytes, width_inches: float) -> bytes:
+        """
+        Prepare an image for embedding
+        
+        Args:
+            data: Image file bytes (PNG, JPEG, ...)
+            width_inches: Width the image is displayed at
+        
+        Returns:
+            Image file bytes to embed
+        """
+        if not self.enabled:
+            return data
+        
+        key = (hashlib.sha1(data).digest(), width_inches)
+        if key not in self._processed:
+            try:
+                result = self._shrink(data, width_inches)
+            except Exception as e:
+                logger.debug(f"Image kept unchanged: {e}")
+                result = data
+            self._processed[key] = result
+            self.bytes_in += len(data)
+            self.bytes_out += len(result)
+        return self._processed[key]
+    
+    def _shrink(self, data: bytes, width_inches: float) -> bytes:
+        """Downsample and re-encode one image; returns the original if that is not smaller"""
+        image = Image.open(io.BytesIO(data))
+        source_format = image.format
+        
+        max_width = int(width_inches * self.max_dpi) if self.max_dpi else 0
+        resized = bool(max_width) and image.width > max_width
+        if resized:
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.convert('RGBA' if self._has_alpha(image) else 'RGB')
+            image = image.resize((max_width, height), Image.LANCZOS)
+        
+        if source_format == 'JPEG' and not resized:
+            # Re-encoding an untouched JPEG only loses quality
+            return data
+        
+        output = io.BytesIO()
+        if source_format == 'JPEG' or (self.photo_to_jpeg and not self._has_alpha(image) and self._is_photo(image)):
+            if image.mode not in ('RGB', 'L', 'CMYK'):
+                image = image.convert('RGB')
+            image.save(output, 'JPEG', quality=self.jpeg_quality, optimize=True)
+        else:
+            image.save(output, 'PNG', optimize=True)
+        
+        result = output.getvalue()
+        return result if resized or len(result) < len(data) else data
+    
+    @staticmethod
+    def _has_alpha(image: Image.Image) -> bool:
+        return image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+    
+    @staticmethod
+    def _is_photo(image: Image.Image) -> bool:
+        """Many distinct colors (photo) rather than a few flat ones (chart, diagram, text)"""
+        thumbnail = image.copy()
+        thumbnail.thumbnail((128, 128))
+        return thumbnail.convert('RGB').getcolors(maxcolors=PHOTO_MIN_COLORS) is None
+
+
+def read_image_source(src: str, base_dir: Path) -> Optional[bytes]:
+    """
+    Read the image referenced by an HTML/Markdown image source
+    
+    Args:
+        src: data: URI or file path (relative to base_dir); remote URLs are not fetched
+        base_dir: Directory of the source document
+    
+    Returns:
+        Image file bytes, or None if the image is not available
+    """
+    src = src.strip()
+    try:
+        if src.startswith('data:'):
+            header, _, payload = src.partition(',')
+            if header.endswith(';base64'):
+                return base64.b64decode(payload)
+            return unquote(payload).encode('latin-1')
+        
+        if '://' in src:
+            logger.debug(f"Remote image not embedded: {src}")
+            return None
+        
+        path = Path(unquote(src.split('?')[0]))
+        if not path.is_absolute():
+            path = Path(base_dir) / path
+        return path.read_bytes()
+    except Exception as e:
+        logger.warning(f"Image not embedded ({src[:60]}): {e}")
+        return None
+
+
+def display_width_inches(data: bytes, max_inches: float = 5.0) -> float:
+    """Width to show an image at: its size at SCREEN_DPI, at most max_inches"""
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return min(max_inches, image.width / SCREEN_DPI)
+    except Exception:
+        return max_inches
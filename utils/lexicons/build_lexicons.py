@@ -0,0 +1,54 @@
+"""
+Build the word segmentation lexicons from wordfreq data
+
+The lexicons are plain word lists, most frequent word first, one word per
+line (gzip compressed). Only the rank is used, so frequencies are not stored.
+wordfreq is needed to rebuild them, not to use them.
+
+Usage:
+    pip install wordfreq
+    python utils/lexicons/build_lexicons.py [--size 60000]
+"""
+import argparse
+import gzip
+from pathlib import Path
+
+from wordfreq import top_n_list
+
+LANGUAGES = {
+    # code: (alphabet, single-letter words)
+    'en': (set('abcdefghijklmnopqrstuvwxyz'), {'a', 'i'}),
+    'tr': (set('abcçdefgğhıijklmnoöprsştuüvyzâîûqwx'), {'o'}),
+}
+
+# Two-letter entries past this rank are mostly abbreviations
+MAX_TWO_LETTER_RANK = 2000
+
+
+def build_lexicon(lang: str, size: int):
+    alphabet, single_letters = LANGUAGES[lang]
+    words = []
+    for rank, word in enumerate(top_n_list(lang, size * 2)):
+        if not word.isalpha() or not set(word) <= alphabet:
+            continue
+        if len(word) == 1 and word not in single_letters:
+            continue
+        if len(word) == 2 and rank > MAX_TWO_LETTER_RANK:
+            continue
+        words.append(word)
+        if len(words) == size:
+            break
+    
+    path = Path(__file__).parent / f"{lang}.txt.gz"
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write('\n'.join(words) + '\n')
+    print(f"{lang}: {len(words)} words -> {path} ({path.stat().st_size // 1024} KB)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build word segmentation lexicons')
+    parser.add_argument('--size', type=int, default=60000)
+    args = parser.parse_args()
+    
+    for lang in LANGUAGES:
+        build_lexicon(lang, args.size)
@@ -0,0 +1,130 @@
+"""
+OCR text normalization - linear-time cleanup passes shared by the OCR outputs
+"""
+import re
+from typing import List, Optional, Pattern, Tuple
+
+# Runs of blank lines
+_NEWLINES_3 = re.compile(r'\n{3,}')
+_NEWLINES_4 = re.compile(r'\n{4,}')
+
+# Runs of spaces/tabs; single spaces are left alone (they are most of the
+# text, replacing each by itself is what made the old pass slow)
+_SPACE_RUNS = re.compile(r' {2,}')
+_BLANK_RUNS = re.compile(r'[ \t]{2,}|\t')
+
+# Header/footer noise removed before LLM post-processing, applied in this
+# order. Each pattern has a lower-case literal that every match contains;
+# a pattern whose literal is not in the text cannot match and is skipped.
+_NOISE_PATTERNS: List[Tuple[Optional[str], Pattern]] = [
+    ('november', re.compile(r'November\s+\d+,\s+\d+.*?(?=\n|$)', re.MULTILINE | re.IGNORECASE)),  # Date headers
+    ('seite', re.compile(r'Seite\s+\d+', re.MULTILINE | re.IGNORECASE)),  # German page numbers
+    (None, re.compile(r'H\s*L\s*R\s*\|?\s*[sS]', re.MULTILINE | re.IGNORECASE)),  # HLR markers
+    ('sss', re.compile(r'SSS+', re.MULTILINE | re.IGNORECASE)),  # SSS markers
+    ('24', re.compile(r'^\s*24\s*$', re.MULTILINE | re.IGNORECASE)),  # Standalone "24"
+    ('/', re.compile(r'\d{1,2}/\d{1,2}/\d{4}', re.MULTILINE | re.IGNORECASE)),  # Date patterns
+    ('solving the 2d poisson equation using the fem and a cg method',
+     re.compile(r'Solving the 2d Poisson Equation using the FEM and a CG Method',
+                re.MULTILINE | re.IGNORECASE)),  # Repeated title
+]
+
+# Characters IGNORECASE matches to an ASCII letter that lower() does not turn into it
+_CASE_FOLD = str.maketrans({'ı': 'i', 'İ': 'i', 'ſ': 's', 'K': 'k'})
+
+_PAGE_MARKER = re.compile(r'===\s*Page\s*\d+\s*===')
+
+# Lines made only of table rules and similar OCR artifacts
+_RULE_LINE = re.compile(r'[\|\-=~\s]+')
+
+
+def join_ocr_paragraphs(text: str) -> str:
+    """
+    Join the lines of each OCR paragraph (blank lines separate paragraphs)
+    
+    Args:
+        text: OCR text of a page
+    
+    Returns:
+        Paragraphs separated by blank lines, '|' read as 'I'
+    """
+    if not text:
+        return ''
+    
+    # Remove multiple blank lines, fix a common OCR confusion
+    text = _NEWLINES_3.sub('\n\n', text).replace('|', 'I')
+    
+    entries = []
+    paragraph = []
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if stripped:
+            paragraph.append(stripped)
+        else:
+            # Empty line indicates paragraph break
+            if paragraph:
+                entries.append(' '.join(paragraph))
+                paragraph = []
+            entries.append('')
+    if paragraph:
+        entries.append(' '.join(paragraph))
+    
+    # Paragraph breaks are kept as extra blank entries, unless the text
+    # started with a blank line (as the original cleanup did)
+    if entries and not entries[0]:
+        entries = [entry for entry in entries if entry]
+    return '\n\n'.join(entries)
+
+
+def strip_ocr_noise(text: str) -> str:
+    """
+    Remove page markers, headers/footers and artifact lines before LLM processing
+    
+    Args:
+        text: OCR text
+    
+    Returns:
+        Cleaned text with collapsed whitespace
+    """
+    # Remove page markers
+    if '===' in text:
+        text = _PAGE_MARKER.sub('', text)
+    
+    # Remove common header/footer patterns
+    lowered = text.translate(_CASE_FOLD).lower()
+    for literal, pattern in _NOISE_PATTERNS:
+        if literal is not None and literal not in lowered:
+            continue
+        cleaned = pattern.sub('', text)
+        if cleaned != text:
+            text = cleaned
+            lowered = text.translate(_CASE_FOLD).lower()
+    
+    # Remove excessive whitespace
+    if '\n\n\n\n' in text:
+        text = _NEWLINES_4.sub('\n\n\n', text)
+    text = _BLANK_RUNS.sub(' ', text)
+    
+    # Remove lines that are mostly noise (short lines with random chars)
+    kept = []
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            kept.append(line)
+        elif len(stripped) > 3 and not _RULE_LINE.fullmatch(stripped):
+            kept.append(line)
+    return '\n'.join(kept)
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Collapse space runs and blank lines and trim every line
+    
+    Args:
+        text: Text
+    
+    Returns:
+        Normalized text
+    """
+    text = _SPACE_RUNS.sub(' ', text)
+    text = _NEWLINES_3.sub('\n\n', text)
+    return '\n'.join(line.strip() for line in text.split('\n'))
@@ -0,0 +1,85 @@
+"""
+Output sinks - write conversion output page by page and publish it atomically
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from utils.logger import logger
+
+
+class TextSink:
+    """
+    Incremental text output file
+    
+    Text is written to a temporary file next to the target as it is
+    produced (and flushed to the OS after every page), so memory does not
+    grow with the document and progress is visible on disk. commit() moves
+    the finished file into place with one rename; a failed conversion never
+    leaves a truncated output behind.
+    
+    Use as a context manager: leaving the block normally commits, an
+    exception aborts (removes the temporary file).
+    """
+    
+    def __init__(self, path: str, encoding: str = 'utf-8', separator: Optional[str] = None):
+        """
+        Open sink
+        
+        Args:
+            path: Final output path
+            encoding: Text encoding ('utf-8-sig' writes a BOM)
+            separator: If set, write_parts() output equals separator.join() of all parts
+        """
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        self.separator = separator
+        self.chars_written = 0
+        self._has_parts = False
+        self._file = open(self.tmp_path, 'w', encoding=encoding)
+    
+    def __enter__(self) -> 'TextSink':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+    
+    def write(self, text: str):
+        """Append text"""
+        if text:
+            self._file.write(text)
+            self.chars_written += len(text)
+    
+    def write_parts(self, parts: Iterable[str]):
+        """Append parts, separated by the sink's separator (also from earlier parts)"""
+        for part in parts:
+            if self._has_parts:
+                self.write(self.separator)
+            self.write(part)
+            self._has_parts = True
+    
+    def flush(self):
+        """Hand buffered text to the OS (call after each page)"""
+        self._file.flush()
+    
+    def commit(self):
+        """Finish the file and move it to the output path"""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+    
+    def abort(self):
+        """Discard the partial output"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            self.tmp_path.unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove partial output {self.tmp_path}: {e}")
@@ -0,0 +1,78 @@
+"""
+Page ranges - parse page selections such as "1-5,10" for partial conversion
+"""
+import re
+from itertools import groupby
+from typing import Iterable, List, Union
+
+# One item of a selection: "7", "3-5", "8-" (to the end) or "-4" (from the start)
+_RANGE_ITEM = re.compile(r'^(\d*)\s*-\s*(\d*)$|^(\d+)$')
+
+PageSpec = Union[None, int, str, Iterable[int]]
+
+
+def parse_page_ranges(spec: PageSpec, page_count: int) -> List[int]:
+    """
+    Turn a 1-based page selection into sorted 0-based page indices
+    
+    Ranges reaching past the end of the document are cut at the last page,
+    so "1-5" also works as a preview of a 3-page document.
+    
+    Args:
+        spec: "1-5,10" style string, a single page number, 1-based page
+              numbers, or None for all pages
+        page_count: Number of pages in the document
+    
+    Returns:
+        Ascending unique 0-based page indices
+    
+    Raises:
+        ValueError: If the selection is malformed or contains no page of the document
+    """
+    if spec is None:
+        return list(range(page_count))
+    
+    if isinstance(spec, int):
+        items = [str(spec)]
+    elif isinstance(spec, str):
+        items = [item.strip() for item in spec.split(',') if item.strip()]
+    else:
+        items = [str(page) for page in spec]
+    
+    pages = set()
+    for item in items:
+        match = _RANGE_ITEM.match(item)
+        if not match:
+            raise ValueError(f"Invalid page range: {item!r}")
+        
+        if match.group(3):
+            start = end = int(match.group(3))
+        else:
+            start = int(match.group(1)) if match.group(1) else 1
+            end = int(match.group(2)) if match.group(2) else page_count
+        
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page range: {item!r}")
+        pages.update(range(start - 1, min(end, page_count)))
+    
+    if not pages:
+        raise ValueError(f"No pages selected (document has {page_count} pages)")
+    return sorted(pages)
+
+
+def format_page_ranges(page_numbers: Iterable[int]) -> str:
+    """
+    Format 0-based page indices as a 1-based selection string
+    
+    Args:
+        page_numbers: 0-based page indices
+    
+    Returns:
+        Selection such as "1-5,10" (parse_page_ranges() reads it back)
+    """
+    ranges = []
+    # Consecutive pages share the same page - position difference
+    for _, group in groupby(enumerate(sorted(set(page_numbers))), key=lambda item: item[1] - item[0]):
+        pages = [page for _, page in group]
+        ranges.append(f"{pages[0] + 1}" if len(pages) == 1 else f"{pages[0] + 1}-{pages[-1] + 1}")
+    return ','.join(ranges)
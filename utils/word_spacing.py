@@ -0,0 +1,59 @@
+"""
+Word spacing repair - inserts missing spaces in text extracted from PDFs
+"""
+import re
+from typing import List, Tuple
+
+# Pairs of characters that get a space between them: lower/upper case
+# (camelCase), '.' before a capital, punctuation or a closing bracket before
+# a letter, and a letter before an opening bracket. The pairs never chain, so
+# all of them are fixed in one scan.
+_PAIR_BOUNDARY = re.compile(r'[a-z](?=[A-Z(\[])|[A-Z](?=[(\[])|\.(?=[A-Z])|[,:;!?)\]](?=[A-Za-z])')
+
+# Common words that get glued to their neighbours, in the order they are split.
+# Each pass sees the spaces inserted by the previous ones, so the order matters.
+_JOINED_WORDS = [
+    'the', 'and', 'for', 'with', 'from', 'that', 'this', 'such', 'given', 'find',
+    'using', 'where', 'which', 'each', 'also', 'into', 'over', 'then', 'when',
+]
+
+# Short words glued to a following word ("onA" -> "on A")
+_JOINED_PREFIXES = ['on', 'in', 'of', 'to', 'is', 'by', 'as']
+
+# Word passes as (lowercase word, pattern, replacement); matching is case-insensitive
+_WORD_PASSES: List[Tuple[str, re.Pattern, str]] = (
+    [(word, re.compile(rf'([a-z])({word})([a-z])', re.IGNORECASE), r'\1 \2 \3') for word in _JOINED_WORDS] +
+    [(word, re.compile(rf'{word}([a-z])', re.IGNORECASE), rf'{word} \1') for word in _JOINED_PREFIXES]
+)
+
+# Non-ASCII letters that case-insensitively match an ASCII letter in a regex
+_CASE_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'})
+
+_MULTIPLE_SPACES = re.compile(r' {2,}')
+
+
+def fix_word_spacing(text: str) -> str:
+    """
+    Fix missing spaces between words (common in PDF extraction from presentations)
+    
+    Character-pair boundaries are fixed in one scan. Word passes only run for
+    words that occur in the text; inserting spaces never creates a new
+    occurrence, so one look at the folded text decides which passes can match.
+    
+    Args:
+        text: Extracted text
+    
+    Returns:
+        Text with spaces inserted
+    """
+    if not text:
+        return ''
+    
+    text = _PAIR_BOUNDARY.sub(r'\g<0> ', text)
+    
+    folded = text.translate(_CASE_FOLD).lower()
+    for word, pattern, replacement in _WORD_PASSES:
+        if word in folded:
+            text = pattern.sub(replacement, text)
+    
+    return _MULTIPLE_SPACES.sub(' ', text)